@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+TECO SSP 加班時數批次計算 (無 UI)
+
+讀取帳號清單檔案,平行登入各帳號抓取出勤資料並計算加班時數,
+最後輸出合併報表 (預設 Excel,可用 --format 選擇其他格式)。
+
+用法:
+    python batch_report.py accounts.csv
+    python batch_report.py accounts.json --workers 8 --per-account -o reports/dept.xlsx
+    python batch_report.py accounts.csv --metrics reports/metrics.json
+    python batch_report.py accounts.csv --format parquet -o reports/dept.parquet
+    python batch_report.py accounts.csv --sheets -o reports/team.xlsx
+
+帳號清單格式:
+    CSV:  標題列 username,password
+    JSON: [{"username": "...", "password": "..."}]
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from src.config import Settings
+from src.models import BatchAccountResult
+from src.services import BatchReportService
+from src.services.export_service import EXPORT_FORMATS
+from src.utils import get_transport, setup_logging
+from src.utils.metrics import registry as metrics_registry
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """解析命令列參數"""
+    parser = argparse.ArgumentParser(description="批次計算多個帳號的加班時數")
+    parser.add_argument("accounts", help="帳號清單檔案 (CSV 或 JSON)")
+    parser.add_argument(
+        "-w", "--workers", type=int, help="同時處理的帳號數 (預設依設定)"
+    )
+    parser.add_argument("-o", "--output", help="合併報表的輸出路徑")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="xlsx",
+        help="合併報表格式 (預設 xlsx)",
+    )
+    parser.add_argument(
+        "--sheets",
+        action="store_true",
+        help="合併報表改為每個帳號一個工作表加上摘要工作表 (僅 xlsx)",
+    )
+    parser.add_argument(
+        "--per-account",
+        action="store_true",
+        help="另外為每個帳號匯出個別報表 (格式同 --format)",
+    )
+    parser.add_argument("--max-pages", type=int, help="每個帳號最多抓取的頁數")
+    parser.add_argument("--metrics", help="將每次 HTTP 請求的計時資料輸出為 JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="顯示詳細日誌")
+    args = parser.parse_args(argv)
+    if args.sheets and args.format != "xlsx":
+        parser.error("--sheets 只能搭配 xlsx 格式")
+    return args
+
+
+def print_progress(done: int, total: int, result: BatchAccountResult):
+    """印出單一帳號的處理進度"""
+    if result.success:
+        report = result.report
+        detail = (
+            f"{report.total_days} 筆, 加班 {report.total_overtime_hours:.1f} 小時"
+        )
+    else:
+        detail = result.error
+    mark = "✓" if result.success else "✗"
+    print(f"[{done}/{total}] {mark} {result.username}: {detail} ({result.elapsed:.1f}s)")
+
+
+def print_summary(results: list, elapsed: float):
+    """印出批次處理摘要"""
+    succeeded = [r for r in results if r.success]
+    failed = [r for r in results if not r.success]
+    total_hours = sum(r.report.total_overtime_hours for r in succeeded)
+
+    print("\n" + "=" * 60)
+    print(f"完成 {len(results)} 個帳號: 成功 {len(succeeded)}, 失敗 {len(failed)}")
+    print(f"總加班時數: {total_hours:.1f} 小時, 耗時 {elapsed:.1f} 秒")
+    for result in failed:
+        print(f"  ✗ {result.username}: {result.error}")
+    print("=" * 60)
+
+
+def main(argv=None) -> int:
+    """主程式入口"""
+    args = parse_args(argv)
+
+    setup_logging()
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    settings = Settings()
+    if args.max_pages:
+        settings.MAX_PAGES = args.max_pages
+
+    service = BatchReportService(settings)
+
+    try:
+        accounts = service.load_accounts(args.accounts)
+    except (OSError, ValueError) as e:
+        print(f"✗ 無法讀取帳號清單: {e}", file=sys.stderr)
+        return 2
+
+    if not accounts:
+        print("ℹ 帳號清單是空的")
+        return 0
+
+    started = time.perf_counter()
+    results = service.run(
+        accounts,
+        workers=args.workers,
+        export_each=args.per_account,
+        on_progress=print_progress,
+        export_format=args.format,
+    )
+    print_summary(results, time.perf_counter() - started)
+    if service.resilience:
+        retries = sum(s["retries"] for s in service.resilience.stats().values())
+        if retries:
+            print(f"重試 {retries} 次 (斷路器: {service.resilience.breaker.state})")
+    pool = get_transport(settings).stats()
+    print(
+        f"連線重用率 {pool['reuse_rate']:.0%}, 尖峰平行請求 "
+        f"{pool['peak_in_flight']}/{pool['pool_maxsize']}"
+    )
+
+    if args.sheets:
+        output = service.export_service.export_team_workbook(
+            {r.username: r.report for r in results if r.report}, args.output
+        )
+    else:
+        output = service.export_service.export_batch(
+            results, args.format, args.output
+        )
+    if output:
+        print(f"合併報表: {output}")
+
+    if args.metrics:
+        print(f"請求計時: {metrics_registry.dump_json(args.metrics)}")
+
+    return 0 if all(r.success for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""效能測試 (離線 SSP 模擬伺服器與端對端計時)"""
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Excel 匯出效能測試
+
+比較 write-only 串流匯出 (ExportService.export_to_excel) 與舊版
+pandas DataFrame → ExcelWriter 匯出的尖峰記憶體與耗時。
+
+用法:
+    python -m benchmarks.export_benchmark
+    python -m benchmarks.export_benchmark --rows 10000 100000 -o benchmarks/results/export.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from src.models import AttendanceRecord, OvertimeReport
+from src.services import ExportService
+
+DEFAULT_ROWS = (1000, 100000)
+
+
+def make_report(rows: int) -> OvertimeReport:
+    """產生指定筆數的報表 (日期由新到舊)"""
+    start = date(2025, 12, 31)
+    return OvertimeReport(
+        records=[
+            AttendanceRecord(
+                date=(start - timedelta(days=i % 3650)).strftime("%Y/%m/%d"),
+                start_time="08:30:00",
+                end_time=f"{18 + i % 4:02d}:{i % 60:02d}:00",
+                overtime_hours=round((i % 17) / 4, 2),
+                total_minutes=570 + i % 240,
+            )
+            for i in range(rows)
+        ]
+    )
+
+
+def export_with_pandas(report: OvertimeReport, filename: str) -> str:
+    """舊版匯出: 建立 DataFrame、合併統計區塊後以 ExcelWriter 寫出 (比較基準)"""
+    import pandas as pd
+
+    df = pd.DataFrame(
+        [
+            {
+                "日期": r.date,
+                "上班時間": r.start_time,
+                "下班時間": r.end_time,
+                "總工時(分)": r.total_minutes,
+                "加班時數": r.overtime_hours,
+            }
+            for r in report.records
+        ]
+    )
+    summary = report.get_summary()
+    summary_df = pd.DataFrame(
+        {
+            "日期": [
+                "",
+                "統計資訊",
+                "記錄天數",
+                "加班天數",
+                "總加班時數",
+                "平均每日加班",
+                "最長加班",
+                "最長加班日期",
+            ],
+            "上班時間": [
+                "",
+                "",
+                summary["記錄天數"],
+                summary["加班天數"],
+                f"{summary['總加班時數']} hr",
+                f"{summary['平均每日加班']} hr",
+                f"{summary['最長加班']} hr",
+                summary["最長加班日期"],
+            ],
+        }
+    )
+    with pd.ExcelWriter(filename, engine="openpyxl") as writer:
+        pd.concat([df, summary_df], ignore_index=True).to_excel(
+            writer, sheet_name="加班記錄", index=False
+        )
+    return filename
+
+
+def measure(func: Callable[[], object]) -> Dict[str, float]:
+    """
+    量測 func 的耗時與 Python 配置的尖峰記憶體
+
+    tracemalloc 會大幅拖慢執行,因此耗時與記憶體分兩次執行量測。
+    """
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(elapsed, 3), "peak_mb": round(peak / 1024 / 1024, 2)}
+
+
+def run(rows_list=DEFAULT_ROWS, include_pandas: bool = True) -> List[Dict]:
+    """
+    執行各筆數的匯出比較
+
+    Returns:
+        List[Dict]: 每個筆數的 streaming / pandas 結果
+    """
+    service = ExportService()
+    results = []
+    for rows in rows_list:
+        report = make_report(rows)
+        result = {"rows": rows}
+
+        streaming = f"reports/benchmark_export_{rows}.xlsx"
+        result["streaming"] = measure(lambda: service.export_to_excel(report, streaming))
+        Path(streaming).unlink(missing_ok=True)
+
+        if include_pandas:
+            legacy = f"reports/benchmark_export_{rows}_pandas.xlsx"
+            result["pandas"] = measure(lambda: export_with_pandas(report, legacy))
+            Path(legacy).unlink(missing_ok=True)
+
+        results.append(result)
+        print(
+            f"{rows:>7} 列: "
+            + ", ".join(
+                f"{name} {m['seconds']:.2f}s / {m['peak_mb']:.1f}MB"
+                for name, m in result.items()
+                if name != "rows"
+            )
+        )
+    return results
+
+
+def main(argv=None) -> int:
+    """主程式入口"""
+    parser = argparse.ArgumentParser(description="Excel 匯出效能測試")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--no-pandas", action="store_true", help="不執行 pandas 比較")
+    parser.add_argument("-o", "--output", help="JSON 報告路徑")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    results = run(args.rows, include_pandas=not args.no_pandas)
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"報告: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+端對端效能測試
+
+對離線 SSP 模擬伺服器依序執行 登入 → 抓取 → 計算 → 查詢狀態 → 匯出,
+以不同的記錄數計時,輸出可互相比較的 JSON 報告。
+
+用法:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 10 1000 --repeat 5 --latency 0.02
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.ssp_pages import make_attendance_records, make_history_rows
+from benchmarks.ssp_stub import SspStubServer
+from src.config import Settings
+from src.core import VERSION, OvertimeCalculator
+from src.services import AuthService, DataService, ExportService, OvertimeStatusService
+from src.utils.metrics import MetricsRegistry
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+STAGES = ("login", "fetch", "calculate", "status", "export")
+RESULTS_DIR = Path("benchmarks/results")
+
+
+def page_size_for(size: int, max_pages: int) -> int:
+    """每頁筆數 (SSP 每頁 10 筆;記錄較多時放大,使頁數不超過分頁列視窗)"""
+    return max(10, math.ceil(size / max_pages))
+
+
+def run_pipeline(
+    settings: Settings, size: int, metrics: Optional[MetricsRegistry] = None
+) -> Dict[str, float]:
+    """
+    執行一次完整流程
+
+    Args:
+        settings: 指向模擬伺服器的設定
+        size: 預期的記錄數
+        metrics: 記錄 HTTP 請求的指標登錄 (可選)
+
+    Returns:
+        Dict[str, float]: 各階段耗時 (毫秒)
+    """
+    timings: Dict[str, float] = {}
+
+    def timed(stage: str, func: Callable):
+        start = time.perf_counter()
+        result = func()
+        timings[stage] = (time.perf_counter() - start) * 1000
+        return result
+
+    auth = AuthService(settings)
+    if metrics is not None:
+        auth.session.metrics = metrics
+    if not timed("login", lambda: auth.login("bench", "bench")):
+        raise RuntimeError("登入模擬伺服器失敗")
+
+    session = auth.get_session()
+    records = timed(
+        "fetch", lambda: DataService(session, settings).get_attendance_data()
+    )
+    if len(records) != size:
+        raise RuntimeError(f"抓取筆數不符: 預期 {size},實際 {len(records)}")
+
+    report = timed(
+        "calculate", lambda: OvertimeCalculator(settings).calculate_overtime(records)
+    )
+    timed(
+        "status",
+        lambda: OvertimeStatusService(settings).fetch_submitted_records(session),
+    )
+
+    filename = f"reports/benchmark_{size}.xlsx"
+    output = timed(
+        "export", lambda: ExportService(settings).export_to_excel(report, filename)
+    )
+    if output:
+        Path(output).unlink(missing_ok=True)
+
+    return timings
+
+
+def benchmark_size(size: int, repeat: int, latency: float, prefetch: bool) -> Dict:
+    """以指定記錄數執行多次流程並彙總"""
+    settings = Settings()
+    page_size = page_size_for(size, settings.MAX_PAGES)
+    metrics = MetricsRegistry()
+
+    with SspStubServer(
+        make_attendance_records(size),
+        make_history_rows(size),
+        page_size=page_size,
+        latency=latency,
+    ) as server:
+        settings.SSP_BASE_URL = server.base_url
+        settings.ATTENDANCE_PREFETCH = prefetch
+
+        runs: List[Dict[str, float]] = [
+            run_pipeline(settings, size, metrics) for _ in range(repeat)
+        ]
+        request_count = server.request_count
+
+    stages = {}
+    for stage in STAGES:
+        values = [run[stage] for run in runs]
+        stages[stage] = {
+            "median_ms": round(statistics.median(values), 2),
+            "min_ms": round(min(values), 2),
+            "max_ms": round(max(values), 2),
+        }
+
+    spans = metrics.spans()
+    return {
+        "size": size,
+        "page_size": page_size,
+        "pages": math.ceil(size / page_size),
+        "stages": stages,
+        "total_ms": round(sum(s["median_ms"] for s in stages.values()), 2),
+        "requests_per_run": request_count // repeat,
+        "response_bytes_per_run": sum(s.response_bytes for s in spans) // repeat,
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> str:
+    """產生與基準報告的比較表 (比值 < 1 表示變快)"""
+    baseline_by_size = {r["size"]: r for r in baseline["results"]}
+    lines = [f"{'size':>7} {'stage':<10} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for result in current["results"]:
+        base = baseline_by_size.get(result["size"])
+        if not base:
+            continue
+        for stage in STAGES:
+            before = base["stages"][stage]["median_ms"]
+            after = result["stages"][stage]["median_ms"]
+            ratio = after / before if before else float("nan")
+            lines.append(
+                f"{result['size']:>7} {stage:<10} {before:>10.1f} {after:>10.1f} {ratio:>7.2f}"
+            )
+    return "\n".join(lines)
+
+
+def run(
+    sizes=DEFAULT_SIZES, repeat: int = 3, latency: float = 0.0, prefetch: bool = False
+) -> Dict:
+    """
+    執行所有記錄數的效能測試
+
+    Returns:
+        Dict: 報告 (environment / config / results)
+    """
+    results = []
+    for size in sizes:
+        result = benchmark_size(size, repeat, latency, prefetch)
+        results.append(result)
+        print(
+            f"{size:>7} 筆: "
+            + ", ".join(f"{s} {result['stages'][s]['median_ms']:.1f}ms" for s in STAGES)
+        )
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "version": VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {"repeat": repeat, "latency": latency, "prefetch": prefetch},
+        "results": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """解析命令列參數"""
+    parser = argparse.ArgumentParser(description="離線 SSP 端對端效能測試")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="記錄數"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="每個記錄數的執行次數")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="每個請求的模擬網路延遲 (秒)"
+    )
+    parser.add_argument("--prefetch", action="store_true", help="啟用平行預取分頁")
+    parser.add_argument("-o", "--output", help="JSON 報告路徑")
+    parser.add_argument("--compare", help="與先前的 JSON 報告比較")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """主程式入口"""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    report = run(args.sizes, args.repeat, args.latency, args.prefetch)
+
+    output = Path(
+        args.output
+        or RESULTS_DIR / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"報告: {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print(compare(report, baseline))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
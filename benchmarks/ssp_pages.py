@@ -0,0 +1,247 @@
+"""
+SSP 頁面產生器
+
+產生與 SSP 相同結構的 ASP.NET 頁面 (隱藏欄位、GridView 分頁列、加班補報表單),
+供本機 SSP 模擬伺服器、基準測試與單元測試共用。
+"""
+
+from typing import Dict, List, Optional
+
+PAGER_WINDOW = 10
+
+
+def _hidden_fields(viewstate: str) -> str:
+    return (
+        f'<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}" />'
+        '<input type="hidden" name="__VIEWSTATEGENERATOR" '
+        'id="__VIEWSTATEGENERATOR" value="ABCD1234" />'
+        '<input type="hidden" name="__EVENTVALIDATION" '
+        f'id="__EVENTVALIDATION" value="EV-{viewstate}" />'
+    )
+
+
+def _pager_row(page: int, total_pages: int) -> str:
+    """產生 ASP.NET GridView 數字分頁列 (每次顯示 10 頁)"""
+    if total_pages <= 1:
+        return ""
+
+    window_start = ((page - 1) // PAGER_WINDOW) * PAGER_WINDOW + 1
+    window_end = min(window_start + PAGER_WINDOW - 1, total_pages)
+
+    def link(target: int, text: str) -> str:
+        return (
+            "<td><a href=\"javascript:__doPostBack('ctl00$ContentPlaceHolder1$gvWeb012',"
+            f"'Page${target}')\">{text}</a></td>"
+        )
+
+    cells = []
+    if window_start > 1:
+        cells.append(link(window_start - 1, "..."))
+    for target in range(window_start, window_end + 1):
+        cells.append(
+            f"<td><span>{target}</span></td>" if target == page else link(target, str(target))
+        )
+    if window_end < total_pages:
+        cells.append(link(window_end + 1, "..."))
+
+    return (
+        '<tr class="PagerStyle"><td colspan="3"><table><tr>'
+        + "".join(cells)
+        + "</tr></table></td></tr>"
+    )
+
+
+def attendance_page(records: List[Dict], page: int = 1, total_pages: int = 1) -> str:
+    """
+    產生 FW99001Z 出勤異常清單頁面
+
+    Args:
+        records: 本頁記錄 [{'date': ..., 'time_range': ...}]
+        page: 目前頁碼
+        total_pages: 總頁數
+    """
+    rows = []
+    for index, record in enumerate(records):
+        row_class = "RowStyle" if index % 2 == 0 else "AlternatingRowStyle"
+        start, end = record["time_range"].split("~")
+        rows.append(
+            f'<tr class="{row_class}"><td>'
+            f'<span id="ContentPlaceHolder1_gvWeb012_lblWork_Date_{index}">{record["date"]}</span><br />'
+            f'<span id="ContentPlaceHolder1_gvWeb012_lblCard_Time_{index}">{start}&nbsp;~&nbsp;{end}</span>'
+            "</td><td>異常</td><td>未處理</td></tr>"
+        )
+
+    return (
+        "<html><body><form method=\"post\" action=\"./FW99001Z.aspx\">"
+        + _hidden_fields(f"VS-ATT-{page}")
+        + '<div id="tabs-2"><table cellspacing="0" cellpadding="3" rules="rows" '
+        'id="ContentPlaceHolder1_gvWeb012">'
+        "<tr><th>出勤日期</th><th>狀態</th><th>處理</th></tr>"
+        + "".join(rows)
+        + _pager_row(page, total_pages)
+        + "</table></div><a href=\"logout.aspx\">登出</a></form></body></html>"
+    )
+
+
+def make_attendance_records(count: int, year: int = 2025) -> List[Dict]:
+    """產生連續日期的出勤記錄 (由新到舊)"""
+    records = []
+    for index in range(count):
+        month = 12 - (index // 28) % 12
+        day = 28 - index % 28
+        end_hour = 18 + index % 5
+        records.append(
+            {
+                "date": f"{year - index // 336}/{month:02d}/{day:02d}",
+                "time_range": f"08:{index % 60:02d}:00~{end_hour}:{(index * 7) % 60:02d}:00",
+            }
+        )
+    return records
+
+
+def history_page(rows: List[Dict]) -> str:
+    """
+    產生 FW21003Z 個人紀錄查詢頁面
+
+    Args:
+        rows: [{'date', 'content', 'status', 'ot_minutes', 'change_minutes',
+                'monthly', 'quarterly'}]
+    """
+    body = []
+    for index, row in enumerate(rows):
+        row_class = "RowStyle" if index % 2 == 0 else "AlternatingRowStyle_update"
+        prefix = "ContentPlaceHolder1_gvFlow211"
+        body.append(
+            f'<tr class="{row_class}">'
+            f'<td><span id="{prefix}_lblEmp_{index}">王小明</span><br />'
+            f'<span id="{prefix}_lblOT_Date_{index}">{row["date"]}</span></td>'
+            f'<td><span id="{prefix}_lblOT_Describe_{index}" title="{row["content"]}">'
+            f'{row["content"][:6]}</span></td>'
+            f"<td>{'加班' if row['ot_minutes'] else '調休'}</td>"
+            f'<td><span id="{prefix}_lblOT_Minute_{index}">{row["ot_minutes"]}</span>'
+            f'<span id="{prefix}_lblChange_Minute_{index}">{row["change_minutes"]}</span></td>'
+            f'<td><span id="{prefix}_lblOT_Manhour_{index}">{row["monthly"]}</span></td>'
+            f'<td><span id="{prefix}_lblOT_Monhour_{index}">{row["quarterly"]}</span></td>'
+            f'<td><span id="{prefix}_lblProcess_Flag_Text_{index}">{row["status"]}</span></td>'
+            "</tr>"
+        )
+
+    return (
+        "<html><body><form method=\"post\" action=\"./FW21003Z.aspx\">"
+        + _hidden_fields("VS-HIST")
+        + '<table id="ContentPlaceHolder1_gvFlow211">'
+        "<tr><th>加班人員</th><th>加班內容</th><th>狀態</th><th>申報</th>"
+        "<th>當月累積</th><th>當季累積</th><th>簽核</th></tr>"
+        + "".join(body)
+        + "</table></form></body></html>"
+    )
+
+
+def make_history_rows(count: int) -> List[Dict]:
+    """產生個人紀錄查詢資料列"""
+    statuses = ("簽核中", "簽核完成", "已撤回")
+    rows = []
+    for index in range(count):
+        is_overtime = index % 4 != 3
+        minutes = 30 * (1 + index % 8)
+        rows.append(
+            {
+                "date": f"2025/{12 - (index // 28) % 12:02d}/{28 - index % 28:02d}",
+                "content": f"專案開發 #{index}",
+                "status": statuses[index % 3],
+                "ot_minutes": minutes if is_overtime else 0,
+                "change_minutes": 0 if is_overtime else minutes,
+                "monthly": f"{(index % 20) + 0.5:.1f}",
+                "quarterly": f"{(index % 40) + 1.5:.1f}",
+            }
+        )
+    return rows
+
+
+def login_page() -> str:
+    """產生 index.aspx 登入頁面"""
+    return (
+        "<html><body><form method=\"post\" action=\"./index.aspx\">"
+        + _hidden_fields("VS-LOGIN")
+        + '<input name="ctl00$lblAccount" type="text" />'
+        '<input name="ctl00$lblPassWord" type="password" />'
+        '<input type="submit" name="ctl00$Submit" value="送出" />'
+        "</form></body></html>"
+    )
+
+
+def login_handler(passwords: Dict[str, str]):
+    """建立 index.aspx 處理函式 (帳密正確時回傳含「登出」的頁面)"""
+
+    def handler(method: str, form: Dict[str, str]) -> str:
+        account = form.get("ctl00$lblAccount")
+        if method == "POST" and passwords.get(account) == form.get("ctl00$lblPassWord"):
+            return "<html><body>歡迎 <a href=\"logout.aspx\">登出</a></body></html>"
+        return login_page()
+
+    return handler
+
+
+def report_form_page(row_count: int, viewstate: Optional[str] = None) -> str:
+    """產生 FW21001Z 加班補報申請單頁面 (含 row_count 列空白輸入列)"""
+    rows = []
+    for index in range(row_count):
+        ctl = f"ctl00$ContentPlaceHolder1$gvFlow211i$ctl{index + 3:02d}"
+        rows.append(
+            "<tr class=\"RowStyle\">"
+            f'<td><input name="{ctl}$txtOT_Datei" type="text" /></td>'
+            f'<td><input name="{ctl}$txtOT_Describei" type="text" /></td>'
+            f'<td><input name="{ctl}$txtOT_Minutei" type="text" /></td>'
+            f'<td><input name="{ctl}$txtChange_Minutei" type="text" /></td>'
+            "</tr>"
+        )
+
+    return (
+        "<html><body><form method=\"post\" action=\"./FW21001Z.aspx?Kind=B\">"
+        + _hidden_fields(viewstate or f"VS-FORM-{row_count}")
+        + '<table id="ContentPlaceHolder1_gvFlow211i">'
+        "<tr><th>加班日期</th><th>加班內容</th><th>加班時數</th><th>調休時數</th></tr>"
+        + "".join(rows)
+        + "</table>"
+        "<a id=\"ContentPlaceHolder1_lbgvAddRowi\" "
+        "href=\"javascript:__doPostBack('ctl00$ContentPlaceHolder1$lbgvAddRowi','')\">增加列</a>"
+        "</form></body></html>"
+    )
+
+
+def report_form_handler(initial_rows: int = 1):
+    """
+    建立 FW21001Z 處理函式
+
+    ViewState 記錄目前列數,「增加列」PostBack 回傳多一列的頁面,
+    送出時回傳成功頁面。
+    """
+
+    def handler(method: str, form: Dict[str, str]) -> str:
+        if method == "GET":
+            return report_form_page(initial_rows)
+
+        if "ctl00$ContentPlaceHolder1$btnCommit" in form:
+            return "<html><body>申請成功</body></html>"
+
+        rows = int(form["__VIEWSTATE"].rsplit("-", 1)[1])
+        if form.get("__EVENTTARGET") == "ctl00$ContentPlaceHolder1$lbgvAddRowi":
+            rows += 1
+        return report_form_page(rows)
+
+    return handler
+
+
+def attendance_handler(records: List[Dict], page_size: int = 10):
+    """建立 FW99001Z 處理函式 (依 Page$N 回傳對應頁面)"""
+    total_pages = max(1, -(-len(records) // page_size))
+
+    def handler(method: str, form: Dict[str, str]) -> str:
+        page = 1
+        argument = form.get("__EVENTARGUMENT", "")
+        if method == "POST" and argument.startswith("Page$"):
+            page = int(argument.split("$", 1)[1])
+        start = (page - 1) * page_size
+        return attendance_page(records[start : start + page_size], page, total_pages)
+
+    return handler
@@ -0,0 +1,172 @@
+"""
+離線 SSP 模擬伺服器
+
+以本機 HTTP 伺服器模擬 SSP 的 ASP.NET WebForms 頁面,
+頁面內容與 PostBack 行為沿用頁面產生器 (benchmarks/ssp_pages.py):
+
+- /index.aspx      登入
+- /FW99001Z.aspx   出勤異常清單 (Page$N 翻頁 PostBack)
+- /FW21001Z.aspx   加班補報申請單 (增加列 PostBack、送出)
+- /FW21003Z.aspx   個人紀錄查詢 (ddlPage=9999 不換頁)
+
+用法:
+    with SspStubServer(make_attendance_records(1000), page_size=100) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url)
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.ssp_pages import (
+    attendance_handler,
+    history_page,
+    login_handler,
+    report_form_handler,
+)
+
+# ddlPage 未指定時個人紀錄查詢每頁的筆數
+HISTORY_PAGE_SIZE = 10
+
+
+def history_handler(rows: List[Dict]):
+    """建立 FW21003Z 處理函式 (ddlPage 指定每頁筆數,只回傳第一頁)"""
+
+    def handler(method: str, form: Dict[str, str]) -> str:
+        page_size = int(
+            form.get("ctl00$ContentPlaceHolder1$ddlPage") or HISTORY_PAGE_SIZE
+        )
+        return history_page(rows[:page_size])
+
+    return handler
+
+
+class SspStubServer:
+    """
+    SSP 模擬伺服器
+
+    在背景執行緒提供服務,監聽 127.0.0.1 的隨機埠。
+    """
+
+    def __init__(
+        self,
+        attendance_records: Optional[List[Dict]] = None,
+        history_rows: Optional[List[Dict]] = None,
+        page_size: int = 10,
+        latency: float = 0.0,
+        passwords: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            attendance_records: 出勤異常記錄 (由新到舊)
+            history_rows: 個人紀錄查詢資料列
+            page_size: 出勤異常清單每頁筆數
+            latency: 每個請求額外延遲的秒數 (模擬網路往返)
+            passwords: 可登入的帳密 {帳號: 密碼},預設為 {"bench": "bench"}
+        """
+        self.handlers = {
+            "/index.aspx": login_handler(passwords or {"bench": "bench"}),
+            "/FW99001Z.aspx": attendance_handler(attendance_records or [], page_size),
+            "/FW21001Z.aspx": report_form_handler(),
+            "/FW21003Z.aspx": history_handler(history_rows or []),
+        }
+        self.latency = latency
+        self.request_count = 0
+        # 登入頁核發的 ASP.NET_SessionId;require_session 時其他頁面須帶此 cookie
+        self.session_id = "stub-session"
+        self.require_session = False
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """伺服器網址 (Settings.SSP_BASE_URL)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SspStubServer":
+        """啟動伺服器"""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # 與 IIS 相同保持 keep-alive 連線
+
+            def do_GET(self):
+                stub._handle(self, "GET")
+
+            def do_POST(self):
+                stub._handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass  # 不輸出存取日誌
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def expire_sessions(self):
+        """模擬 session 逾時: 之後未重新登入的請求都轉回登入頁"""
+        with self._lock:
+            self._generation += 1
+            self.session_id = f"stub-session-{self._generation}"
+            self.require_session = True
+
+    def stop(self):
+        """停止伺服器"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "SspStubServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handle(self, request: BaseHTTPRequestHandler, method: str):
+        """依路徑呼叫頁面處理函式"""
+        with self._lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        parsed = urlparse(request.path)
+        form = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        if method == "POST":
+            length = int(request.headers.get("Content-Length") or 0)
+            body = request.rfile.read(length).decode("utf-8")
+            form.update(
+                {k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()}
+            )
+
+        is_login = parsed.path == "/index.aspx"
+        cookie = f"ASP.NET_SessionId={self.session_id}"
+        if (
+            self.require_session
+            and not is_login
+            and cookie not in request.headers.get("Cookie", "")
+        ):
+            # 與 SSP 相同: session 逾時時轉回登入頁
+            request.send_response(302)
+            request.send_header("Location", "/index.aspx")
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        handler = self.handlers.get(parsed.path)
+        content = (handler(method, form) if handler else "<html></html>").encode("utf-8")
+
+        request.send_response(200 if handler else 404)
+        request.send_header("Content-Type", "text/html; charset=utf-8")
+        request.send_header("Content-Length", str(len(content)))
+        if is_login:
+            request.send_header("Set-Cookie", f"{cookie}; path=/")
+        request.end_headers()
+        request.wfile.write(content)
@@ -1,5 +1,5 @@
 """配置模組"""
 
-from .settings import Settings
+from .settings import Settings, app_data_dir
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "app_data_dir"]
@@ -1,6 +1,30 @@
 """系統設定"""
 
+import os
+import sys
 from dataclasses import dataclass, field
+from pathlib import Path
+
+APP_NAME = "OvertimeAssistant"
+
+
+def app_data_dir() -> Path:
+    """
+    使用者專屬的程式資料夾 (存放 session 等不應隨專案目錄散佈的資料)
+
+    Windows 為 %LOCALAPPDATA%,macOS 為 ~/Library/Application Support,
+    其他系統為 $XDG_DATA_HOME (預設 ~/.local/share)。
+
+    Returns:
+        Path: 程式資料夾 (不保證已建立)
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / APP_NAME
 
 
 @dataclass
@@ -19,6 +43,8 @@ class Settings:
     REST_TIME: int = 30
     MAX_OVERTIME_HOURS: int = 4
     STANDARD_START_HOUR: int = 9
+    # 記錄數達此值時改用 pandas 向量化計算 (0 = 停用,一律逐筆計算)
+    BATCH_CALCULATION_THRESHOLD: int = 0
 
     # 加班補報設定
     DEFAULT_OVERTIME_DESCRIPTION: str = "專案開發"
@@ -39,10 +65,52 @@ class Settings:
     # 匯出設定
     EXCEL_FILENAME_PREFIX: str = "overtime_report"
 
+    # 解析設定
+    HTML_PARSER: str = "lxml"  # BeautifulSoup 解析器 (lxml 較快,未安裝時退回 html.parser)
+
+    # 本機快取設定
+    LOCAL_STORE_ENABLED: bool = True  # 啟動時先顯示本機資料,背景增量同步
+    LOCAL_STORE_PATH: str = field(
+        default_factory=lambda: str(app_data_dir() / "local_store.db")
+    )
+    LOCAL_STORE_OVERLAP_DAYS: int = 7  # 增量同步時重新抓取最後同步日期前的天數
+    SESSION_PERSISTENCE: bool = True  # 記住我時加密保存登入 cookie,下次啟動免重新登入
+    SESSION_STORE_PATH: str = field(
+        default_factory=lambda: str(app_data_dir() / "session.bin")
+    )
+    SESSION_MAX_AGE: int = 8 * 60 * 60  # 保存的 cookie 超過此秒數不再嘗試沿用
+    SESSION_AUTO_RELOGIN: bool = True  # session 逾時 (轉回登入頁) 時自動重新登入並重送請求
+
     # 連線設定
     VERIFY_SSL: bool = False
     REQUEST_TIMEOUT: int = 30
     MAX_PAGES: int = 10
+    ATTENDANCE_PAGE_SIZE: int = 10  # 出勤異常清單每頁筆數 (本機資料只保留 MAX_PAGES 頁內的記錄)
+    OVERTIME_HISTORY_TTL: int = 30  # 個人紀錄查詢結果快取秒數
+    ATTENDANCE_PREFETCH: bool = False  # 平行預取出勤分頁
+    PREFETCH_WORKERS: int = 4  # 平行預取的最大執行緒數
+    BATCH_WORKERS: int = 4  # 批次計算同時處理的帳號數
+    HTTP_POOL_CONNECTIONS: int = 4  # 快取的主機連線池數
+    HTTP_POOL_MAXSIZE: int = 16  # 每個主機保留的 keep-alive 連線數 (應不小於平行請求數)
+    BACKGROUND_WORKERS: int = 8  # 共用事件迴圈同時執行的阻塞請求數
+
+    # 重試與斷路器
+    RETRY_ENABLED: bool = True
+    RETRY_MAX_ATTEMPTS: int = 3  # 含第一次的總嘗試次數
+    RETRY_BACKOFF_BASE: float = 0.5  # 指數退避的基準秒數 (實際等待時間隨機 0~上限)
+    RETRY_BACKOFF_MAX: float = 8.0
+    RETRY_STATUS_CODES: tuple[int, ...] = (502, 503, 504)
+    # 個別端點的設定 {URL 路徑: {max_attempts / backoff_base / backoff_max / retry_statuses}}
+    RETRY_POLICIES: dict = field(
+        default_factory=lambda: {
+            "/index.aspx": {"max_attempts": 2},
+            "/FW21001Z.aspx": {"max_attempts": 2},
+        }
+    )
+    # 表單含有這些欄位時不重試 (送出後無法確認伺服器是否已處理)
+    NON_IDEMPOTENT_FIELDS: tuple[str, ...] = ("ctl00$ContentPlaceHolder1$btnCommit",)
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # 連續失敗此次數後暫停送出請求 (0 表示停用)
+    CIRCUIT_RESET_TIMEOUT: float = 30.0  # 暫停多久後再試探 (秒)
 
     @classmethod
     def from_file(cls, filepath: str = "config.py"):
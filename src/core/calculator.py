@@ -19,12 +19,150 @@ class OvertimeCalculator:
         """
         計算加班時數
 
+        設定 Settings.BATCH_CALCULATION_THRESHOLD (大於 0) 且記錄數達門檻時
+        改用向量化計算,結果與逐筆計算相同。
+
         Args:
             records: 原始出勤記錄列表 [{'date': 'YYYY/MM/DD', 'time_range': 'HH:MM:SS~HH:MM:SS'}]
 
         Returns:
             OvertimeReport: 加班報表
         """
+        threshold = self.settings.BATCH_CALCULATION_THRESHOLD
+        if threshold > 0 and len(records) >= threshold:
+            try:
+                return self.calculate_overtime_batch(records)
+            except ImportError as e:
+                logger.warning(f"無法使用向量化計算,改為逐筆計算: {e}")
+
+        return self._calculate_overtime_scalar(records)
+
+    def extend_report(
+        self, report: OvertimeReport, records: List[dict]
+    ) -> List[AttendanceRecord]:
+        """
+        逐頁累加計算加班時數
+
+        只計算新到達的記錄並合併到既有報表 (維持由新到舊排序),
+        依序累加所有頁面的結果與一次計算全部記錄相同。
+
+        Args:
+            report: 累加中的報表 (會被修改)
+            records: 新到達的原始出勤記錄
+
+        Returns:
+            List[AttendanceRecord]: 本次新增的計算結果 (由新到舊)
+        """
+        page_records = self.calculate_overtime(records).records
+        report.records.extend(page_records)
+        # 穩定排序: 相同日期維持到達順序,與一次計算的排序結果一致
+        report.records.sort(key=lambda r: r.date_obj, reverse=True)
+        return page_records
+
+    def calculate_overtime_batch(self, records: List[dict]) -> OvertimeReport:
+        """
+        以 pandas 向量化計算加班時數 (大量記錄使用)
+
+        日期與時間欄位一次解析,扣除午休、工時、休息時間、進位及上限限制
+        皆以陣列運算完成 (只有接近 .5 的少數值改以 Python round 逐筆進位),
+        結果 (含型別) 與 calculate_overtime 逐筆計算相同。
+
+        Args:
+            records: 原始出勤記錄列表 [{'date': 'YYYY/MM/DD', 'time_range': 'HH:MM:SS~HH:MM:SS'}]
+
+        Returns:
+            OvertimeReport: 加班報表
+
+        Raises:
+            ImportError: 未安裝 pandas
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not records:
+            return OvertimeReport(records=[])
+
+        dates = pd.Series(
+            [record.get("date") for record in records], dtype=object
+        ).astype(str)
+        times = pd.Series(
+            [record.get("time_range") for record in records], dtype=object
+        ).astype(str).str.split("~")
+
+        # 時間範圍需恰好分成兩段
+        valid_range = times.str.len() == 2
+        start_strs = times.str[0].str.strip().where(valid_range, "")
+        end_strs = times.str[1].str.strip().where(valid_range, "")
+
+        # 一次解析全部日期時間 (解析失敗為 NaT)
+        datetime_format = f"{self.settings.DATE_FORMAT} {self.settings.TIME_FORMAT}"
+        start_times = pd.to_datetime(
+            dates + " " + start_strs, format=datetime_format, errors="coerce"
+        )
+        end_times = pd.to_datetime(
+            dates + " " + end_strs, format=datetime_format, errors="coerce"
+        )
+        days = pd.to_datetime(dates, format=self.settings.DATE_FORMAT, errors="coerce")
+
+        # 如果上班時間晚於標準時間,以標準時間計算
+        standard_starts = days + pd.Timedelta(hours=self.settings.STANDARD_START_HOUR)
+        actual_starts = start_times.where(
+            start_times <= standard_starts, standard_starts
+        )
+
+        # 計算總工作時間(分鐘)與加班時數
+        total_minutes = (end_times - actual_starts).dt.total_seconds() / 60
+        overtime_minutes = total_minutes - (
+            self.settings.LUNCH_BREAK
+            + self.settings.WORK_HOURS
+            + self.settings.REST_TIME
+        )
+        hours = (overtime_minutes / 60).to_numpy(dtype=float)
+        rounded = np.round(hours, 2)
+        # np.round 以 hours*100 取整,與 Python round (依實際二進位值進位) 只可能在
+        # 接近 .5 的值不同;這些少數值改用 round,確保與逐筆計算的進位方式一致
+        scaled = hours * 100
+        near_tie = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+        for idx in near_tie:
+            rounded[idx] = round(float(hours[idx]), 2)
+
+        # 限制範圍;超出範圍的值與逐筆計算相同為 0 / MAX_OVERTIME_HOURS (與設定同型別)
+        max_hours = self.settings.MAX_OVERTIME_HOURS
+        overtime_hours = np.clip(rounded, 0, max_hours).astype(object)
+        overtime_hours[rounded < 0] = 0
+        overtime_hours[rounded > max_hours] = max_hours
+        hours_list = overtime_hours.tolist()
+
+        valid = (
+            valid_range & start_times.notna() & end_times.notna() & days.notna()
+        ).to_numpy()
+        for idx in np.flatnonzero(~valid):
+            logger.warning(f"記錄 {idx+1}: 時間解析錯誤 - {records[idx]}")
+
+        # 排序(由新到舊),相同日期維持原順序
+        day_values = days.to_numpy(dtype="datetime64[ns]").astype("int64").tolist()
+        valid_indexes = np.flatnonzero(valid).tolist()
+        valid_indexes.sort(key=lambda idx: day_values[idx], reverse=True)
+
+        date_list = dates.tolist()
+        start_list = start_strs.tolist()
+        end_list = end_strs.tolist()
+        minutes_list = total_minutes.tolist()
+        attendance_records = [
+            AttendanceRecord(
+                date=date_list[idx],
+                start_time=start_list[idx],
+                end_time=end_list[idx],
+                total_minutes=int(minutes_list[idx]),
+                overtime_hours=hours_list[idx],
+            )
+            for idx in valid_indexes
+        ]
+
+        return OvertimeReport(records=attendance_records)
+
+    def _calculate_overtime_scalar(self, records: List[dict]) -> OvertimeReport:
+        """逐筆計算加班時數"""
         attendance_records = []
 
         for idx, record in enumerate(records):
@@ -8,6 +8,8 @@ from .overtime_submission import (
     SubmittedRecord,
 )
 from .personal_record import PersonalRecord, PersonalRecordSummary
+from .overtime_history import OvertimeHistory
+from .batch import BatchAccount, BatchAccountResult
 
 __all__ = [
     "AttendanceRecord",
@@ -17,4 +19,7 @@ __all__ = [
     "SubmittedRecord",
     "PersonalRecord",
     "PersonalRecordSummary",
+    "OvertimeHistory",
+    "BatchAccount",
+    "BatchAccountResult",
 ]
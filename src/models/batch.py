@@ -0,0 +1,26 @@
+"""批次計算資料模型"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .report import OvertimeReport
+
+
+@dataclass
+class BatchAccount:
+    """批次計算的帳號 (密碼不會出現在 repr 與日誌)"""
+
+    username: str
+    password: str = field(repr=False)
+
+
+@dataclass
+class BatchAccountResult:
+    """單一帳號的批次計算結果"""
+
+    username: str
+    success: bool
+    report: Optional[OvertimeReport] = None
+    error: Optional[str] = None
+    export_path: Optional[str] = None  # 個別匯出的檔案路徑
+    elapsed: float = 0.0  # 處理秒數
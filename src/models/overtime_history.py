@@ -0,0 +1,22 @@
+"""個人紀錄查詢結果資料模型"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List
+
+from .overtime_submission import SubmittedRecord
+from .personal_record import PersonalRecord, PersonalRecordSummary
+
+
+@dataclass
+class OvertimeHistory:
+    """
+    FW21003Z.aspx 個人紀錄查詢結果
+
+    同一次解析同時產生已申請狀態與個人記錄
+    """
+
+    submitted_records: Dict[str, SubmittedRecord] = field(default_factory=dict)
+    personal_records: List[PersonalRecord] = field(default_factory=list)
+    summary: PersonalRecordSummary = field(default_factory=PersonalRecordSummary)
+    fetched_at: datetime = field(default_factory=datetime.now)
@@ -1,7 +1,9 @@
 """加班報表資料模型"""
 
-from dataclasses import dataclass, field
-from typing import List, TYPE_CHECKING
+import copy
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import Iterable, List, Optional, TYPE_CHECKING
 from datetime import datetime
 from .attendance import AttendanceRecord
 
@@ -9,13 +11,256 @@ if TYPE_CHECKING:
     from .overtime_submission import OvertimeSubmissionRecord
 
 
+class _ReportStats:
+    """
+    報表統計快取
+
+    一次掃描算出所有統計;新增或替換單筆記錄時以 O(1) 增量更新。
+    最長加班記錄在有同值記錄時需依清單順序取第一筆,
+    無法增量判斷時只標記 max_stale,下次讀取時重新找出最大值。
+    總時數為浮點數依清單順序累加的結果,加減差值或改變順序都會產生誤差,
+    因此替換或重新排序時只標記 total_stale,下次讀取時依清單順序重新加總
+    (與重新計算的結果完全相同)。
+    """
+
+    __slots__ = (
+        "overtime_days",
+        "total_hours",
+        "max_hours",
+        "max_record",
+        "max_count",
+        "max_stale",
+        "total_stale",
+    )
+
+    def __init__(self, records: Iterable[AttendanceRecord] = ()):
+        self.overtime_days = 0
+        self.total_hours = 0.0
+        self.max_hours = 0.0
+        self.max_record: Optional[AttendanceRecord] = None
+        self.max_count = 0  # 加班時數等於 max_hours 的記錄數
+        self.max_stale = False
+        self.total_stale = False
+        for record in records:
+            self.add(record)
+
+    def add(self, record: AttendanceRecord):
+        """累加一筆附加在清單末端的記錄"""
+        hours = record.overtime_hours
+        self.total_hours += hours
+        if hours > 0:
+            self.overtime_days += 1
+        if self.max_record is None or hours > self.max_hours:
+            self.max_hours = hours
+            self.max_record = record
+            self.max_count = 1
+        elif hours == self.max_hours:
+            self.max_count += 1
+
+    def replace(self, old: AttendanceRecord, new: AttendanceRecord):
+        """同一位置的記錄由 old 換成 new"""
+        old_hours, new_hours = old.overtime_hours, new.overtime_hours
+        self.total_stale = True
+        self.overtime_days += (new_hours > 0) - (old_hours > 0)
+
+        if self.max_stale:
+            return
+        if new_hours > self.max_hours:
+            self.max_hours = new_hours
+            self.max_record = new
+            self.max_count = 1
+        elif old_hours == self.max_hours:
+            if new_hours == self.max_hours:
+                if old is self.max_record:
+                    self.max_record = new
+            elif old is self.max_record or self.max_count == 1:
+                # 移除了第一筆 (或唯一一筆) 最大值
+                self.max_stale = True
+            else:
+                self.max_count -= 1
+        elif new_hours == self.max_hours:
+            # 新的同值記錄可能排在原本第一筆之前
+            self.max_stale = True
+
+    def reorder(self):
+        """清單重新排序 (加總順序改變,同值最大記錄的先後也可能改變)"""
+        self.total_stale = True
+        if self.max_count > 1:
+            self.max_stale = True
+
+    def refresh_total(self, records: List[AttendanceRecord]):
+        """依清單順序重新加總時數"""
+        self.total_hours = sum((record.overtime_hours for record in records), 0.0)
+        self.total_stale = False
+
+    def refresh_max(self, records: List[AttendanceRecord]):
+        """重新找出最長加班記錄"""
+        self.max_record = None
+        self.max_hours = 0.0
+        self.max_count = 0
+        for record in records:
+            hours = record.overtime_hours
+            if self.max_record is None or hours > self.max_hours:
+                self.max_hours = hours
+                self.max_record = record
+                self.max_count = 1
+            elif hours == self.max_hours:
+                self.max_count += 1
+        self.max_stale = False
+
+
+class _RecordList(list):
+    """記錄清單: 內容被修改時通知所屬報表更新統計快取"""
+
+    _report = None  # 反序列化時 __init__ 不會被呼叫
+
+    def __init__(self, records: Iterable[AttendanceRecord] = (), report=None):
+        super().__init__(records)
+        self._report = report
+
+    def _changed(self):
+        if self._report is not None:
+            self._report.invalidate()
+
+    def append(self, record: AttendanceRecord):
+        super().append(record)
+        if self._report is not None:
+            self._report._records_appended((record,))
+
+    def extend(self, records: Iterable[AttendanceRecord]):
+        start = len(self)
+        super().extend(records)
+        if self._report is not None:
+            self._report._records_appended(islice(self, start, None))
+
+    def __iadd__(self, records):
+        self.extend(records)
+        return self
+
+    def __setitem__(self, index, value):
+        if isinstance(index, int) and self._report is not None:
+            old = self[index]
+            super().__setitem__(index, value)
+            self._report._record_replaced(old, value)
+            return
+        super().__setitem__(index, value)
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        if self._report is not None:
+            self._report._records_reordered()
+
+    def reverse(self):
+        super().reverse()
+        if self._report is not None:
+            self._report._records_reordered()
+
+    def insert(self, index, record):
+        super().insert(index, record)
+        self._changed()
+
+    def remove(self, record):
+        super().remove(record)
+        self._changed()
+
+    def pop(self, index=-1):
+        record = super().pop(index)
+        self._changed()
+        return record
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._changed()
+        return result
+
+
 @dataclass
 class OvertimeReport:
-    """加班報表"""
+    """
+    加班報表
+
+    統計 (加班天數、總時數、最長加班等) 第一次讀取時一次算出並快取;
+    透過 records 的 list 方法新增、替換記錄時增量更新,其他修改會清除快取。
+    直接修改記錄物件的欄位無法偵測,請改用 update_record 或呼叫 invalidate。
+    """
 
     records: List[AttendanceRecord] = field(default_factory=list)
     generated_at: datetime = field(default_factory=datetime.now)
 
+    def __setattr__(self, name, value):
+        if name == "records":
+            value = _RecordList(value, self)
+            object.__setattr__(self, "_stats_cache", None)
+        object.__setattr__(self, name, value)
+
+    def invalidate(self):
+        """清除統計快取 (下次讀取時重新計算)"""
+        object.__setattr__(self, "_stats_cache", None)
+
+    def __copy__(self) -> "OvertimeReport":
+        # records 綁定所屬報表,複本需有自己的清單 (記錄物件仍共用)
+        return OvertimeReport(records=list(self.records), generated_at=self.generated_at)
+
+    def __deepcopy__(self, memo) -> "OvertimeReport":
+        result = OvertimeReport.__new__(OvertimeReport)
+        memo[id(self)] = result
+        result.records = copy.deepcopy(list(self.records), memo)
+        result.generated_at = copy.deepcopy(self.generated_at, memo)
+        return result
+
+    def _stats(self) -> _ReportStats:
+        stats = getattr(self, "_stats_cache", None)
+        if stats is None:
+            stats = _ReportStats(self.records)
+            object.__setattr__(self, "_stats_cache", stats)
+        else:
+            if stats.max_stale:
+                stats.refresh_max(self.records)
+            if stats.total_stale:
+                stats.refresh_total(self.records)
+        return stats
+
+    def _records_appended(self, records: Iterable[AttendanceRecord]):
+        # 反序列化 / 複製重建清單時快取可能尚未建立
+        stats = getattr(self, "_stats_cache", None)
+        if stats is not None:
+            for record in records:
+                stats.add(record)
+
+    def _record_replaced(self, old: AttendanceRecord, new: AttendanceRecord):
+        stats = getattr(self, "_stats_cache", None)
+        if stats is not None:
+            stats.replace(old, new)
+
+    def _records_reordered(self):
+        stats = getattr(self, "_stats_cache", None)
+        if stats is not None:
+            stats.reorder()
+
+    def update_record(self, index: int, **changes) -> AttendanceRecord:
+        """
+        修改單筆記錄並增量更新統計
+
+        Args:
+            index: 記錄位置
+            **changes: 要修改的欄位 (例如 overtime_hours=1.5)
+
+        Returns:
+            AttendanceRecord: 修改後的記錄 (新物件)
+        """
+        record = replace(self.records[index], **changes)
+        self.records[index] = record
+        return record
+
     @property
     def total_days(self) -> int:
         """記錄天數"""
@@ -24,12 +269,12 @@ class OvertimeReport:
     @property
     def overtime_days(self) -> int:
         """加班天數"""
-        return len([r for r in self.records if r.overtime_hours > 0])
+        return self._stats().overtime_days
 
     @property
     def total_overtime_hours(self) -> float:
         """總加班時數"""
-        return sum(r.overtime_hours for r in self.records)
+        return self._stats().total_hours
 
     @property
     def average_overtime_hours(self) -> float:
@@ -43,25 +288,26 @@ class OvertimeReport:
         """最長加班時數"""
         if not self.records:
             return 0.0
-        return max(r.overtime_hours for r in self.records)
+        return self._stats().max_hours
 
     @property
     def max_overtime_date(self) -> str:
         """最長加班日期"""
         if not self.records:
             return ""
-        max_record = max(self.records, key=lambda r: r.overtime_hours)
-        return max_record.date
+        return self._stats().max_record.date
 
     def get_summary(self) -> dict:
         """取得統計摘要"""
+        stats = self._stats()
+        days = len(self.records)
         return {
-            "記錄天數": self.total_days,
-            "加班天數": self.overtime_days,
-            "總加班時數": f"{self.total_overtime_hours:.1f}",
-            "平均每日加班": f"{self.average_overtime_hours:.1f}",
-            "最長加班": f"{self.max_overtime_hours:.1f}",
-            "最長加班日期": self.max_overtime_date,
+            "記錄天數": days,
+            "加班天數": stats.overtime_days,
+            "總加班時數": f"{stats.total_hours:.1f}",
+            "平均每日加班": f"{stats.total_hours / days if days else 0.0:.1f}",
+            "最長加班": f"{stats.max_hours if days else 0.0:.1f}",
+            "最長加班日期": stats.max_record.date if days else "",
         }
 
     def to_submission_records(self) -> List["OvertimeSubmissionRecord"]:
@@ -7,7 +7,20 @@ from .update_service import UpdateService
 from .overtime_status_service import OvertimeStatusService
 from .overtime_report_service import OvertimeReportService
 from .personal_record_service import PersonalRecordService
+from .overtime_history_service import OvertimeHistoryService
 from .template_manager import TemplateManager
+from .local_store import LocalStore
+from .session_store import SessionStore
+from .session_guard import SessionGuard
+from .batch_service import BatchReportService
+from .fetch_orchestrator import FetchOrchestrator, FetchResult
+from .async_services import (
+    EventLoopThread,
+    AsyncDataService,
+    AsyncOvertimeStatusService,
+    AsyncPersonalRecordService,
+    AsyncOvertimeReportService,
+)
 
 __all__ = [
     "AuthService",
@@ -17,5 +30,17 @@ __all__ = [
     "OvertimeStatusService",
     "OvertimeReportService",
     "PersonalRecordService",
+    "OvertimeHistoryService",
     "TemplateManager",
+    "LocalStore",
+    "SessionStore",
+    "SessionGuard",
+    "BatchReportService",
+    "FetchOrchestrator",
+    "FetchResult",
+    "EventLoopThread",
+    "AsyncDataService",
+    "AsyncOvertimeStatusService",
+    "AsyncPersonalRecordService",
+    "AsyncOvertimeReportService",
 ]
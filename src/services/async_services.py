@@ -0,0 +1,196 @@
+"""非同步服務層 (共用事件迴圈執行緒)"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from ..models import (
+    OvertimeSubmissionRecord,
+    PersonalRecord,
+    PersonalRecordSummary,
+    SubmittedRecord,
+)
+from .data_service import DataService
+from .overtime_report_service import OvertimeReportService
+from .overtime_status_service import OvertimeStatusService
+from .personal_record_service import PersonalRecordService
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopThread:
+    """
+    背景事件迴圈執行緒
+
+    整個程式共用一個 asyncio 事件迴圈,同步的 requests 呼叫在有上限的
+    執行緒池中執行 (連線由共用 Transport 的連線池提供),
+    取代每個操作各自建立的 threading.Thread;大量請求或多帳號可用
+    asyncio.gather 平行展開,同時執行數受 max_workers 限制。
+    """
+
+    def __init__(self, max_workers: int = 8, name: str = "ssp-event-loop"):
+        """
+        Args:
+            max_workers: 同時執行的阻塞呼叫上限
+            name: 執行緒名稱
+        """
+        self.max_workers = max_workers
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """事件迴圈 (第一次使用時啟動)"""
+        with self._lock:
+            if self._loop is None:
+                self._start()
+            return self._loop
+
+    def _start(self):
+        ready = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"{self.name}-worker"
+        )
+
+        def run():
+            loop = self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.set_default_executor(self._executor)
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                # 在迴圈所屬執行緒關閉,stop 等待逾時也不會關閉仍在執行的迴圈
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def submit(self, coro: Awaitable) -> Future:
+        """
+        在事件迴圈執行協程 (任何執行緒皆可呼叫)
+
+        Returns:
+            concurrent.futures.Future: 協程結果
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """在執行緒池執行同步函式並等待結果 (於事件迴圈內 await)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def stop(self, timeout: float = 5):
+        """
+        停止事件迴圈並關閉執行緒池
+
+        Args:
+            timeout: 等待事件迴圈執行緒結束的秒數;逾時 (例如有協程阻塞迴圈)
+                     不會強制關閉迴圈,由該執行緒結束時自行關閉
+        """
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = self._thread = self._executor = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            logger.warning(f"事件迴圈執行緒未在 {timeout} 秒內結束,稍後由該執行緒關閉")
+        executor.shutdown(wait=False)
+
+
+_default: Optional[EventLoopThread] = None
+_default_lock = threading.Lock()
+
+
+def get_event_loop_thread(max_workers: int = 8) -> EventLoopThread:
+    """
+    取得全域共用的事件迴圈執行緒
+
+    Args:
+        max_workers: 同時執行的阻塞呼叫上限 (僅第一次呼叫時使用)
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = EventLoopThread(max_workers)
+        return _default
+
+
+class _AsyncService:
+    """非同步服務基底: 在共用事件迴圈的執行緒池中呼叫同步服務"""
+
+    def __init__(self, service, runner: Optional[EventLoopThread] = None):
+        self.service = service
+        self.runner = runner or get_event_loop_thread()
+
+    async def _call(self, func: Callable, *args, **kwargs) -> Any:
+        return await self.runner.run_blocking(func, *args, **kwargs)
+
+
+class AsyncDataService(_AsyncService):
+    """DataService 的非同步版本"""
+
+    service: DataService
+
+    async def get_attendance_data(self, **kwargs) -> List[Dict]:
+        """取得出勤異常清單資料 (參數同 DataService.get_attendance_data)"""
+        return await self._call(self.service.get_attendance_data, **kwargs)
+
+
+class AsyncOvertimeStatusService(_AsyncService):
+    """OvertimeStatusService 的非同步版本"""
+
+    service: OvertimeStatusService
+
+    async def fetch_submitted_records(
+        self, session: requests.Session, force: bool = False
+    ) -> Dict[str, SubmittedRecord]:
+        """查詢已申請的加班記錄"""
+        return await self._call(
+            self.service.fetch_submitted_records, session, force=force
+        )
+
+
+class AsyncPersonalRecordService(_AsyncService):
+    """PersonalRecordService 的非同步版本"""
+
+    service: PersonalRecordService
+
+    async def fetch_personal_records(
+        self, session: requests.Session, force: bool = False
+    ) -> Tuple[List[PersonalRecord], PersonalRecordSummary]:
+        """查詢個人加班記錄並計算統計"""
+        return await self._call(
+            self.service.fetch_personal_records, session, force=force
+        )
+
+
+class AsyncOvertimeReportService(_AsyncService):
+    """OvertimeReportService 的非同步版本"""
+
+    service: OvertimeReportService
+
+    async def preview_form(
+        self, session: requests.Session, records: List[OvertimeSubmissionRecord]
+    ) -> Dict[str, Any]:
+        """預覽表單填寫 (不實際送出)"""
+        return await self._call(self.service.preview_form, session, records)
+
+    async def submit_form(
+        self, session: requests.Session, records: List[OvertimeSubmissionRecord]
+    ) -> Dict[str, Any]:
+        """送出加班補報表單"""
+        return await self._call(self.service.submit_form, session, records)
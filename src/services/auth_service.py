@@ -1,12 +1,18 @@
 """認證服務"""
 
 import requests
-from bs4 import BeautifulSoup
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import urllib3
 
 from ..config import Settings
+from ..utils.aspnet import extract_viewstate
+from ..utils.resilience import ResilienceLayer
+from ..utils.transport import get_transport
+from ..utils.metrics import track_parse
+
+if TYPE_CHECKING:
+    from .session_store import SessionStore
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +20,26 @@ logger = logging.getLogger(__name__)
 class AuthService:
     """認證服務 - 處理 SSP 系統登入"""
 
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Args:
+            settings: 系統設定
+            session: 要登入的 session (可選,預設從共用連線池建立依設定重試的 SspSession)
+        """
         self.settings = settings or Settings()
-        self.session = requests.Session()
+        if session is None:
+            session = get_transport(self.settings).ssp_session(
+                resilience=(
+                    ResilienceLayer.from_settings(self.settings)
+                    if self.settings.RETRY_ENABLED
+                    else None
+                )
+            )
+        self.session = session
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -46,12 +69,10 @@ class AuthService:
                 timeout=self.settings.REQUEST_TIMEOUT,
                 verify=self.settings.VERIFY_SSL,
             )
-            soup = BeautifulSoup(response.text, "html.parser")
 
-            # 提取 ASP.NET 必要的隱藏欄位
-            viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-            viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})
-            event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
+            # 提取 ASP.NET 必要的隱藏欄位 (不需建立 DOM)
+            with track_parse(response):
+                viewstate = extract_viewstate(response.content)
 
             if not viewstate:
                 logger.error("無法找到 ViewState,可能網頁結構已變更")
@@ -59,13 +80,7 @@ class AuthService:
 
             # 準備登入資料
             login_data = {
-                "__VIEWSTATE": viewstate["value"],
-                "__VIEWSTATEGENERATOR": (
-                    viewstate_generator["value"] if viewstate_generator else ""
-                ),
-                "__EVENTVALIDATION": (
-                    event_validation["value"] if event_validation else ""
-                ),
+                **viewstate.to_form_data(),
                 "ctl00$lblAccount": username,
                 "ctl00$lblPassWord": password,
                 "ctl00$Submit": "送出",
@@ -94,6 +109,53 @@ class AuthService:
             logger.error(f"✗ 登入時發生錯誤: {e}", exc_info=True)
             return False
 
+    def probe_session(self) -> bool:
+        """
+        確認目前的 session 在伺服器端是否仍有效
+
+        只讀取出勤異常頁面的回應標頭 (不下載內容、不跟隨轉址):
+        session 失效時 SSP 會轉回登入頁。
+
+        Returns:
+            bool: session 是否有效
+        """
+        url = f"{self.settings.SSP_BASE_URL}{self.settings.ATTENDANCE_URL}"
+        try:
+            with self.session.get(
+                url,
+                timeout=self.settings.REQUEST_TIMEOUT,
+                verify=self.settings.VERIFY_SSL,
+                allow_redirects=False,
+                stream=True,
+            ) as response:
+                return response.status_code == 200 and "index.aspx" not in response.url
+        except Exception as e:
+            logger.warning(f"確認 session 狀態失敗: {e}")
+            return False
+
+    def resume(self, username: str, session_store: "SessionStore") -> bool:
+        """
+        沿用先前保存的 session (省略登入頁的 GET 與 POST)
+
+        Args:
+            username: 登入帳號
+            session_store: session 保存服務
+
+        Returns:
+            bool: 是否成功沿用 (失敗時 session 維持未登入狀態)
+        """
+        if not session_store.restore(username, self.session):
+            return False
+
+        if self.probe_session():
+            logger.info("✓ 沿用先前的登入狀態")
+            return True
+
+        logger.info("先前的登入狀態已失效,需重新登入")
+        self.session.cookies.clear()
+        session_store.clear()
+        return False
+
     def get_session(self) -> requests.Session:
         """取得已登入的 session"""
         return self.session
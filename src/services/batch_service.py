@@ -0,0 +1,213 @@
+"""多帳號批次計算服務"""
+
+import csv
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from ..config import Settings
+from ..core import OvertimeCalculator
+from ..models import BatchAccount, BatchAccountResult
+from ..utils.resilience import ResilienceLayer
+from ..utils.transport import get_transport
+from .auth_service import AuthService
+from .data_service import DataService
+from .export_service import ExportService
+from .session_guard import SessionGuard
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int, BatchAccountResult], None]
+
+
+class BatchReportService:
+    """
+    多帳號批次計算服務 (無 UI)
+
+    職責:
+    - 讀取帳號清單檔案
+    - 每個帳號使用獨立的 AuthService / Session 登入並抓取出勤資料
+    - 以有限的執行緒數平行處理,單一帳號失敗不影響其他帳號
+    - 所有帳號共用同一個重試與斷路器設定,SSP 過載時一起暫停
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        auth_factory: Optional[Callable[[], AuthService]] = None,
+        export_service: Optional[ExportService] = None,
+    ):
+        """
+        初始化批次計算服務
+
+        Args:
+            settings: 系統設定
+            auth_factory: 建立 AuthService 的函式 (可選,每個帳號呼叫一次)
+            export_service: 匯出服務 (可選)
+        """
+        self.settings = settings or Settings()
+        self.resilience = (
+            ResilienceLayer.from_settings(self.settings)
+            if self.settings.RETRY_ENABLED
+            else None
+        )
+        self.auth_factory = auth_factory or (
+            lambda: AuthService(
+                self.settings,
+                session=get_transport(self.settings).ssp_session(
+                    resilience=self.resilience
+                ),
+            )
+        )
+        self.export_service = export_service or ExportService(self.settings)
+        self.calculator = OvertimeCalculator(self.settings)
+
+    @staticmethod
+    def load_accounts(path: Path) -> List[BatchAccount]:
+        """
+        讀取帳號清單
+
+        支援 CSV (標題列 username,password) 與 JSON
+        ([{"username": ..., "password": ...}])。
+
+        Args:
+            path: 帳號清單檔案路徑
+
+        Returns:
+            List[BatchAccount]: 帳號列表
+
+        Raises:
+            ValueError: 檔案格式錯誤
+        """
+        path = Path(path)
+
+        if path.suffix.lower() == ".json":
+            with path.open("r", encoding="utf-8-sig") as fp:
+                rows = json.load(fp)
+            if not isinstance(rows, list):
+                raise ValueError("JSON 帳號清單必須是陣列")
+        else:
+            with path.open("r", encoding="utf-8-sig", newline="") as fp:
+                rows = list(csv.DictReader(fp))
+
+        accounts = []
+        for index, row in enumerate(rows, start=1):
+            if not isinstance(row, dict):
+                raise ValueError(f"第 {index} 筆帳號格式錯誤")
+
+            username = str(row.get("username") or "").strip()
+            password = str(row.get("password") or "")
+            if not username or not password:
+                raise ValueError(f"第 {index} 筆帳號缺少 username 或 password")
+            accounts.append(BatchAccount(username=username, password=password))
+
+        return accounts
+
+    def run(
+        self,
+        accounts: List[BatchAccount],
+        workers: Optional[int] = None,
+        export_each: bool = False,
+        on_progress: Optional[ProgressCallback] = None,
+        export_format: str = "xlsx",
+    ) -> List[BatchAccountResult]:
+        """
+        平行處理所有帳號
+
+        Args:
+            accounts: 帳號列表
+            workers: 同時處理的帳號數 (預設 Settings.BATCH_WORKERS)
+            export_each: 是否為每個帳號個別匯出報表
+            on_progress: 每完成一個帳號呼叫 on_progress(完成數, 總數, 結果)
+            export_format: 個別匯出的格式 (EXPORT_FORMATS,預設 xlsx)
+
+        Returns:
+            List[BatchAccountResult]: 依帳號清單順序的結果
+        """
+        if not accounts:
+            return []
+
+        workers = max(1, min(workers or self.settings.BATCH_WORKERS, len(accounts)))
+        logger.info(f"開始批次計算 {len(accounts)} 個帳號 (同時 {workers} 個)")
+
+        progress_lock = threading.Lock()
+        completed = 0
+
+        def process(account: BatchAccount) -> BatchAccountResult:
+            nonlocal completed
+            result = self.process_account(account, export_each, export_format)
+            with progress_lock:
+                completed += 1
+                if on_progress:
+                    on_progress(completed, len(accounts), result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process, accounts))
+
+        succeeded = len([r for r in results if r.success])
+        logger.info(f"✓ 批次計算完成: 成功 {succeeded} / {len(results)}")
+        return results
+
+    def process_account(
+        self, account: BatchAccount, export_each: bool = False, export_format: str = "xlsx"
+    ) -> BatchAccountResult:
+        """
+        處理單一帳號 (登入 → 抓取 → 計算 → 匯出)
+
+        Args:
+            account: 帳號
+            export_each: 是否個別匯出報表
+            export_format: 個別匯出的格式 (EXPORT_FORMATS)
+
+        Returns:
+            BatchAccountResult: 處理結果 (錯誤不會拋出)
+        """
+        started = time.perf_counter()
+
+        def failed(error: str) -> BatchAccountResult:
+            logger.error(f"✗ {account.username}: {error}")
+            return BatchAccountResult(
+                username=account.username,
+                success=False,
+                error=error,
+                elapsed=time.perf_counter() - started,
+            )
+
+        try:
+            auth_service = self.auth_factory()
+            if not auth_service.login(account.username, account.password):
+                return failed("登入失敗")
+
+            session = auth_service.get_session()
+            if self.settings.SESSION_AUTO_RELOGIN:
+                SessionGuard(
+                    account.username, lambda: account.password, self.settings
+                ).attach(session)
+            data_service = DataService(session, self.settings)
+            raw_records = data_service.get_attendance_data()
+            # 查詢中斷或沒有取得任何記錄時不當作成功 (否則合併報表會少了此帳號)
+            if data_service.last_error is not None or not raw_records:
+                return failed("查詢出勤資料失敗")
+            report = self.calculator.calculate_overtime(raw_records)
+
+            export_path = None
+            if export_each and report.records:
+                export_path = self.export_service.export_report(
+                    report, export_format, label=account.username
+                )
+
+            return BatchAccountResult(
+                username=account.username,
+                success=True,
+                report=report,
+                export_path=export_path,
+                elapsed=time.perf_counter() - started,
+            )
+
+        except Exception as e:
+            return failed(str(e))
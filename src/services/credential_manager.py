@@ -132,6 +132,19 @@ class CredentialManager:
             logger.warning(f"載入憑證失敗: {e}")
             return (None, None)
 
+    def load_password(self, username: str) -> Optional[str]:
+        """
+        讀取指定帳號已儲存的密碼 (供 session 逾時重新登入時使用)
+
+        Args:
+            username: 使用者名稱
+
+        Returns:
+            str: 密碼,未儲存或帳號不符時返回 None
+        """
+        saved_username, password = self.load_credentials()
+        return password if saved_username == username else None
+
     def clear_credentials(self) -> bool:
         """
         清除儲存的憑證
@@ -180,6 +193,33 @@ class CredentialManager:
         except Exception:
             return False
 
+    def encrypt(self, data: bytes) -> bytes:
+        """
+        以憑證加密金鑰加密資料 (供其他需加密的本機資料共用)
+
+        Args:
+            data: 明文資料
+
+        Returns:
+            bytes: Fernet 加密後的資料
+        """
+        return self._cipher.encrypt(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        """
+        解密 encrypt 產生的資料
+
+        Args:
+            token: 加密的資料
+
+        Returns:
+            bytes: 明文資料
+
+        Raises:
+            cryptography.fernet.InvalidToken: 金鑰不符或資料遭竄改
+        """
+        return self._cipher.decrypt(token)
+
     def _encrypt_password(self, password: str) -> str:
         """
         加密密碼
@@ -3,13 +3,22 @@
 import requests
 from bs4 import BeautifulSoup
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Callable, List, Dict, Optional, Set, Tuple
 import re
 
 from ..config import Settings
+from ..utils.aspnet import ViewState, extract_viewstate
+from ..utils.html import make_soup
+from ..utils.metrics import track_parse
+from ..utils.http import SessionExpiredError, clone_session
 
 logger = logging.getLogger(__name__)
 
+# 每頁解析完成時呼叫 on_page(頁碼, 本頁新增的記錄)
+PageCallback = Callable[[int, List[Dict]], None]
+
 
 class DataService:
     """資料擷取服務 - 處理出勤資料抓取"""
@@ -17,76 +26,299 @@ class DataService:
     def __init__(self, session: requests.Session, settings: Optional[Settings] = None):
         self.session = session
         self.settings = settings or Settings()
-
-    def get_attendance_data(self, max_pages: Optional[int] = None) -> List[Dict]:
+        # 最近一次 get_attendance_data 中斷或翻頁失敗的原因 (完整取得時為 None)
+        self.last_error: Optional[Exception] = None
+
+    def get_attendance_data(
+        self,
+        max_pages: Optional[int] = None,
+        prefetch: Optional[bool] = None,
+        since: Optional[date] = None,
+        on_page: Optional[PageCallback] = None,
+    ) -> List[Dict]:
         """
         取得出勤異常清單資料
 
+        清單依日期由新到舊排列,指定 since 時讀到早於該日期的記錄即停止翻頁
+        (增量同步用,該頁較舊的記錄仍會返回)。
+
         Args:
             max_pages: 最大頁數限制
+            prefetch: 是否平行預取分頁 (預設依 Settings.ATTENDANCE_PREFETCH)
+            since: 只需取得此日期 (含) 之後的記錄
+            on_page: 每頁解析完成時以 (頁碼, 本頁新增的記錄) 呼叫,
+                     可在全部頁面完成前先顯示已取得的記錄
 
         Returns:
             List[Dict]: 出勤記錄列表 [{'date': 'YYYY/MM/DD', 'time_range': 'HH:MM:SS~HH:MM:SS'}]
+                        (發生錯誤時為已取得的部分記錄,原因記錄在 last_error)
         """
         max_pages = max_pages or self.settings.MAX_PAGES
-        attendance_url = f"{self.settings.SSP_BASE_URL}/FW99001Z.aspx"
+        self.last_error = None
+        if prefetch is None:
+            prefetch = self.settings.ATTENDANCE_PREFETCH
         all_records = []
-        current_page = 1
 
-        try:
-            logger.info("正在訪問出勤異常頁面...")
-            response = self.session.get(
-                attendance_url,
-                timeout=self.settings.REQUEST_TIMEOUT,
-                verify=self.settings.VERIFY_SSL,
-            )
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 使用 set 來追蹤已處理的記錄
-            seen_records = set()
-
-            while current_page <= max_pages:
-                logger.info(f"正在處理第 {current_page} 頁...")
-
-                # 解析當前頁面的資料
-                records = self._parse_attendance_table(soup)
-
-                # 去重處理
-                new_count = 0
-                for record in records:
-                    record_key = f"{record['date']}_{record['time_range']}"
-                    if record_key not in seen_records:
-                        seen_records.add(record_key)
-                        all_records.append(record)
-                        new_count += 1
-
-                if new_count > 0:
-                    logger.info(f"  新增 {new_count} 筆記錄 (本頁共 {len(records)} 筆)")
-                else:
-                    logger.warning(f"  第 {current_page} 頁沒有新資料")
-
-                # 檢查是否有下一頁
-                has_next = self._has_next_page(soup, current_page)
-                if not has_next:
-                    logger.info("已處理完所有頁面")
-                    break
+        # 使用 set 來追蹤已處理的記錄
+        seen_records = set()
 
-                # 執行翻頁
-                response = self._goto_next_page(soup, current_page + 1)
-                if not response:
-                    logger.warning("翻頁失敗,停止處理")
-                    break
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                current_page += 1
+        try:
+            try:
+                self._fetch_pages(
+                    max_pages, prefetch, since, seen_records, all_records, on_page
+                )
+            except SessionExpiredError:
+                # 翻頁 PostBack 時 session 逾時 (守衛已重新登入):
+                # 重新載入第 1 頁再翻頁,已合併的記錄不會重複
+                logger.warning("翻頁時 session 逾時,重新載入出勤頁面...")
+                self._fetch_pages(
+                    max_pages, prefetch, since, seen_records, all_records, on_page
+                )
 
             logger.info(f"✓ 共取得 {len(all_records)} 筆不重複記錄")
             return all_records
 
         except Exception as e:
             logger.error(f"✗ 取得出勤資料時發生錯誤: {e}", exc_info=True)
+            self.last_error = e
             return all_records
 
+    def _fetch_pages(
+        self,
+        max_pages: int,
+        prefetch: bool,
+        since: Optional[date],
+        seen_records: Set[str],
+        all_records: List[Dict],
+        on_page: Optional[PageCallback],
+    ):
+        """
+        載入第 1 頁後翻頁並合併記錄
+
+        Raises:
+            SessionExpiredError: 翻頁 PostBack 時 session 逾時
+        """
+        attendance_url = f"{self.settings.SSP_BASE_URL}/FW99001Z.aspx"
+        logger.info("正在訪問出勤異常頁面...")
+        response = self.session.get(
+            attendance_url,
+            timeout=self.settings.REQUEST_TIMEOUT,
+            verify=self.settings.VERIFY_SSL,
+        )
+        soup, viewstate = self._load_page(response)
+
+        logger.info("正在處理第 1 頁...")
+        page_records = self._merge_page_records(
+            soup, 1, seen_records, all_records, on_page
+        )
+        if self._reached_since(page_records, since):
+            logger.info("已取得同步日期之後的所有記錄")
+            return
+
+        current_page = 1
+        if prefetch:
+            soup, viewstate, current_page = self._prefetch_pages(
+                soup, viewstate, max_pages, seen_records, all_records, since, on_page
+            )
+
+        if soup is not None:
+            self._walk_pages(
+                soup,
+                viewstate,
+                current_page,
+                max_pages,
+                seen_records,
+                all_records,
+                since,
+                on_page,
+            )
+
+    def _load_page(
+        self, response: requests.Response
+    ) -> Tuple[BeautifulSoup, Optional[ViewState]]:
+        """解析頁面,並以原始內容擷取翻頁所需的 ViewState"""
+        with track_parse(response):
+            return (
+                make_soup(response.text, self.settings.HTML_PARSER),
+                extract_viewstate(response.content),
+            )
+
+    def _walk_pages(
+        self,
+        soup: BeautifulSoup,
+        viewstate: Optional[ViewState],
+        current_page: int,
+        max_pages: int,
+        seen_records: Set[str],
+        all_records: List[Dict],
+        since: Optional[date] = None,
+        on_page: Optional[PageCallback] = None,
+    ):
+        """
+        循序翻頁並合併記錄
+
+        Args:
+            soup: 目前頁面 (已合併過記錄)
+            viewstate: 目前頁面的 ViewState
+            current_page: 目前頁碼
+            max_pages: 最大頁數限制
+            seen_records: 已處理記錄的鍵值
+            all_records: 累積的記錄列表
+            since: 讀到早於此日期的記錄即停止
+            on_page: 每頁解析完成時呼叫
+        """
+        while current_page < max_pages:
+            # 檢查是否有下一頁
+            if not self._has_next_page(soup, current_page):
+                logger.info("已處理完所有頁面")
+                return
+
+            # 執行翻頁
+            response = self._goto_next_page(viewstate, current_page + 1)
+            if not response:
+                logger.warning("翻頁失敗,停止處理")
+                self.last_error = requests.RequestException(
+                    f"第 {current_page + 1} 頁翻頁失敗"
+                )
+                return
+
+            soup, viewstate = self._load_page(response)
+            current_page += 1
+
+            logger.info(f"正在處理第 {current_page} 頁...")
+            page_records = self._merge_page_records(
+                soup, current_page, seen_records, all_records, on_page
+            )
+            if self._reached_since(page_records, since):
+                logger.info("已取得同步日期之後的所有記錄")
+                return
+
+    def _prefetch_pages(
+        self,
+        soup: BeautifulSoup,
+        viewstate: Optional[ViewState],
+        max_pages: int,
+        seen_records: Set[str],
+        all_records: List[Dict],
+        since: Optional[date] = None,
+        on_page: Optional[PageCallback] = None,
+    ) -> Tuple[Optional[BeautifulSoup], Optional[ViewState], int]:
+        """
+        平行預取分頁
+
+        讀取第 1 頁的分頁列後,以第 1 頁的 ViewState 同時送出各頁的
+        Page$N PostBack,每個請求使用獨立複製的 session。
+        結果依頁碼順序合併,與循序翻頁的結果相同。
+
+        Args:
+            soup: 第 1 頁 (已合併過記錄)
+            viewstate: 第 1 頁的 ViewState
+            max_pages: 最大頁數限制
+            seen_records: 已處理記錄的鍵值
+            all_records: 累積的記錄列表
+            since: 讀到早於此日期的記錄即停止合併
+            on_page: 每頁合併時呼叫 (依頁碼順序)
+
+        Returns:
+            Tuple[最後合併的頁面, 其 ViewState, 頁碼]: 頁面為 None 表示翻頁失敗
+            或已到達同步日期,應停止處理
+        """
+        pages = []
+        for page_num in self._get_pager_pages(soup):
+            # 只取從第 2 頁起連續的頁碼,確保與循序翻頁結果一致
+            if page_num != len(pages) + 2 or page_num > max_pages:
+                break
+            pages.append(page_num)
+
+        if not pages or not viewstate:
+            return soup, viewstate, 1
+
+        logger.info(f"平行預取第 2~{pages[-1]} 頁...")
+        workers = max(1, min(self.settings.PREFETCH_WORKERS, len(pages)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded_pages = list(
+                executor.map(
+                    lambda page_num: self._fetch_page_isolated(viewstate, page_num),
+                    pages,
+                )
+            )
+
+        last_page = 1
+        for page_num, loaded in zip(pages, loaded_pages):
+            if loaded is None:
+                logger.warning("翻頁失敗,停止處理")
+                self.last_error = requests.RequestException(f"第 {page_num} 頁翻頁失敗")
+                return None, None, last_page
+
+            soup, viewstate = loaded
+            logger.info(f"正在處理第 {page_num} 頁...")
+            page_records = self._merge_page_records(
+                soup, page_num, seen_records, all_records, on_page
+            )
+            last_page = page_num
+            if self._reached_since(page_records, since):
+                logger.info("已取得同步日期之後的所有記錄")
+                return None, None, last_page
+
+        return soup, viewstate, last_page
+
+    def _fetch_page_isolated(
+        self, viewstate: ViewState, page_num: int
+    ) -> Optional[Tuple[BeautifulSoup, Optional[ViewState]]]:
+        """以複製的 session 取得指定頁面 (供平行預取使用)"""
+        response = self._post_page(clone_session(self.session), viewstate, page_num)
+        if not response:
+            return None
+        return self._load_page(response)
+
+    def _merge_page_records(
+        self,
+        soup: BeautifulSoup,
+        page_num: int,
+        seen_records: Set[str],
+        all_records: List[Dict],
+        on_page: Optional[PageCallback] = None,
+    ) -> List[Dict]:
+        """解析頁面記錄並去重合併,返回本頁解析出的記錄"""
+        records = self._parse_attendance_table(soup)
+
+        new_records = []
+        for record in records:
+            record_key = f"{record['date']}_{record['time_range']}"
+            if record_key not in seen_records:
+                seen_records.add(record_key)
+                new_records.append(record)
+        all_records.extend(new_records)
+
+        if new_records:
+            logger.info(f"  新增 {len(new_records)} 筆記錄 (本頁共 {len(records)} 筆)")
+        else:
+            logger.warning(f"  第 {page_num} 頁沒有新資料")
+
+        if on_page and new_records:
+            try:
+                on_page(page_num, list(new_records))
+            except Exception as e:
+                logger.warning(f"處理第 {page_num} 頁回呼時發生錯誤: {e}")
+
+        return records
+
+    def _reached_since(self, records: List[Dict], since: Optional[date]) -> bool:
+        """本頁是否已出現早於 since 的記錄 (之後的頁面都更舊)"""
+        if since is None:
+            return False
+
+        for record in records:
+            try:
+                record_date = datetime.strptime(
+                    record["date"], self.settings.DATE_FORMAT
+                ).date()
+            except ValueError:
+                continue
+            if record_date < since:
+                return True
+        return False
+
     def _parse_attendance_table(self, soup: BeautifulSoup) -> List[Dict]:
         """解析出勤表格"""
         records = []
@@ -191,55 +423,57 @@ class DataService:
         logger.info(f"  成功解析 {len(records)} 筆記錄")
         return records
 
-    def _has_next_page(self, soup: BeautifulSoup, current_page: int) -> bool:
-        """檢查是否有下一頁"""
+    def _find_grid_table(self, soup: BeautifulSoup):
+        """尋找出勤 GridView 表格"""
         table = soup.find("table", id="ContentPlaceHolder1_gvWeb012")
         if not table:
             table = soup.find("table", {"id": re.compile(".*gvWeb012.*")})
+        return table
+
+    def _has_next_page(self, soup: BeautifulSoup, current_page: int) -> bool:
+        """檢查是否有下一頁"""
+        return current_page + 1 in self._get_pager_pages(soup)
 
+    def _get_pager_pages(self, soup: BeautifulSoup) -> List[int]:
+        """取得分頁列上可直接前往的頁碼 (依序排列)"""
+        table = self._find_grid_table(soup)
         if not table:
-            return False
+            return []
 
         pager = table.find("tr", class_="PagerStyle")
         if not pager:
-            return False
+            return []
 
-        all_links = pager.find_all("a")
-        for link in all_links:
-            if (
-                link.text.strip().isdigit()
-                and int(link.text.strip()) == current_page + 1
-            ):
-                return True
+        pages = set()
+        for link in pager.find_all("a"):
+            text = link.text.strip()
+            if text.isdigit():
+                pages.add(int(text))
 
-        return False
+        return sorted(pages)
 
     def _goto_next_page(
-        self, soup: BeautifulSoup, page_num: int
+        self, viewstate: Optional[ViewState], page_num: int
     ) -> Optional[requests.Response]:
         """前往下一頁"""
-        try:
-            viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-            viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})
-            event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
+        if not viewstate:
+            logger.error("無法取得 ViewState,翻頁失敗")
+            return None
 
-            if not viewstate:
-                logger.error("無法取得 ViewState,翻頁失敗")
-                return None
+        return self._post_page(self.session, viewstate, page_num)
 
+    def _post_page(
+        self, session: requests.Session, viewstate: ViewState, page_num: int
+    ) -> Optional[requests.Response]:
+        """送出分頁 PostBack"""
+        try:
             post_data = {
-                "__VIEWSTATE": viewstate["value"],
-                "__VIEWSTATEGENERATOR": (
-                    viewstate_generator["value"] if viewstate_generator else ""
-                ),
-                "__EVENTVALIDATION": (
-                    event_validation["value"] if event_validation else ""
-                ),
+                **viewstate.to_form_data(),
                 "__EVENTTARGET": "ctl00$ContentPlaceHolder1$gvWeb012",
                 "__EVENTARGUMENT": f"Page${page_num}",
             }
 
-            response = self.session.post(
+            response = session.post(
                 f"{self.settings.SSP_BASE_URL}/FW99001Z.aspx",
                 data=post_data,
                 timeout=self.settings.REQUEST_TIMEOUT,
@@ -248,6 +482,8 @@ class DataService:
 
             return response
 
+        except SessionExpiredError:
+            raise
         except Exception as e:
             logger.error(f"翻頁時發生錯誤: {e}")
             return None
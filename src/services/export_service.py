@@ -1,16 +1,222 @@
-"""匯出服務"""
+"""
+匯出服務
 
-import pandas as pd
+pandas / openpyxl 載入成本高,只在實際匯出時才匯入,
+避免拖慢程式啟動 (登入畫面不需要匯出功能)。
+"""
+
+import re
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 import logging
-from typing import Optional
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO
 
-from ..models import OvertimeReport
+from ..models import (
+    AttendanceRecord,
+    BatchAccountResult,
+    OvertimeReport,
+    PersonalRecord,
+)
 from ..config import Settings
+from ..utils.text_width import pad
+from .report_writers import get_writer
 
 logger = logging.getLogger(__name__)
 
+# 加班記錄工作表的欄位與欄寬
+RECORD_COLUMNS = ("日期", "上班時間", "下班時間", "總工時(分)", "加班時數")
+RECORD_COLUMN_WIDTHS = (15, 12, 12, 12, 12)
+# 欄位式格式 (Parquet) 的欄位型別,與欄位名稱一一對應
+RECORD_COLUMN_TYPES = ("string", "string", "string", "int64", "float64")
+PERSONAL_RECORD_COLUMNS = (
+    "加班日期",
+    "加班內容",
+    "狀態",
+    "加班時數",
+    "當月累計",
+    "當季累計",
+    "申報類型",
+)
+PERSONAL_RECORD_COLUMN_TYPES = (
+    "string",
+    "string",
+    "string",
+    "float64",
+    "float64",
+    "float64",
+    "string",
+)
+
+# 可選擇的匯出格式 (xlsx 以外為欄位式格式,不含統計區塊,適合其他系統匯入)
+EXPORT_FORMATS = ("xlsx", "csv", "jsonl", "parquet")
+
+
+def _record_row(record: AttendanceRecord) -> tuple:
+    """加班記錄工作表的一列"""
+    return (
+        record.date,
+        record.start_time,
+        record.end_time,
+        record.total_minutes,
+        record.overtime_hours,
+    )
+
+
+def _batch_summary_row(result: BatchAccountResult) -> tuple:
+    """帳號摘要工作表中一個帳號的列 (失敗的帳號統計欄位留空)"""
+    summary = result.report.get_summary() if result.report else {}
+    return (
+        result.username,
+        "成功" if result.success else "失敗",
+        *(summary.get(column) for column in BATCH_SUMMARY_COLUMNS[2:8]),
+        result.error or None,
+    )
+
+
+# 文字報表的寬度與表格欄位 (欄位名稱, 顯示寬度),數值靠右對齊
+TEXT_REPORT_WIDTH = 80
+TEXT_REPORT_COLUMNS = (("日期", 10), ("上班時間", 10), ("下班時間", 10), ("加班時數", 10))
+
+
+def _text_row(values: Iterable[str]) -> str:
+    """文字報表表格的一行 (欄位間以兩個空白分隔)"""
+    return (
+        "  ".join(
+            pad(value, width, ">")
+            for value, (_, width) in zip(values, TEXT_REPORT_COLUMNS)
+        )
+        + "\n"
+    )
+
+
+def _personal_record_row(record: PersonalRecord) -> tuple:
+    """個人記錄的一列"""
+    return (
+        record.date,
+        record.content,
+        record.status,
+        record.overtime_hours,
+        record.monthly_total,
+        record.quarterly_total,
+        record.report_type,
+    )
+
+
+def _summary_rows(summary: dict) -> Iterator[tuple]:
+    """加班記錄工作表末端的統計資訊區塊 (空一列後寫在前兩欄)"""
+    yield ()
+    yield ("統計資訊",)
+    yield ("記錄天數", summary["記錄天數"])
+    yield ("加班天數", summary["加班天數"])
+    yield ("總加班時數", f"{summary['總加班時數']} hr")
+    yield ("平均每日加班", f"{summary['平均每日加班']} hr")
+    yield ("最長加班", f"{summary['最長加班']} hr")
+    yield ("最長加班日期", summary["最長加班日期"])
+
+
+# 團隊活頁簿「摘要」工作表的欄位與欄寬
+TEAM_SUMMARY_COLUMNS = (
+    "員工",
+    "記錄天數",
+    "加班天數",
+    "總加班時數",
+    "平均每日加班",
+    "最長加班",
+    "最長加班日期",
+)
+TEAM_SUMMARY_COLUMN_WIDTHS = (15, 10, 10, 12, 12, 10, 15)
+
+# 批次結果活頁簿「帳號摘要」與「加班記錄」工作表的欄位與欄寬
+BATCH_SUMMARY_COLUMNS = (
+    "帳號",
+    "狀態",
+    "記錄天數",
+    "加班天數",
+    "總加班時數",
+    "平均每日加班",
+    "最長加班",
+    "最長加班日期",
+    "錯誤訊息",
+)
+BATCH_SUMMARY_COLUMN_WIDTHS = (14,) * len(BATCH_SUMMARY_COLUMNS)
+BATCH_RECORD_COLUMNS = ("帳號",) + RECORD_COLUMNS
+BATCH_RECORD_COLUMN_WIDTHS = (14,) * len(BATCH_RECORD_COLUMNS)
+
+# 工作表名稱不可包含的字元與長度上限 (Excel 限制)
+_INVALID_SHEET_CHARS = re.compile(r"[\\/*?:\[\]]")
+_MAX_SHEET_TITLE = 31
+
+
+def _employee_summary_row(name: str, report: OvertimeReport) -> tuple:
+    """摘要工作表中一位員工的列 (取自報表的統計快取)"""
+    return (
+        name,
+        report.total_days,
+        report.overtime_days,
+        round(report.total_overtime_hours, 2),
+        round(report.average_overtime_hours, 2),
+        round(report.max_overtime_hours, 2),
+        report.max_overtime_date,
+    )
+
+
+class _DepartmentTotals:
+    """部門合計: 合併各員工報表的統計"""
+
+    __slots__ = ("days", "overtime_days", "hours", "max_hours", "max_date", "max_owner")
+
+    def __init__(self):
+        self.days = 0
+        self.overtime_days = 0
+        self.hours = 0.0
+        self.max_hours = 0.0
+        self.max_date = ""
+        self.max_owner = ""
+
+    def merge(self, report: OvertimeReport, owner: str):
+        """合併一位員工的報表 (owner 為員工名稱)"""
+        if not report.records:
+            return
+        if not self.days or report.max_overtime_hours > self.max_hours:
+            self.max_hours = report.max_overtime_hours
+            self.max_date = report.max_overtime_date
+            self.max_owner = owner
+        self.days += report.total_days
+        self.overtime_days += report.overtime_days
+        self.hours += report.total_overtime_hours
+
+    def row(self, label: str) -> tuple:
+        """摘要工作表的合計列"""
+        return (
+            label,
+            self.days,
+            self.overtime_days,
+            round(self.hours, 2),
+            round(self.hours / self.days if self.days else 0.0, 2),
+            round(self.max_hours, 2),
+            self.max_date,
+        )
+
+
+def _sheet_title(name: str, used: set) -> str:
+    """
+    產生合法且不重複的工作表名稱
+
+    Args:
+        name: 原始名稱 (員工帳號)
+        used: 已使用的名稱 (會加入新名稱)
+    """
+    base = _INVALID_SHEET_CHARS.sub("_", name).strip().strip("'") or "員工"
+    title = base[:_MAX_SHEET_TITLE]
+    counter = 2
+    while title.lower() in used:
+        suffix = f" ({counter})"
+        title = base[: _MAX_SHEET_TITLE - len(suffix)] + suffix
+        counter += 1
+    used.add(title.lower())
+    return title
+
 
 class ExportService:
     """匯出服務 - 處理報表匯出"""
@@ -41,80 +247,359 @@ class ExportService:
             return None
 
         if filename is None:
-            filename = f"{self.settings.EXCEL_FILENAME_PREFIX}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+            filename = self.make_filename()
 
         if not filename.startswith("reports/"):
             filename = f"reports/{filename}"
 
         try:
-            # 準備資料
-            data = []
-            for record in report.records:
-                data.append(
-                    {
-                        "日期": record.date,
-                        "上班時間": record.start_time,
-                        "下班時間": record.end_time,
-                        "總工時(分)": record.total_minutes,
-                        "加班時數": record.overtime_hours,
-                    }
+            from openpyxl import Workbook
+
+            # write-only 模式逐列寫出,不在記憶體中保留整份工作表
+            workbook = Workbook(write_only=True)
+            self._write_sheet(
+                workbook,
+                "加班記錄",
+                RECORD_COLUMNS,
+                RECORD_COLUMN_WIDTHS,
+                chain(
+                    (_record_row(record) for record in report.records),
+                    _summary_rows(report.get_summary()),
+                ),
+            )
+            workbook.save(filename)
+
+            logger.info(f"✓ 已匯出至: {filename}")
+            return filename
+
+        except Exception as e:
+            logger.error(f"✗ 匯出 Excel 時發生錯誤: {e}")
+            return None
+
+    def _write_sheet(
+        self,
+        workbook,
+        title: str,
+        columns: Sequence[str],
+        widths: Sequence[float],
+        rows: Iterable[Sequence] = (),
+    ):
+        """
+        於 write-only 活頁簿新增工作表並逐列寫入
+
+        標題列格式與 pandas.DataFrame.to_excel 相同 (粗體、細框線、置中)。
+
+        Args:
+            workbook: openpyxl.Workbook(write_only=True)
+            title: 工作表名稱
+            columns: 欄位名稱
+            widths: 各欄寬度
+            rows: 資料列 (可為產生器)
+
+        Returns:
+            工作表 (之後仍可繼續 append)
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+        from openpyxl.utils import get_column_letter
+
+        sheet = workbook.create_sheet(title)
+        for index, width in enumerate(widths, start=1):
+            sheet.column_dimensions[get_column_letter(index)].width = width
+
+        thin = Side(style="thin")
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(sheet, value=column)
+            cell.font = Font(bold=True)
+            cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+            cell.alignment = Alignment(horizontal="center", vertical="top")
+            header.append(cell)
+        sheet.append(header)
+
+        for row in rows:
+            sheet.append(row)
+        return sheet
+
+    def export_team_workbook(
+        self, reports: Mapping[str, OvertimeReport], filename: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        將多位員工的報表匯出為單一 Excel 活頁簿
+
+        - 「摘要」工作表 (第一個): 每位員工的統計與部門合計
+        - 每位員工一個工作表: 加班記錄與統計資訊 (同 export_to_excel)
+
+        以 write-only 模式一次串流寫出,不保留整份活頁簿於記憶體;
+        員工統計取自各報表的統計快取,這裡只合併為部門合計。
+
+        Args:
+            reports: 員工名稱 → 加班報表 (依順序建立工作表)
+            filename: 檔案路徑 (可選)
+
+        Returns:
+            str: 匯出的檔案路徑,失敗則返回 None
+        """
+        if not reports:
+            logger.warning("沒有報表可匯出")
+            return None
+
+        filename = filename or f"reports/{self.make_filename('team')}"
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            from openpyxl import Workbook
+
+            workbook = Workbook(write_only=True)
+            # 摘要工作表先建立 (排在最前面),內容待所有員工寫完後補上
+            summary_sheet = self._write_sheet(
+                workbook, "摘要", TEAM_SUMMARY_COLUMNS, TEAM_SUMMARY_COLUMN_WIDTHS
+            )
+
+            used_titles = {"摘要"}
+            department = _DepartmentTotals()
+            for name, report in reports.items():
+                self._write_sheet(
+                    workbook,
+                    _sheet_title(name, used_titles),
+                    RECORD_COLUMNS,
+                    RECORD_COLUMN_WIDTHS,
+                    chain(
+                        (_record_row(record) for record in report.records),
+                        _summary_rows(report.get_summary()),
+                    ),
                 )
+                summary_sheet.append(_employee_summary_row(name, report))
+                department.merge(report, name)
 
-            df = pd.DataFrame(data)
-
-            # 加入統計資料
-            summary = report.get_summary()
-            summary_df = pd.DataFrame(
-                {
-                    "日期": [
-                        "",
-                        "統計資訊",
-                        "記錄天數",
-                        "加班天數",
-                        "總加班時數",
-                        "平均每日加班",
-                        "最長加班",
-                        "最長加班日期",
-                    ],
-                    "上班時間": [
-                        "",
-                        "",
-                        summary["記錄天數"],
-                        summary["加班天數"],
-                        f"{summary['總加班時數']} hr",
-                        f"{summary['平均每日加班']} hr",
-                        f"{summary['最長加班']} hr",
-                        summary["最長加班日期"],
-                    ],
-                    "下班時間": [""] * 8,
-                    "總工時(分)": [""] * 8,
-                    "加班時數": [""] * 8,
-                }
+            summary_sheet.append(department.row("部門合計"))
+            summary_sheet.append(())
+            summary_sheet.append(("員工數", len(reports)))
+            summary_sheet.append(
+                ("人均加班時數", round(department.hours / len(reports), 2))
+            )
+            summary_sheet.append(
+                ("最長加班", f"{department.max_owner} {department.max_date}".strip())
             )
+            workbook.save(filename)
 
-            final_df = pd.concat([df, summary_df], ignore_index=True)
+            logger.info(f"✓ 已匯出 {len(reports)} 位員工至: {filename}")
+            return filename
 
-            # 寫入 Excel
-            with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-                final_df.to_excel(writer, sheet_name="加班記錄", index=False)
+        except Exception as e:
+            logger.error(f"✗ 匯出團隊活頁簿時發生錯誤: {e}")
+            return None
 
-                # 調整欄寬
-                worksheet = writer.sheets["加班記錄"]
-                worksheet.column_dimensions["A"].width = 15
-                worksheet.column_dimensions["B"].width = 12
-                worksheet.column_dimensions["C"].width = 12
-                worksheet.column_dimensions["D"].width = 12
-                worksheet.column_dimensions["E"].width = 12
+    def export_report(
+        self,
+        report: OvertimeReport,
+        fmt: str = "xlsx",
+        filename: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        以指定格式匯出加班報表
 
-            logger.info(f"✓ 已匯出至: {filename}")
+        Args:
+            report: 加班報表
+            fmt: 匯出格式 (EXPORT_FORMATS)
+            filename: 檔案名稱 (可選)
+            label: 未指定檔名時附加於預設檔名的標籤 (例如帳號)
+
+        Returns:
+            str: 匯出的檔案路徑,失敗則返回 None
+        """
+        if fmt == "xlsx":
+            return self.export_to_excel(report, filename or self.make_filename(label))
+        if not report.records:
+            logger.warning("沒有記錄可匯出")
+            return None
+
+        return self._write_columnar(
+            fmt,
+            filename,
+            label,
+            RECORD_COLUMNS,
+            RECORD_COLUMN_TYPES,
+            (_record_row(record) for record in report.records),
+        )
+
+    def export_personal_records(
+        self,
+        records: List[PersonalRecord],
+        fmt: str = "csv",
+        filename: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        以欄位式格式匯出個人記錄
+
+        Args:
+            records: 個人記錄
+            fmt: 匯出格式 (csv / jsonl / parquet)
+            filename: 檔案名稱 (可選)
+
+        Returns:
+            str: 匯出的檔案路徑,失敗則返回 None
+        """
+        if not records:
+            logger.warning("沒有記錄可匯出")
+            return None
+
+        return self._write_columnar(
+            fmt,
+            filename,
+            "personal",
+            PERSONAL_RECORD_COLUMNS,
+            PERSONAL_RECORD_COLUMN_TYPES,
+            (_personal_record_row(record) for record in records),
+        )
+
+    def export_batch(
+        self,
+        results: List[BatchAccountResult],
+        fmt: str = "xlsx",
+        filename: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        以指定格式匯出多帳號批次結果
+
+        xlsx 同 export_batch_to_excel;其他格式只輸出所有帳號的加班記錄
+        (第一欄為帳號),逐帳號串流寫出。
+
+        Args:
+            results: 批次計算結果
+            fmt: 匯出格式 (EXPORT_FORMATS)
+            filename: 檔案路徑 (可選)
+
+        Returns:
+            str: 匯出的檔案路徑,失敗則返回 None
+        """
+        if fmt == "xlsx":
+            return self.export_batch_to_excel(results, filename)
+        if not results:
+            logger.warning("沒有結果可匯出")
+            return None
+
+        return self._write_columnar(
+            fmt,
+            filename,
+            "batch",
+            ("帳號",) + RECORD_COLUMNS,
+            ("string",) + RECORD_COLUMN_TYPES,
+            (
+                (result.username,) + _record_row(record)
+                for result in results
+                if result.report
+                for record in result.report.records
+            ),
+        )
+
+    def _write_columnar(
+        self,
+        fmt: str,
+        filename: Optional[str],
+        label: Optional[str],
+        columns,
+        types,
+        rows: Iterable[Sequence],
+    ) -> Optional[str]:
+        """以欄位式 writer 串流寫出,返回檔案路徑 (失敗返回 None)"""
+        try:
+            writer_class = get_writer(fmt)
+            filename = filename or (
+                f"reports/{self.make_filename(label, writer_class.extension)}"
+            )
+            Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+            with writer_class(filename, columns, types) as writer:
+                writer.write_rows(rows)
+
+            logger.info(f"✓ 已匯出 {writer.rows_written} 筆至: {filename}")
             return filename
 
         except Exception as e:
-            logger.error(f"✗ 匯出 Excel 時發生錯誤: {e}")
+            logger.error(f"✗ 匯出 {fmt} 時發生錯誤: {e}")
+            return None
+
+    def make_filename(
+        self, label: Optional[str] = None, extension: str = ".xlsx"
+    ) -> str:
+        """
+        產生預設匯出檔名
+
+        Args:
+            label: 附加於檔名的標籤 (例如帳號),不合法的字元會被取代
+            extension: 副檔名
+
+        Returns:
+            str: 檔案名稱 (不含資料夾)
+        """
+        parts = [self.settings.EXCEL_FILENAME_PREFIX]
+        if label:
+            parts.append(re.sub(r"[^\w.-]", "_", label))
+        parts.append(datetime.now().strftime("%Y%m%d_%H%M%S"))
+        return "_".join(parts) + extension
+
+    def export_batch_to_excel(
+        self, results: List[BatchAccountResult], filename: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        將多帳號批次計算結果匯出為單一 Excel 檔案
+
+        - 「帳號摘要」工作表: 每個帳號的狀態與統計
+        - 「加班記錄」工作表: 所有帳號的記錄 (含帳號欄位)
+
+        Args:
+            results: 批次計算結果
+            filename: 檔案路徑 (可選)
+
+        Returns:
+            str: 匯出的檔案路徑,失敗則返回 None
+        """
+        if not results:
+            logger.warning("沒有結果可匯出")
+            return None
+
+        filename = filename or f"reports/{self.make_filename('batch')}"
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            from openpyxl import Workbook
+
+            workbook = Workbook(write_only=True)
+            self._write_sheet(
+                workbook,
+                "帳號摘要",
+                BATCH_SUMMARY_COLUMNS,
+                BATCH_SUMMARY_COLUMN_WIDTHS,
+                (_batch_summary_row(result) for result in results),
+            )
+            self._write_sheet(
+                workbook,
+                "加班記錄",
+                BATCH_RECORD_COLUMNS,
+                BATCH_RECORD_COLUMN_WIDTHS,
+                (
+                    (result.username,) + _record_row(record)
+                    for result in results
+                    if result.report
+                    for record in result.report.records
+                ),
+            )
+            workbook.save(filename)
+
+            logger.info(f"✓ 已匯出批次結果至: {filename}")
+            return filename
+
+        except Exception as e:
+            logger.error(f"✗ 匯出批次結果時發生錯誤: {e}")
             return None
 
     def generate_text_report(
-        self, report: OvertimeReport, show_all: bool = True
+        self,
+        report: OvertimeReport,
+        show_all: bool = True,
+        output: Optional[TextIO] = None,
     ) -> str:
         """
         生成文字報表
@@ -122,53 +607,75 @@ class ExportService:
         Args:
             report: 加班報表
             show_all: 是否顯示所有記錄 (包含無加班的)
+            output: 可寫入的文字檔案物件 (可選);指定時逐行寫入,不組成完整字串
 
         Returns:
-            str: 報表文字
+            str: 報表文字 (指定 output 時返回空字串)
+        """
+        lines = self.iter_text_report(report, show_all)
+        if output is None:
+            return "".join(lines)
+        output.writelines(lines)
+        return ""
+
+    def iter_text_report(
+        self, report: OvertimeReport, show_all: bool = True
+    ) -> Iterator[str]:
+        """
+        逐行產生文字報表 (每行含換行字元)
+
+        表格使用固定欄寬,依顯示寬度對齊中文欄位名稱,
+        不需先掃描全部記錄計算欄寬。
+
+        Args:
+            report: 加班報表
+            show_all: 是否顯示所有記錄 (包含無加班的)
+
+        Yields:
+            str: 報表的一行
         """
         if not report.records:
-            return "沒有找到任何出勤記錄"
+            yield "沒有找到任何出勤記錄"
+            return
 
-        text = "\n" + "=" * 80 + "\n"
-        text += f"{'加班時數統計報表':^70}\n"
-        text += (
-            f"{'產生時間: ' + report.generated_at.strftime('%Y-%m-%d %H:%M:%S'):^70}\n"
-        )
-        text += "=" * 80 + "\n\n"
+        yield "\n"
+        yield "=" * TEXT_REPORT_WIDTH + "\n"
+        yield pad("加班時數統計報表", TEXT_REPORT_WIDTH, "^").rstrip() + "\n"
+        generated_at = report.generated_at.strftime("%Y-%m-%d %H:%M:%S")
+        yield pad(f"產生時間: {generated_at}", TEXT_REPORT_WIDTH, "^").rstrip() + "\n"
+        yield "=" * TEXT_REPORT_WIDTH + "\n\n"
 
-        # 準備資料
-        data = []
+        rows = 0
         for record in report.records:
-            if show_all or record.overtime_hours > 0:
-                data.append(
-                    {
-                        "日期": record.date,
-                        "上班時間": record.start_time,
-                        "下班時間": record.end_time,
-                        "加班時數": record.overtime_hours,
-                    }
+            if not (show_all or record.overtime_hours > 0):
+                continue
+            if rows == 0:
+                yield _text_row(name for name, _ in TEXT_REPORT_COLUMNS)
+            yield _text_row(
+                (
+                    record.date,
+                    record.start_time,
+                    record.end_time,
+                    f"{record.overtime_hours:.2f}",
                 )
+            )
+            rows += 1
 
-        if data:
-            df = pd.DataFrame(data)
-            text += df.to_string(index=False)
-        else:
-            text += "沒有加班記錄\n"
+        if rows == 0:
+            yield "沒有加班記錄\n"
 
         # 統計資訊
         summary = report.get_summary()
-        text += "\n\n" + "-" * 80 + "\n"
-        text += "統計資訊:\n"
-        text += "-" * 80 + "\n"
-        text += f"記錄天數: {summary['記錄天數']} 天\n"
-        text += f"加班天數: {summary['加班天數']} 天\n"
-        text += f"總加班時數: {summary['總加班時數']} 小時\n"
-        text += f"平均每日加班: {summary['平均每日加班']} 小時\n"
-        text += f"最長加班: {summary['最長加班']} 小時\n"
+        yield "\n" + "-" * TEXT_REPORT_WIDTH + "\n"
+        yield "統計資訊:\n"
+        yield "-" * TEXT_REPORT_WIDTH + "\n"
+        yield f"記錄天數: {summary['記錄天數']} 天\n"
+        yield f"加班天數: {summary['加班天數']} 天\n"
+        yield f"總加班時數: {summary['總加班時數']} 小時\n"
+        yield f"平均每日加班: {summary['平均每日加班']} 小時\n"
+        yield f"最長加班: {summary['最長加班']} 小時\n"
 
         if summary["最長加班日期"]:
-            text += f"最長加班日期: {summary['最長加班日期']}\n"
-
-        text += "=" * 80 + "\n"
+            yield f"最長加班日期: {summary['最長加班日期']}\n"
 
-        return text
+        yield "=" * TEXT_REPORT_WIDTH + "\n"
@@ -0,0 +1,113 @@
+"""啟動資料並行抓取"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from ..utils.http import clone_session
+
+logger = logging.getLogger(__name__)
+
+FetchTask = Callable[[requests.Session], Any]
+ResultCallback = Callable[["FetchResult"], None]
+
+
+@dataclass
+class FetchResult:
+    """單一抓取工作的結果"""
+
+    name: str
+    value: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class FetchOrchestrator:
+    """
+    並行執行彼此獨立的抓取工作
+
+    各工作只共用登入狀態,因此以複製的 session 同時執行,
+    完成後將伺服器更新的 cookie 合併回原 session;
+    每個工作完成時立即回報結果,不等待其他工作。
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: 最大執行緒數 (預設與工作數相同)
+        """
+        self.max_workers = max_workers
+        self._cookie_lock = threading.Lock()
+
+    def run(
+        self,
+        session: requests.Session,
+        tasks: Dict[str, FetchTask],
+        on_result: Optional[ResultCallback] = None,
+    ) -> Dict[str, FetchResult]:
+        """
+        執行所有工作並等待完成
+
+        Args:
+            session: 已登入的 Session
+            tasks: {工作名稱: task(session)}
+            on_result: 每個工作完成時呼叫 (在背景執行緒,依完成順序)
+
+        Returns:
+            Dict[str, FetchResult]: 各工作的結果
+        """
+        if not tasks:
+            return {}
+
+        workers = max(1, min(self.max_workers or len(tasks), len(tasks)))
+        results: Dict[str, FetchResult] = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._run_task, session, name, task): name
+                for name, task in tasks.items()
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.name] = result
+                if on_result:
+                    try:
+                        on_result(result)
+                    except Exception as e:
+                        logger.error(f"處理 {result.name} 結果時發生錯誤: {e}", exc_info=True)
+
+        return {name: results[name] for name in tasks}
+
+    def _run_task(
+        self, session: requests.Session, name: str, task: FetchTask
+    ) -> FetchResult:
+        """以複製的 session 執行單一工作,並將 cookie 合併回原 session"""
+        task_session = clone_session(session)
+        original = _cookie_values(task_session)
+        try:
+            return FetchResult(name, value=task(task_session))
+        except Exception as e:
+            logger.warning(f"✗ {name} 抓取失敗: {e}")
+            return FetchResult(name, error=e)
+        finally:
+            # 只合併此工作期間新增或變更的 cookie,不覆寫其他工作的更新
+            with self._cookie_lock:
+                for cookie in task_session.cookies:
+                    key = (cookie.domain, cookie.path, cookie.name)
+                    if original.get(key) != cookie.value:
+                        session.cookies.set_cookie(cookie)
+
+
+def _cookie_values(session: requests.Session) -> Dict[tuple, Optional[str]]:
+    """取得 session 目前的 cookie {(domain, path, name): value}"""
+    return {
+        (cookie.domain, cookie.path, cookie.name): cookie.value
+        for cookie in session.cookies
+    }
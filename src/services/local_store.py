@@ -0,0 +1,245 @@
+"""本機資料存放服務 (SQLite)"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ..config import Settings
+from ..models.personal_record import PersonalRecord
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attendance (
+    user TEXT NOT NULL,
+    day TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time_range TEXT NOT NULL,
+    PRIMARY KEY (user, day, time_range)
+);
+CREATE TABLE IF NOT EXISTS personal_records (
+    user TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    date TEXT NOT NULL,
+    content TEXT NOT NULL,
+    status TEXT NOT NULL,
+    overtime_hours REAL NOT NULL,
+    monthly_total REAL NOT NULL,
+    quarterly_total REAL NOT NULL,
+    report_type TEXT NOT NULL,
+    PRIMARY KEY (user, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_personal_records_day ON personal_records (user, day);
+CREATE TABLE IF NOT EXISTS sync_state (
+    user TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (user, kind)
+);
+"""
+
+ATTENDANCE = "attendance"
+PERSONAL_RECORDS = "personal_records"
+
+
+class LocalStore:
+    """
+    本機資料存放服務
+
+    以使用者帳號與日期為鍵儲存出勤異常記錄與個人記錄,
+    讓啟動時可立即顯示上次的資料,再於背景進行增量同步。
+
+    - 出勤異常: 只取代本次抓取涵蓋的日期 (較舊的記錄保留),
+      超出線上清單範圍 (MAX_PAGES 頁) 的舊記錄會被刪除
+    - 個人記錄: FW21003Z 一次回傳全部記錄,每次同步整批取代
+    """
+
+    def __init__(
+        self, db_path: Optional[Path] = None, settings: Optional[Settings] = None
+    ) -> None:
+        self.settings = settings or Settings()
+        self.db_path = Path(db_path or self.settings.LOCAL_STORE_PATH)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def load_attendance(self, user: str) -> List[Dict]:
+        """
+        讀取出勤異常記錄
+
+        Args:
+            user: 使用者帳號
+
+        Returns:
+            List[Dict]: 依日期由新到舊 [{'date': ..., 'time_range': ...}]
+        """
+        with self._lock, closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT date, time_range FROM attendance WHERE user = ? "
+                "ORDER BY day DESC, time_range",
+                (user,),
+            ).fetchall()
+        return [{"date": row[0], "time_range": row[1]} for row in rows]
+
+    def merge_attendance(
+        self, user: str, records: Iterable[Dict], since: Optional[date] = None
+    ) -> int:
+        """
+        合併出勤異常記錄
+
+        清單依日期由新到舊,本次結果涵蓋最舊一筆記錄的日期 (含) 之後;
+        只有這段期間 (且不早於 since) 的舊記錄會被取代,抓取中斷或
+        沒有回傳任何記錄時不會刪除未涵蓋日期的資料。
+        合併後只保留最新 MAX_PAGES × ATTENDANCE_PAGE_SIZE 筆所在的日期。
+
+        Args:
+            user: 使用者帳號
+            records: DataService 取得的記錄
+            since: 本次同步的起始日期
+
+        Returns:
+            int: 寫入的記錄數
+        """
+        rows = []
+        for record in records:
+            day = self._to_day(record["date"])
+            if day is None:
+                logger.warning("無法解析出勤日期,略過: %s", record["date"])
+                continue
+            rows.append((user, day, record["date"], record["time_range"]))
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            if rows:
+                covered_from = min(row[1] for row in rows)
+                if since is not None:
+                    covered_from = max(covered_from, since.isoformat())
+                conn.execute(
+                    "DELETE FROM attendance WHERE user = ? AND day >= ?",
+                    (user, covered_from),
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO attendance (user, day, date, time_range) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._prune_attendance(conn, user)
+            self._mark_synced(conn, user, ATTENDANCE)
+
+        logger.info("已同步 %d 筆出勤記錄至本機", len(rows))
+        return len(rows)
+
+    def attendance_sync_since(self, user: str) -> Optional[date]:
+        """
+        取得增量同步的起始日期
+
+        為最新一筆記錄日期往前 Settings.LOCAL_STORE_OVERLAP_DAYS 天,
+        尚未同步過時返回 None (需完整抓取)。
+        """
+        with self._lock, closing(self._connect()) as conn:
+            synced = conn.execute(
+                "SELECT 1 FROM sync_state WHERE user = ? AND kind = ?",
+                (user, ATTENDANCE),
+            ).fetchone()
+            latest = conn.execute(
+                "SELECT MAX(day) FROM attendance WHERE user = ?", (user,)
+            ).fetchone()[0]
+
+        if not synced or not latest:
+            return None
+
+        overlap = timedelta(days=self.settings.LOCAL_STORE_OVERLAP_DAYS)
+        return date.fromisoformat(latest) - overlap
+
+    def load_personal_records(self, user: str) -> List[PersonalRecord]:
+        """讀取個人記錄 (維持查詢頁面的原始順序)"""
+        with self._lock, closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT date, content, status, overtime_hours, monthly_total, "
+                "quarterly_total, report_type FROM personal_records "
+                "WHERE user = ? ORDER BY seq",
+                (user,),
+            ).fetchall()
+        return [PersonalRecord(*row) for row in rows]
+
+    def replace_personal_records(self, user: str, records: Iterable[PersonalRecord]):
+        """以最新查詢結果取代個人記錄 (簽核狀態可能變動,需整批更新)"""
+        rows = [
+            (
+                user,
+                seq,
+                self._to_day(record.date) or record.date,
+                record.date,
+                record.content,
+                record.status,
+                record.overtime_hours,
+                record.monthly_total,
+                record.quarterly_total,
+                record.report_type,
+            )
+            for seq, record in enumerate(records)
+        ]
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM personal_records WHERE user = ?", (user,))
+            conn.executemany(
+                "INSERT INTO personal_records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._mark_synced(conn, user, PERSONAL_RECORDS)
+
+        logger.info("已同步 %d 筆個人記錄至本機", len(rows))
+
+    def get_synced_at(self, user: str, kind: str = ATTENDANCE) -> Optional[datetime]:
+        """取得最後同步時間"""
+        with self._lock, closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT synced_at FROM sync_state WHERE user = ? AND kind = ?",
+                (user, kind),
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def clear(self, user: Optional[str] = None):
+        """清除本機資料 (未指定使用者時清除全部)"""
+        where, params = ("WHERE user = ?", (user,)) if user else ("", ())
+        with self._lock, closing(self._connect()) as conn, conn:
+            for table in ("attendance", "personal_records", "sync_state"):
+                conn.execute(f"DELETE FROM {table} {where}", params)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 每次操作使用獨立連線,可安全地在背景執行緒中呼叫
+        return sqlite3.connect(self.db_path)
+
+    def _prune_attendance(self, conn: sqlite3.Connection, user: str):
+        """刪除超出線上清單範圍 (最新 MAX_PAGES 頁) 的舊記錄"""
+        limit = self.settings.MAX_PAGES * self.settings.ATTENDANCE_PAGE_SIZE
+        row = conn.execute(
+            "SELECT day FROM attendance WHERE user = ? "
+            "ORDER BY day DESC LIMIT 1 OFFSET ?",
+            (user, limit - 1),
+        ).fetchone()
+        if row:
+            conn.execute(
+                "DELETE FROM attendance WHERE user = ? AND day < ?", (user, row[0])
+            )
+
+    def _mark_synced(self, conn: sqlite3.Connection, user: str, kind: str):
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_state (user, kind, synced_at) VALUES (?, ?, ?)",
+            (user, kind, datetime.now().isoformat(timespec="seconds")),
+        )
+
+    def _to_day(self, date_str: str) -> Optional[str]:
+        """將 YYYY/MM/DD 轉為可排序的 ISO 日期字串"""
+        try:
+            return datetime.strptime(date_str, self.settings.DATE_FORMAT).date().isoformat()
+        except ValueError:
+            return None
@@ -0,0 +1,147 @@
+"""個人紀錄查詢共用擷取服務"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+import requests
+
+from ..config import Settings
+from ..models import OvertimeHistory
+from ..utils.html import make_soup
+from ..utils.metrics import track_parse
+from ..utils.single_flight import SingleFlight
+from .overtime_status_service import OvertimeStatusService
+from .personal_record_service import PersonalRecordService
+
+logger = logging.getLogger(__name__)
+
+
+class OvertimeHistoryService:
+    """
+    個人紀錄查詢共用擷取服務
+
+    職責:
+    - 下載 FW21003Z.aspx (ddlPage=9999) 並只解析一次
+    - 同時產生已申請狀態 (SubmittedRecord) 與個人記錄 (PersonalRecord)
+    - 在短暫的有效期限內快取結果,避免同一次重新整理重複下載
+    - 同一個登入 session 同時的查詢 (含強制重新下載) 合併為一次請求;
+      invalidate 之後的查詢不會共用之前已開始的下載
+      (送出申請後先 invalidate,狀態更新才不會拿到送出前的結果)
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or Settings()
+        self.url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_STATUS_URL}"
+
+        # 僅用於解析表格,不會自行發出請求
+        self._status_parser = OvertimeStatusService(self.settings)
+        self._personal_parser = PersonalRecordService(
+            self.settings.SSP_BASE_URL, settings=self.settings
+        )
+
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._cached: Optional[OvertimeHistory] = None
+        self._cached_session: Optional[requests.Session] = None
+        self._cached_at = 0.0
+        # invalidate 時遞增: 捨棄先前已開始的下載結果,
+        # 並作為合併請求鍵值的一部分,讓之後的呼叫不會共用先前的下載
+        self._epoch = 0
+
+    def fetch(self, session: requests.Session, force: bool = False) -> OvertimeHistory:
+        """
+        取得個人紀錄查詢結果
+
+        同時呼叫時,後到的呼叫會等待進行中的請求完成並共用其結果;
+        force 的呼叫忽略快取,但仍共用同一世代進行中的下載
+        (需要捨棄進行中的下載時先呼叫 invalidate)
+
+        Args:
+            session: 已登入的 Session
+            force: 是否忽略快取強制重新下載
+
+        Returns:
+            OvertimeHistory: 查詢結果
+
+        Raises:
+            requests.RequestException: 網路錯誤
+        """
+        with self._lock:
+            if not force and self._is_cache_valid(session):
+                logger.debug("使用快取的個人紀錄查詢結果")
+                return self._cached
+            epoch = self._epoch
+
+        return self._flight.do(
+            (_session_key(session), epoch), self._download, session, epoch
+        )
+
+    def _download(self, session: requests.Session, epoch: int) -> OvertimeHistory:
+        """
+        下載並解析個人紀錄查詢頁面,更新快取
+
+        Args:
+            session: 已登入的 Session
+            epoch: 開始下載時的世代 (之後已 invalidate 則不寫入快取)
+        """
+        logger.info("開始查詢個人紀錄 (不換頁模式)")
+
+        # 使用 ddlPage=9999 一次取得所有記錄
+        params = {"ctl00$ContentPlaceHolder1$ddlPage": "9999"}
+
+        response = session.get(
+            self.url,
+            params=params,
+            timeout=self.settings.REQUEST_TIMEOUT,
+            verify=self.settings.VERIFY_SSL,
+        )
+        response.raise_for_status()
+
+        with track_parse(response):
+            soup = make_soup(response.text, self.settings.HTML_PARSER)
+
+            personal_records = self._personal_parser._parse_personal_records_table(
+                soup
+            )
+            history = OvertimeHistory(
+                submitted_records=self._status_parser._parse_status_table(soup),
+                personal_records=personal_records,
+                summary=self._personal_parser._calculate_summary(personal_records),
+            )
+
+        with self._lock:
+            if epoch == self._epoch:
+                self._cached = history
+                self._cached_session = session
+                self._cached_at = time.monotonic()
+
+        logger.info(
+            "✓ 個人紀錄查詢完成: %d 筆記錄, %d 筆已申請日期",
+            len(history.personal_records),
+            len(history.submitted_records),
+        )
+        return history
+
+    def invalidate(self):
+        """清除快取,並讓之後的查詢不共用進行中的下載 (例如送出申請後)"""
+        with self._lock:
+            self._cached = None
+            self._cached_session = None
+            self._cached_at = 0.0
+            self._epoch += 1
+
+    def _is_cache_valid(self, session: requests.Session) -> bool:
+        """檢查快取是否可用 (同一 session 且未逾期)"""
+        if self._cached is None or self._cached_session is not session:
+            return False
+        return time.monotonic() - self._cached_at < self.settings.OVERTIME_HISTORY_TTL
+
+
+def _session_key(session: requests.Session):
+    """合併請求的鍵值: 同一個登入 (clone_session 的複本共用 ASP.NET_SessionId)"""
+    for cookie in session.cookies:
+        if cookie.name == "ASP.NET_SessionId":
+            return cookie.value
+    return id(session)
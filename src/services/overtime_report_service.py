@@ -1,16 +1,27 @@
 """加班補報表單填寫服務"""
 
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 import requests
-from bs4 import BeautifulSoup
 import urllib3
 
 from ..config import Settings
 from ..models import OvertimeSubmissionRecord
+from ..utils.aspnet import ViewState, extract_viewstate
+from ..utils.html import make_soup
+from ..utils.http import SessionExpiredError
+from ..utils.metrics import track_parse
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 申請單上每一個可填寫的輸入列都有一個日期欄位
+_FORM_ROW_PATTERN = re.compile(
+    rb"name=[\"']ctl00\$ContentPlaceHolder1\$gvFlow211i\$ctl\d+\$txtOT_Datei[\"']"
+)
+
 
 class OvertimeReportService:
     """加班補報表單填寫服務"""
@@ -34,26 +45,11 @@ class OvertimeReportService:
         Returns:
             預覽結果
         """
-        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
-
         try:
             logger.info(f"正在預覽填寫 {len(records)} 筆記錄...")
 
-            # 取得初始頁面
-            response = session.get(
-                url,
-                timeout=self.settings.REQUEST_TIMEOUT,
-                verify=self.settings.VERIFY_SSL,
-            )
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 如果需要多筆記錄,先增加列
-            if len(records) > 1:
-                soup = self._add_form_rows(session, soup, len(records) - 1)
-
             # 構建表單資料
-            form_data = self._build_form_data(soup, records)
+            form_data = self._with_form_retry(session, records, self._prepare_form)
 
             preview_result = {
                 "success": True,
@@ -99,40 +95,10 @@ class OvertimeReportService:
                 "error": "此功能尚在測試階段,無法實際送出。請使用「預覽填寫」功能。",
             }
 
-        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
-
         try:
             logger.info(f"正在送出 {len(records)} 筆加班申請...")
 
-            # 取得初始頁面
-            response = session.get(
-                url,
-                timeout=self.settings.REQUEST_TIMEOUT,
-                verify=self.settings.VERIFY_SSL,
-            )
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 如果需要多筆記錄,先增加列
-            if len(records) > 1:
-                soup = self._add_form_rows(session, soup, len(records) - 1)
-
-            # 構建表單資料
-            form_data = self._build_form_data(soup, records)
-
-            # 加入送出按鈕
-            form_data["ctl00$ContentPlaceHolder1$btnCommit"] = "送出"
-
-            # 送出表單
-            response = session.post(
-                url,
-                data=form_data,
-                timeout=self.settings.REQUEST_TIMEOUT,
-                verify=self.settings.VERIFY_SSL,
-            )
-
-            # 檢查送出結果
-            success = self._check_submission_result(response.text)
+            success = self._with_form_retry(session, records, self._submit_records)
 
             if success:
                 logger.info(f"✓ 成功送出 {len(records)} 筆加班申請")
@@ -145,19 +111,108 @@ class OvertimeReportService:
             logger.error(f"✗ 送出失敗: {e}")
             return {"success": False, "error": str(e)}
 
+    def _with_form_retry(
+        self,
+        session: requests.Session,
+        records: List[OvertimeSubmissionRecord],
+        func: Callable[[requests.Session, List[OvertimeSubmissionRecord]], T],
+    ) -> T:
+        """
+        執行 func(session, records);PostBack 時 session 逾時則重新載入表單再執行一次
+
+        逾時的 PostBack 未被伺服器處理 (守衛已重新登入,不會重送),
+        重新載入表單頁面取得新的 ViewState 後重做即可。
+        """
+        try:
+            return func(session, records)
+        except SessionExpiredError:
+            logger.warning("申請單 session 逾時,重新載入表單...")
+            return func(session, records)
+
+    def _prepare_form(
+        self, session: requests.Session, records: List[OvertimeSubmissionRecord]
+    ) -> Dict[str, str]:
+        """
+        取得申請單頁面、補足輸入列並構建表單資料
+
+        Args:
+            session: 已登入的 Session
+            records: 要填寫的記錄
+
+        Returns:
+            表單資料字典
+        """
+        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
+
+        # 取得初始頁面
+        response = session.get(
+            url,
+            timeout=self.settings.REQUEST_TIMEOUT,
+            verify=self.settings.VERIFY_SSL,
+        )
+
+        # 只需要 PostBack 狀態,不建立 DOM
+        with track_parse(response):
+            viewstate = extract_viewstate(response.content)
+            # 頁面已有的輸入列可直接使用,只補不足的列
+            existing_rows = max(self._count_form_rows(response.content), 1)
+
+        if len(records) > existing_rows:
+            viewstate = self._add_form_rows(
+                session, viewstate, len(records) - existing_rows
+            )
+
+        return self._build_form_data(viewstate, records)
+
+    def _submit_records(
+        self, session: requests.Session, records: List[OvertimeSubmissionRecord]
+    ) -> bool:
+        """
+        填寫並送出申請單
+
+        Args:
+            session: 已登入的 Session
+            records: 要送出的記錄
+
+        Returns:
+            是否成功
+        """
+        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
+
+        form_data = self._prepare_form(session, records)
+
+        # 加入送出按鈕
+        form_data["ctl00$ContentPlaceHolder1$btnCommit"] = "送出"
+
+        # 送出表單
+        response = session.post(
+            url,
+            data=form_data,
+            timeout=self.settings.REQUEST_TIMEOUT,
+            verify=self.settings.VERIFY_SSL,
+        )
+
+        # 檢查送出結果
+        with track_parse(response):
+            return self._check_submission_result(response.text)
+
+    def _count_form_rows(self, content: bytes) -> int:
+        """計算申請單頁面上已有的輸入列數 (不建立 DOM)"""
+        return len(_FORM_ROW_PATTERN.findall(content))
+
     def _add_form_rows(
-        self, session: requests.Session, soup: BeautifulSoup, count: int
-    ) -> BeautifulSoup:
+        self, session: requests.Session, viewstate: Optional[ViewState], count: int
+    ) -> ViewState:
         """
         增加表單列
 
         Args:
             session: 已登入的 Session
-            soup: 當前頁面的 BeautifulSoup 物件
+            viewstate: 當前頁面的 ViewState
             count: 要增加的列數
 
         Returns:
-            更新後的 BeautifulSoup 物件
+            增加列後頁面的 ViewState
         """
         url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
 
@@ -165,13 +220,6 @@ class OvertimeReportService:
             for i in range(count):
                 logger.debug(f"正在增加第 {i + 1} 列...")
 
-                # 提取 ViewState
-                viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-                viewstate_generator = soup.find(
-                    "input", {"name": "__VIEWSTATEGENERATOR"}
-                )
-                event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
-
                 if not viewstate:
                     raise ValueError("找不到 ViewState")
 
@@ -179,13 +227,7 @@ class OvertimeReportService:
                 post_data = {
                     "__EVENTTARGET": "ctl00$ContentPlaceHolder1$lbgvAddRowi",
                     "__EVENTARGUMENT": "",
-                    "__VIEWSTATE": viewstate["value"],
-                    "__VIEWSTATEGENERATOR": (
-                        viewstate_generator["value"] if viewstate_generator else ""
-                    ),
-                    "__EVENTVALIDATION": (
-                        event_validation["value"] if event_validation else ""
-                    ),
+                    **viewstate.to_form_data(),
                 }
 
                 # 發送 PostBack 請求
@@ -196,44 +238,39 @@ class OvertimeReportService:
                     verify=self.settings.VERIFY_SSL,
                 )
 
-                # 更新 soup
-                soup = BeautifulSoup(response.text, "html.parser")
+                # 更新 ViewState (不需建立 DOM)
+                with track_parse(response):
+                    viewstate = extract_viewstate(response.content)
+
+            if not viewstate:
+                raise ValueError("找不到 ViewState")
 
             logger.debug(f"✓ 成功增加 {count} 列")
-            return soup
+            return viewstate
 
         except Exception as e:
             logger.error(f"✗ 增加列失敗: {e}")
             raise
 
     def _build_form_data(
-        self, soup: BeautifulSoup, records: List[OvertimeSubmissionRecord]
+        self,
+        viewstate: Optional[ViewState],
+        records: List[OvertimeSubmissionRecord],
     ) -> Dict[str, str]:
         """
         構建表單資料
 
         Args:
-            soup: BeautifulSoup 物件
+            viewstate: 表單頁面的 ViewState
             records: 記錄列表
 
         Returns:
             表單資料字典
         """
-        # 提取 ViewState 等必要欄位
-        viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-        viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})
-        event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
-
         if not viewstate:
             raise ValueError("找不到 ViewState")
 
-        form_data = {
-            "__VIEWSTATE": viewstate["value"],
-            "__VIEWSTATEGENERATOR": (
-                viewstate_generator["value"] if viewstate_generator else ""
-            ),
-            "__EVENTVALIDATION": event_validation["value"] if event_validation else "",
-        }
+        form_data = viewstate.to_form_data()
 
         # 填寫每筆記錄 (第一筆從 ctl03 開始,0-based index)
         for index, record in enumerate(records):
@@ -278,7 +315,7 @@ class OvertimeReportService:
             是否成功
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, self.settings.HTML_PARSER)
 
             # 檢查是否有明確的錯誤訊息
             error_indicators = [
@@ -3,36 +3,55 @@
 import requests
 from bs4 import BeautifulSoup
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, TYPE_CHECKING
 import urllib3
 
 from ..config import Settings
+from ..utils.html import make_soup
+from ..utils.metrics import track_parse
 from ..models import SubmittedRecord
 
+if TYPE_CHECKING:
+    from .overtime_history_service import OvertimeHistoryService
+
 logger = logging.getLogger(__name__)
 
 
 class OvertimeStatusService:
     """加班申請狀態查詢服務 - 查詢已申請的加班記錄"""
 
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        history_service: Optional["OvertimeHistoryService"] = None,
+    ):
         self.settings = settings or Settings()
+        self.history_service = history_service
 
         if not self.settings.VERIFY_SSL:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     def fetch_submitted_records(
-        self, session: requests.Session
+        self, session: requests.Session, force: bool = False
     ) -> Dict[str, SubmittedRecord]:
         """
         查詢已申請的加班記錄
 
         Args:
             session: 已登入的 Session
+            force: 是否忽略共用快取 (僅在設定 history_service 時有效)
 
         Returns:
             字典 {日期: SubmittedRecord}
         """
+        if self.history_service:
+            try:
+                history = self.history_service.fetch(session, force=force)
+                return dict(history.submitted_records)
+            except Exception as e:
+                logger.error(f"✗ 查詢已申請記錄失敗: {e}")
+                return {}
+
         url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_STATUS_URL}"
         submitted_records = {}
 
@@ -49,10 +68,11 @@ class OvertimeStatusService:
                 verify=self.settings.VERIFY_SSL,
             )
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            with track_parse(response):
+                soup = make_soup(response.text, self.settings.HTML_PARSER)
 
-            # 解析所有資料 (不需要分頁)
-            records = self._parse_status_table(soup)
+                # 解析所有資料 (不需要分頁)
+                records = self._parse_status_table(soup)
             submitted_records.update(records)
 
             logger.info(f"✓ 已查詢 {len(submitted_records)} 筆已申請記錄")
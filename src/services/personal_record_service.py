@@ -1,10 +1,16 @@
 """個人加班記錄查詢服務"""
 
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple, TYPE_CHECKING
 import requests
 from bs4 import BeautifulSoup
+from ..config import Settings
 from ..models.personal_record import PersonalRecord, PersonalRecordSummary
+from ..utils.html import make_soup
+from ..utils.metrics import track_parse
+
+if TYPE_CHECKING:
+    from .overtime_history_service import OvertimeHistoryService
 
 logger = logging.getLogger(__name__)
 
@@ -19,24 +25,34 @@ class PersonalRecordService:
     - 解析表格資料並計算統計數據
     """
 
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        history_service: Optional["OvertimeHistoryService"] = None,
+        settings: Optional[Settings] = None,
+    ):
         """
         初始化個人記錄服務
 
         Args:
             base_url: SSP 系統基礎 URL
+            history_service: 共用的個人紀錄查詢服務 (可選,與已申請狀態共用同一次下載)
+            settings: 系統設定 (可選,用於選擇 HTML 解析器)
         """
+        self.settings = settings or Settings()
         self.base_url = base_url
         self.personal_record_url = f"{base_url}/FW21003Z.aspx"
+        self.history_service = history_service
 
     def fetch_personal_records(
-        self, session: requests.Session
+        self, session: requests.Session, force: bool = False
     ) -> Tuple[List[PersonalRecord], PersonalRecordSummary]:
         """
         查詢個人加班記錄並計算統計
 
         Args:
             session: 已登入的 session
+            force: 是否忽略共用快取 (僅在設定 history_service 時有效)
 
         Returns:
             Tuple[記錄列表, 統計摘要]
@@ -44,6 +60,14 @@ class PersonalRecordService:
         Raises:
             Exception: 查詢失敗時拋出異常
         """
+        if self.history_service:
+            try:
+                history = self.history_service.fetch(session, force=force)
+                return list(history.personal_records), history.summary
+            except requests.RequestException as error:
+                logger.error("個人記錄查詢失敗 (網路錯誤): %s", error)
+                raise Exception(f"網路錯誤: {error}") from error
+
         try:
             logger.info("開始查詢個人加班記錄 (不換頁模式)")
 
@@ -58,11 +82,10 @@ class PersonalRecordService:
             )
             response.raise_for_status()
 
-            # 解析 HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 解析記錄表格
-            records = self._parse_personal_records_table(soup)
+            # 解析 HTML 與記錄表格
+            with track_parse(response):
+                soup = make_soup(response.text, self.settings.HTML_PARSER)
+                records = self._parse_personal_records_table(soup)
 
             # 計算統計摘要
             summary = self._calculate_summary(records)
@@ -241,6 +264,18 @@ class PersonalRecordService:
             logger.warning("無法解析時數: %s", text)
             return 0.0
 
+    def summarize(self, records: List[PersonalRecord]) -> PersonalRecordSummary:
+        """
+        計算個人記錄統計摘要 (供本機快取資料使用)
+
+        Args:
+            records: 個人記錄列表
+
+        Returns:
+            統計摘要
+        """
+        return self._calculate_summary(records)
+
     def _calculate_summary(
         self, records: List[PersonalRecord]
     ) -> PersonalRecordSummary:
@@ -0,0 +1,213 @@
+"""
+欄位式匯出格式 (CSV / JSONL / Parquet)
+
+所有 writer 逐列寫入,不需先將全部資料載入記憶體;
+Parquet 需要選用套件 pyarrow,依 batch_size 分批寫出 row group,
+欄位型別由呼叫端以 types 明確指定。
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Type
+
+
+class RecordWriter:
+    """
+    逐列寫出的 writer 基底
+
+    使用方式:
+        with CsvRecordWriter(path, columns) as writer:
+            writer.write_rows(rows)
+    """
+
+    extension = ""
+
+    def __init__(
+        self, path, columns: Sequence[str], types: Optional[Sequence[str]] = None
+    ):
+        """
+        Args:
+            path: 輸出檔案路徑
+            columns: 欄位名稱 (每列的值依此順序)
+            types: 欄位型別 (string / int64 / float64,與 columns 對應);
+                   只有具型別的格式 (Parquet) 使用,未指定時全部為 string
+        """
+        self.path = Path(path)
+        self.columns = tuple(columns)
+        self.types = tuple(types) if types is not None else ("string",) * len(self.columns)
+        if len(self.types) != len(self.columns):
+            raise ValueError("欄位型別數量與欄位數量不符")
+        self.rows_written = 0
+
+    def write_row(self, row: Sequence):
+        """寫入一列"""
+        raise NotImplementedError
+
+    def write_rows(self, rows: Iterable[Sequence]):
+        """寫入多列 (可為產生器)"""
+        for row in rows:
+            self.write_row(row)
+
+    def close(self):
+        """完成寫入並關閉檔案"""
+        raise NotImplementedError
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvRecordWriter(RecordWriter):
+    """CSV (UTF-8 BOM,Excel 可直接開啟中文)"""
+
+    extension = ".csv"
+
+    def __init__(
+        self, path, columns: Sequence[str], types: Optional[Sequence[str]] = None
+    ):
+        super().__init__(path, columns, types)
+        self._file = open(self.path, "w", encoding="utf-8-sig", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write_row(self, row: Sequence):
+        self._writer.writerow(row)
+        self.rows_written += 1
+
+    def write_rows(self, rows: Iterable[Sequence]):
+        for row in rows:
+            self._writer.writerow(row)
+            self.rows_written += 1
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlRecordWriter(RecordWriter):
+    """換行分隔 JSON (每列一個物件,鍵為欄位名稱)"""
+
+    extension = ".jsonl"
+
+    def __init__(
+        self, path, columns: Sequence[str], types: Optional[Sequence[str]] = None
+    ):
+        super().__init__(path, columns, types)
+        self._file = open(self.path, "w", encoding="utf-8")
+
+    def write_row(self, row: Sequence):
+        self._file.write(json.dumps(dict(zip(self.columns, row)), ensure_ascii=False))
+        self._file.write("\n")
+        self.rows_written += 1
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetRecordWriter(RecordWriter):
+    """
+    Parquet (需要 pyarrow)
+
+    每累積 batch_size 列寫出一個 row group。schema 依 types 建立,
+    不從資料推斷 (第一批某欄全為 None 或整數時,後續批次才不會型別不符)。
+    """
+
+    extension = ".parquet"
+
+    def __init__(
+        self,
+        path,
+        columns: Sequence[str],
+        types: Optional[Sequence[str]] = None,
+        batch_size: int = 50_000,
+    ):
+        """
+        Raises:
+            ImportError: 未安裝 pyarrow
+            ValueError: 欄位型別數量不符或不是 pyarrow 型別名稱
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("匯出 Parquet 需要安裝 pyarrow (pip install pyarrow)") from e
+
+        super().__init__(path, columns, types)
+        self.schema = pa.schema(
+            [
+                (name, pa.type_for_alias(type_name))
+                for name, type_name in zip(self.columns, self.types)
+            ]
+        )
+        self.batch_size = batch_size
+        self._buffer: List[List] = [[] for _ in self.columns]
+        self._writer = None
+
+    def write_row(self, row: Sequence):
+        for values, value in zip(self._buffer, row):
+            values.append(value)
+        self.rows_written += 1
+        if len(self._buffer[0]) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._buffer[0] and self._writer is not None:
+            return
+
+        table = pa.table(
+            {name: values for name, values in zip(self.columns, self._buffer)},
+            schema=self.schema,
+        )
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(str(self.path), self.schema)
+        self._writer.write_table(table)
+        self._buffer = [[] for _ in self.columns]
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+WRITERS: Dict[str, Type[RecordWriter]] = {
+    "csv": CsvRecordWriter,
+    "jsonl": JsonlRecordWriter,
+    "parquet": ParquetRecordWriter,
+}
+
+
+def get_writer(fmt: str) -> Type[RecordWriter]:
+    """
+    取得格式對應的 writer 類別
+
+    Args:
+        fmt: 格式名稱 (csv / jsonl / parquet)
+
+    Raises:
+        ValueError: 不支援的格式
+    """
+    try:
+        return WRITERS[fmt.lower()]
+    except KeyError:
+        raise ValueError(f"不支援的匯出格式: {fmt}") from None
+
+
+def write_records(
+    fmt: str,
+    path,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+    types: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    以指定格式寫出資料列 (types 見 RecordWriter)
+
+    Returns:
+        int: 寫出的列數
+    """
+    with get_writer(fmt)(path, columns, types) as writer:
+        writer.write_rows(rows)
+        return writer.rows_written
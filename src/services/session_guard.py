@@ -0,0 +1,160 @@
+"""Session 逾時偵測與自動重新登入"""
+
+import logging
+import threading
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from ..config import Settings
+from ..utils.http import SspSession
+from .auth_service import AuthService
+
+logger = logging.getLogger(__name__)
+
+LOGIN_PAGE = "index.aspx"
+
+
+def _is_login_url(url: str) -> bool:
+    return urlparse(url or "").path.lower().endswith(f"/{LOGIN_PAGE}")
+
+
+class SessionGuard:
+    """
+    Session 逾時守衛
+
+    SSP 的 ASP.NET session 逾時後,所有頁面都會轉回登入頁,
+    服務端解析時只會看到「找不到出勤表格」或「找不到 ViewState」。
+    掛上守衛的 SspSession 偵測到轉址時,會在同一個 session 重新登入;
+    GET 請求直接重送,POST 則拋出 SessionExpiredError 由服務重新載入頁面。
+
+    密碼不保存在守衛中,重新登入時才由 password_provider 取得
+    (例如從 CredentialManager 讀取已儲存的憑證)。
+
+    平行請求 (clone_session 複製的 session) 共用同一個守衛:
+    同時逾時時只登入一次,其他 session 直接套用新的 cookie。
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password_provider: Callable[[], Optional[str]],
+        settings: Optional[Settings] = None,
+    ):
+        """
+        Args:
+            username: 帳號
+            password_provider: 重新登入時呼叫以取得密碼,返回 None 表示無法重新登入
+            settings: 系統設定
+        """
+        self.settings = settings or Settings()
+        self.username = username
+        self._password_provider: Optional[Callable[[], Optional[str]]] = (
+            password_provider
+        )
+        self._lock = threading.RLock()  # 重新登入本身的請求也會經過守衛
+        self._generation = 0
+        self._cookies = requests.cookies.RequestsCookieJar()
+        self.reauth_count = 0
+
+    @classmethod
+    def from_credential_manager(
+        cls, username: str, credential_manager, settings: Optional[Settings] = None
+    ) -> "SessionGuard":
+        """
+        建立以 CredentialManager 已儲存憑證重新登入的守衛
+
+        Args:
+            username: 帳號
+            credential_manager: CredentialManager
+            settings: 系統設定
+        """
+        return cls(
+            username, lambda: credential_manager.load_password(username), settings
+        )
+
+    def attach(self, session: SspSession) -> SspSession:
+        """
+        掛上守衛 (session 應已登入)
+
+        Args:
+            session: 已登入的 session
+
+        Returns:
+            SspSession: 同一個 session
+        """
+        with self._lock:
+            self._cookies.update(session.cookies)
+            session._guard_generation = self._generation
+        session.session_guard = self
+        return session
+
+    def detach(self, session: SspSession):
+        """移除守衛並停止重新登入 (登出時使用)"""
+        session.session_guard = None
+        self._password_provider = None
+
+    def sync(self, session: requests.Session) -> int:
+        """
+        套用其他 session 重新登入後取得的 cookie
+
+        Returns:
+            int: 目前的登入世代 (重新登入一次加一)
+        """
+        with self._lock:
+            if getattr(session, "_guard_generation", 0) != self._generation:
+                session.cookies.update(self._cookies)
+                session._guard_generation = self._generation
+            return self._generation
+
+    def is_expired(self, url: str, response: requests.Response) -> bool:
+        """
+        回應是否為 session 逾時 (被轉回登入頁)
+
+        Args:
+            url: 原本請求的網址
+            response: 回應
+        """
+        if _is_login_url(url):
+            return False
+        if response.is_redirect:
+            return LOGIN_PAGE in response.headers.get("Location", "").lower()
+        return bool(response.history) and _is_login_url(response.url)
+
+    def reauthenticate(self, session: requests.Session, generation: int) -> bool:
+        """
+        重新登入
+
+        若請求送出後已有其他 session 重新登入 (世代已變),直接套用新 cookie。
+
+        Args:
+            session: 逾時的 session
+            generation: 送出請求時的登入世代
+
+        Returns:
+            bool: 是否可以重送請求
+        """
+        with self._lock:
+            if generation != self._generation:
+                self.sync(session)
+                return True
+            password = self._password_provider() if self._password_provider else None
+            if not password:
+                logger.warning("SSP session 逾時,沒有已儲存的憑證可重新登入")
+                return False
+
+            logger.warning("偵測到 SSP session 逾時,重新登入...")
+            session.cookies.clear()
+            if not AuthService(self.settings, session=session).login(
+                self.username, password
+            ):
+                logger.error("✗ 自動重新登入失敗")
+                return False
+
+            self._generation += 1
+            self._cookies = requests.cookies.RequestsCookieJar()
+            self._cookies.update(session.cookies)
+            session._guard_generation = self._generation
+            self.reauth_count += 1
+            return True
@@ -0,0 +1,124 @@
+"""登入 session 保存服務"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import requests
+from requests.cookies import create_cookie
+
+from ..config import Settings
+
+if TYPE_CHECKING:
+    from .credential_manager import CredentialManager
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """
+    登入 session 保存服務
+
+    將 session 的 cookie 以 CredentialManager 的加密金鑰加密後存檔,
+    下次啟動時還原,若 ASP.NET session 仍有效即可省略登入流程。
+
+    安全考量:
+    - 檔案內容經 Fernet 加密,金鑰保存在系統 keyring
+    - 只還原給相同帳號使用,並有最長保存時間
+    - 登出時刪除
+    """
+
+    def __init__(
+        self,
+        credential_manager: "CredentialManager",
+        path: Optional[str] = None,
+        settings: Optional[Settings] = None,
+    ):
+        """
+        Args:
+            credential_manager: 提供加密金鑰的憑證管理器
+            path: 存檔路徑 (預設為 Settings.SESSION_STORE_PATH)
+            settings: 系統設定
+        """
+        self.settings = settings or Settings()
+        self.credential_manager = credential_manager
+        self.path = Path(path or self.settings.SESSION_STORE_PATH)
+
+    def save(self, username: str, session: requests.Session) -> bool:
+        """
+        加密保存 session 的 cookie
+
+        Args:
+            username: 登入帳號
+            session: 已登入的 session
+
+        Returns:
+            bool: 是否成功保存
+        """
+        payload = {
+            "username": username,
+            "saved_at": time.time(),
+            "cookies": [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "secure": cookie.secure,
+                    "expires": cookie.expires,
+                }
+                for cookie in session.cookies
+            ],
+        }
+
+        try:
+            token = self.credential_manager.encrypt(json.dumps(payload).encode("utf-8"))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_bytes(token)
+            logger.debug(f"已保存 session ({len(payload['cookies'])} 個 cookie)")
+            return True
+        except Exception as e:
+            logger.warning(f"保存 session 失敗: {e}")
+            return False
+
+    def restore(self, username: str, session: requests.Session) -> bool:
+        """
+        將保存的 cookie 還原到 session
+
+        帳號不符、已超過 SESSION_MAX_AGE 或無法解密時不還原。
+
+        Args:
+            username: 登入帳號
+            session: 要還原的 session
+
+        Returns:
+            bool: 是否已還原 cookie (仍需確認伺服器端 session 是否有效)
+        """
+        if not self.path.exists():
+            return False
+
+        try:
+            payload = json.loads(self.credential_manager.decrypt(self.path.read_bytes()))
+        except Exception as e:
+            logger.warning(f"無法讀取保存的 session,將重新登入: {e}")
+            self.clear()
+            return False
+
+        if payload.get("username") != username:
+            return False
+        if time.time() - payload.get("saved_at", 0) > self.settings.SESSION_MAX_AGE:
+            logger.info("保存的 session 已過期")
+            return False
+
+        for item in payload.get("cookies", []):
+            session.cookies.set_cookie(create_cookie(**item))
+        return bool(payload.get("cookies"))
+
+    def clear(self):
+        """刪除保存的 session"""
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"刪除保存的 session 失敗: {e}")
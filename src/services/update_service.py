@@ -11,6 +11,7 @@ import json
 import logging
 
 from ..core.version import get_current_version, is_newer_version, VERSION
+from ..utils.transport import get_transport
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class UpdateService:
         repo_owner: str = "jony-zhou",
         repo_name: str = "overtime-assistant",
         cache_duration_hours: int = 6,
+        session: Optional[requests.Session] = None,
     ):
         """
         初始化更新服務
@@ -38,10 +40,12 @@ class UpdateService:
             repo_owner: GitHub 倉庫擁有者
             repo_name: GitHub 倉庫名稱
             cache_duration_hours: 快取有效時長 (小時)
+            session: HTTP session (可選,預設使用共用連線池)
         """
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.cache_duration = timedelta(hours=cache_duration_hours)
+        self.session = session or get_transport().session()
         self.cache_file = Path("cache") / "update_cache.json"
         self.api_url = (
             f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
@@ -72,7 +76,7 @@ class UpdateService:
             # 每次啟動都檢查最新版本 (不使用快取)
             # 這確保使用者能及時收到更新通知
             logger.info(f"檢查更新: {self.api_url}")
-            response = requests.get(
+            response = self.session.get(
                 self.api_url,
                 timeout=timeout,
                 headers={"Accept": "application/vnd.github.v3+json"},
@@ -1,5 +1,31 @@
 """工具模組"""
 
 from .logger import setup_logging
+from .http import SessionExpiredError, SspSession, clone_session
+from .metrics import MetricsRegistry, RequestSpan, track_parse
+from .resilience import CircuitBreaker, CircuitOpenError, ResilienceLayer, RetryPolicy
+from .transport import Transport, get_transport
+from .html import make_soup
+from .aspnet import ViewState, extract_viewstate
+from .text_width import display_width, pad
 
-__all__ = ["setup_logging"]
+__all__ = [
+    "setup_logging",
+    "SessionExpiredError",
+    "SspSession",
+    "clone_session",
+    "MetricsRegistry",
+    "RequestSpan",
+    "track_parse",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ResilienceLayer",
+    "RetryPolicy",
+    "Transport",
+    "get_transport",
+    "make_soup",
+    "ViewState",
+    "extract_viewstate",
+    "display_width",
+    "pad",
+]
@@ -0,0 +1,72 @@
+"""ASP.NET WebForms 工具函式"""
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+# 只比對三個 PostBack 必要的隱藏欄位 (name 需完全相符,不比對 data-name=)
+_HIDDEN_INPUT_PATTERN = re.compile(
+    rb"<input\b[^>]*?\sname\s*=\s*[\"'](__VIEWSTATE|__VIEWSTATEGENERATOR|__EVENTVALIDATION)[\"'][^>]*>",
+    re.IGNORECASE,
+)
+# 屬性名稱前需為空白,避免比對到 data-value= 之類的屬性
+_VALUE_PATTERN = re.compile(
+    rb"(?:^|\s)value\s*=\s*([\"'])(.*?)\1", re.IGNORECASE | re.DOTALL
+)
+
+
+@dataclass(frozen=True)
+class ViewState:
+    """ASP.NET PostBack 狀態 (隱藏欄位)"""
+
+    viewstate: str
+    viewstate_generator: str = ""
+    event_validation: str = ""
+
+    def to_form_data(self) -> Dict[str, str]:
+        """轉換為 PostBack 表單欄位"""
+        return {
+            "__VIEWSTATE": self.viewstate,
+            "__VIEWSTATEGENERATOR": self.viewstate_generator,
+            "__EVENTVALIDATION": self.event_validation,
+        }
+
+
+def extract_viewstate(content: Union[str, bytes]) -> Optional[ViewState]:
+    """
+    從原始 HTML 擷取 ViewState 等隱藏欄位
+
+    直接以正規表示式掃描內容,不建立 DOM,
+    適用於只需要 PostBack 狀態的請求。
+
+    Args:
+        content: 回應內容 (response.content 或 response.text)
+
+    Returns:
+        ViewState: 找不到 __VIEWSTATE 時返回 None
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    fields = {}
+    for match in _HIDDEN_INPUT_PATTERN.finditer(content):
+        name = match.group(1).decode("ascii")
+        if name in fields:
+            continue  # 與 soup.find 相同,以第一個出現的欄位為準
+
+        value_match = _VALUE_PATTERN.search(match.group(0))
+        value = value_match.group(2).decode("utf-8", "replace") if value_match else ""
+        fields[name] = html.unescape(value)
+
+        if len(fields) == 3:
+            break
+
+    if "__VIEWSTATE" not in fields:
+        return None
+
+    return ViewState(
+        viewstate=fields["__VIEWSTATE"],
+        viewstate_generator=fields.get("__VIEWSTATEGENERATOR", ""),
+        event_validation=fields.get("__EVENTVALIDATION", ""),
+    )
@@ -0,0 +1,35 @@
+"""HTML 解析工具"""
+
+import logging
+from typing import Union
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSER = "html.parser"
+
+_warned_parsers = set()
+
+
+def make_soup(markup: Union[str, bytes], parser: str = DEFAULT_PARSER) -> BeautifulSoup:
+    """
+    建立 BeautifulSoup 物件
+
+    依設定選擇解析器後端 (例如 "lxml"),
+    若該解析器未安裝則退回內建的 html.parser。
+
+    Args:
+        markup: HTML 內容
+        parser: 解析器名稱 (Settings.HTML_PARSER)
+
+    Returns:
+        BeautifulSoup: 解析結果
+    """
+    try:
+        return BeautifulSoup(markup, parser)
+    except FeatureNotFound:
+        if parser not in _warned_parsers:
+            _warned_parsers.add(parser)
+            logger.warning(f"找不到 HTML 解析器 '{parser}',改用 {DEFAULT_PARSER}")
+        return BeautifulSoup(markup, DEFAULT_PARSER)
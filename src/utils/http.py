@@ -0,0 +1,138 @@
+"""HTTP 工具函式"""
+
+import time
+from typing import Optional
+
+import requests
+
+from .metrics import MetricsRegistry, RequestSpan, registry as default_registry
+from .resilience import ResilienceLayer
+
+
+# session 逾時重新登入後可直接重送的請求方法
+REPLAYABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+class SessionExpiredError(requests.RequestException):
+    """
+    PostBack 送出時 session 已逾時 (已重新登入,但請求未重送)
+
+    PostBack 的 ViewState 屬於逾時前的頁面,呼叫端應重新 GET 頁面後再送出。
+    """
+
+    def __init__(self, url: str):
+        super().__init__(f"SSP session 已逾時並重新登入,請重新載入頁面: {url}")
+        self.url = url
+
+
+class SspSession(requests.Session):
+    """
+    記錄請求計時的 Session
+
+    每次請求都會產生一筆 RequestSpan (URL、PostBack 目標、傳輸量、伺服器時間),
+    記錄到 MetricsRegistry,並附加於 response.span 供呼叫端補上解析時間。
+
+    設定 resilience 時,暫時性的連線錯誤依端點設定重試 (每次嘗試各記錄一筆 span);
+    設定 session_guard 時,回應被轉回登入頁 (session 逾時) 會先重新登入;
+    GET / HEAD 重送一次原本的請求,其他方法 (ASP.NET PostBack 帶有逾時前頁面的
+    ViewState,不能直接重送) 則拋出 SessionExpiredError,由呼叫端重新載入頁面。
+    """
+
+    def __init__(
+        self,
+        metrics: Optional[MetricsRegistry] = None,
+        resilience: Optional[ResilienceLayer] = None,
+    ):
+        super().__init__()
+        self.metrics = metrics or default_registry
+        self.resilience = resilience
+        self.session_guard = None  # SessionGuard (可選)
+
+    def request(self, method, url, *args, **kwargs):
+        guard = self.session_guard
+        if guard is None:
+            return self._send(method, url, *args, **kwargs)
+
+        generation = guard.sync(self)
+        response = self._send(method, url, *args, **kwargs)
+        if guard.is_expired(url, response) and guard.reauthenticate(self, generation):
+            response.close()
+            if method.upper() not in REPLAYABLE_METHODS:
+                raise SessionExpiredError(url)
+            response = self._send(method, url, *args, **kwargs)
+        return response
+
+    def _send(self, method, url, *args, **kwargs):
+        """送出請求 (設定 resilience 時依設定重試)"""
+        if self.resilience is None:
+            return self._timed_request(method, url, *args, **kwargs)
+        return self.resilience.execute(
+            method,
+            url,
+            kwargs.get("data"),
+            lambda attempt: self._timed_request(
+                method, url, *args, attempt=attempt, **kwargs
+            ),
+        )
+
+    def _timed_request(self, method, url, *args, attempt: int = 1, **kwargs):
+        """送出請求並記錄 RequestSpan"""
+        data = kwargs.get("data")
+        span = RequestSpan(
+            method=method.upper(),
+            url=url,
+            event_target=(
+                data.get("__EVENTTARGET", "") if isinstance(data, dict) else ""
+            ),
+            attempt=attempt,
+        )
+
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except Exception as e:
+            span.error = type(e).__name__
+            raise
+        else:
+            span.status = response.status_code
+            span.server_ms = response.elapsed.total_seconds() * 1000
+            if kwargs.get("stream"):
+                span.response_bytes = int(response.headers.get("Content-Length", 0))
+            else:
+                span.response_bytes = len(response.content)
+            response.span = span
+            return response
+        finally:
+            span.total_ms = (time.perf_counter() - start) * 1000
+            self.metrics.record(span)
+
+
+def clone_session(session: requests.Session) -> requests.Session:
+    """
+    複製 session
+
+    新的 session 帶有相同的 cookie、標頭與連線設定,
+    並共用原 session 的 adapter (連線池),可在其他執行緒獨立使用。
+
+    Args:
+        session: 來源 session
+
+    Returns:
+        requests.Session: 複製的 session
+    """
+    clone = type(session)()
+    clone.headers.clear()
+    clone.headers.update(session.headers)
+    clone.cookies.update(session.cookies)
+    clone.verify = session.verify
+    clone.proxies.update(session.proxies)
+    clone.auth = session.auth
+    if isinstance(session, SspSession):
+        clone.metrics = session.metrics
+        clone.resilience = session.resilience
+        clone.session_guard = session.session_guard
+
+    for prefix, adapter in session.adapters.items():
+        clone.mount(prefix, adapter)
+
+    return clone
@@ -0,0 +1,160 @@
+"""HTTP 請求計時與指標收集"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+# 記錄的 span 上限,超過時捨棄最舊的 (避免長時間執行時記憶體無限成長)
+DEFAULT_MAX_SPANS = 5000
+
+
+@dataclass
+class RequestSpan:
+    """單次 HTTP 請求的計時資料"""
+
+    method: str
+    url: str
+    event_target: str = ""  # ASP.NET PostBack 的 __EVENTTARGET
+    status: Optional[int] = None
+    response_bytes: int = 0
+    server_ms: float = 0.0  # 送出請求到收到回應標頭 (Response.elapsed)
+    total_ms: float = 0.0  # 含下載回應內容的總時間
+    parse_ms: float = 0.0  # 解析回應內容的時間
+    error: Optional[str] = None
+    attempt: int = 1  # 第幾次嘗試 (大於 1 為重試)
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def path(self) -> str:
+        """URL 路徑 (不含查詢字串)"""
+        return urlparse(self.url).path
+
+    def to_dict(self) -> Dict:
+        """轉換為可序列化的字典"""
+        return asdict(self)
+
+
+class MetricsRegistry:
+    """
+    行程內的請求指標登錄
+
+    由 SspSession 在每次請求後記錄 RequestSpan,
+    可依頁面與 PostBack 目標彙總,或輸出為 JSON 檔案。執行緒安全。
+    """
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS):
+        self._spans: deque = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def record(self, span: RequestSpan):
+        """記錄一筆 span"""
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self) -> List[RequestSpan]:
+        """取得目前所有 span (依記錄順序)"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """清除所有 span"""
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self) -> List[Dict]:
+        """
+        依 (方法, 路徑, PostBack 目標) 彙總
+
+        Returns:
+            List[Dict]: 每組的次數、錯誤數、重試數、傳輸量與各階段耗時 (毫秒),
+                        依總耗時由高到低排序
+        """
+        groups: Dict[tuple, Dict] = {}
+        for span in self.spans():
+            key = (span.method, span.path, span.event_target)
+            group = groups.setdefault(
+                key,
+                {
+                    "method": span.method,
+                    "path": span.path,
+                    "event_target": span.event_target,
+                    "count": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "response_bytes": 0,
+                    "server_ms": 0.0,
+                    "max_server_ms": 0.0,
+                    "total_ms": 0.0,
+                    "parse_ms": 0.0,
+                },
+            )
+            group["count"] += 1
+            group["errors"] += 1 if span.error else 0
+            group["retries"] += 1 if span.attempt > 1 else 0
+            group["response_bytes"] += span.response_bytes
+            group["server_ms"] += span.server_ms
+            group["max_server_ms"] = max(group["max_server_ms"], span.server_ms)
+            group["total_ms"] += span.total_ms
+            group["parse_ms"] += span.parse_ms
+
+        for group in groups.values():
+            group["avg_server_ms"] = group["server_ms"] / group["count"]
+            for key in ("server_ms", "max_server_ms", "total_ms", "parse_ms", "avg_server_ms"):
+                group[key] = round(group[key], 2)
+
+        return sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)
+
+    def to_dict(self) -> Dict:
+        """彙總與明細"""
+        return {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "summary": self.summary(),
+            "spans": [span.to_dict() for span in self.spans()],
+        }
+
+    def dump_json(self, path) -> str:
+        """
+        輸出為 JSON 檔案
+
+        Args:
+            path: 檔案路徑
+
+        Returns:
+            str: 寫入的檔案路徑
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        return str(path)
+
+
+# 預設的全域登錄 (所有 SspSession 未指定時共用)
+registry = MetricsRegistry()
+
+
+@contextmanager
+def track_parse(response) -> Iterator[None]:
+    """
+    將區塊內的執行時間計入回應的解析時間
+
+    回應若不是由 SspSession 取得 (沒有 span),則不做任何事。
+
+    Args:
+        response: requests.Response
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        span = getattr(response, "span", None)
+        if span is not None:
+            span.parse_ms += (time.perf_counter() - start) * 1000
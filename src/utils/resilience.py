@@ -0,0 +1,286 @@
+"""HTTP 請求重試、退避與斷路器"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+
+if TYPE_CHECKING:
+    from ..config import Settings
+
+logger = logging.getLogger(__name__)
+
+# 可安全重送的 HTTP 方法
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """斷路器開啟中,請求未送出"""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """單一端點的重試設定"""
+
+    max_attempts: int = 3  # 含第一次的總嘗試次數
+    backoff_base: float = 0.5  # 第 N 次重試的退避上限為 base * 2^(N-1) 秒
+    backoff_max: float = 8.0
+    retry_statuses: tuple = (502, 503, 504)
+
+    def delay(self, retry: int) -> float:
+        """
+        第 retry 次重試前的等待秒數 (full jitter,避免多個執行緒同時重送)
+
+        Args:
+            retry: 重試次數 (從 1 開始)
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (retry - 1)))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    斷路器
+
+    連續失敗達門檻後開啟,期間的請求直接以 CircuitOpenError 拒絕;
+    經過 reset_timeout 秒後放行一個試探請求 (半開),成功即關閉,失敗則重新開啟。
+    執行緒安全。
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold: 開啟前的連續失敗次數 (0 表示停用)
+            reset_timeout: 開啟後多久放行試探請求 (秒)
+            clock: 時間來源 (測試用)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """是否放行請求 (半開時只放行一個試探請求)"""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._opened_at is not None or (
+                self.failure_threshold and self._failures >= self.failure_threshold
+            ):
+                if self._opened_at is None:
+                    logger.warning(f"SSP 連續失敗 {self._failures} 次,暫停送出請求")
+                self._opened_at = self._clock()
+
+
+class ResilienceLayer:
+    """
+    SSP 請求的重試與斷路器
+
+    - 連線錯誤、逾時與 retry_statuses 的回應依端點設定以指數退避重試
+    - POST 只在表單不含 non_idempotent_fields (例如送出申請單的按鈕) 時重試;
+      ASP.NET 的翻頁與新增列 PostBack 只依 ViewState 產生頁面,可安全重送
+    - 所有端點共用一個斷路器,SSP 過載時停止送出請求
+    - 依端點累計請求、重試、失敗次數與耗時
+    """
+
+    def __init__(
+        self,
+        default_policy: Optional[RetryPolicy] = None,
+        policies: Optional[Dict[str, RetryPolicy]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        non_idempotent_fields: Iterable[str] = (),
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            default_policy: 未個別設定的端點使用的重試設定
+            policies: {URL 路徑: 重試設定}
+            breaker: 斷路器 (預設建立新的)
+            non_idempotent_fields: 表單含有這些欄位時不重試
+            sleep: 退避等待函式 (測試用)
+        """
+        self.default_policy = default_policy or RetryPolicy()
+        self.policies = {path.lower(): p for path, p in (policies or {}).items()}
+        self.breaker = breaker or CircuitBreaker()
+        self.non_idempotent_fields = frozenset(non_idempotent_fields)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict] = {}
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "ResilienceLayer":
+        """依 Settings 的 RETRY_* / CIRCUIT_* 設定建立"""
+        default = RetryPolicy(
+            max_attempts=settings.RETRY_MAX_ATTEMPTS,
+            backoff_base=settings.RETRY_BACKOFF_BASE,
+            backoff_max=settings.RETRY_BACKOFF_MAX,
+            retry_statuses=tuple(settings.RETRY_STATUS_CODES),
+        )
+        return cls(
+            default_policy=default,
+            policies={
+                path: replace(default, **overrides)
+                for path, overrides in settings.RETRY_POLICIES.items()
+            },
+            breaker=CircuitBreaker(
+                settings.CIRCUIT_FAILURE_THRESHOLD, settings.CIRCUIT_RESET_TIMEOUT
+            ),
+            non_idempotent_fields=settings.NON_IDEMPOTENT_FIELDS,
+        )
+
+    def policy_for(self, url: str) -> RetryPolicy:
+        """取得 URL 對應的重試設定"""
+        return self.policies.get(urlparse(url).path.lower(), self.default_policy)
+
+    def is_retryable(self, method: str, data) -> bool:
+        """請求是否可安全重送"""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        if not isinstance(data, dict):
+            return False
+        return not self.non_idempotent_fields.intersection(data)
+
+    def execute(
+        self,
+        method: str,
+        url: str,
+        data,
+        send: Callable[[int], requests.Response],
+    ) -> requests.Response:
+        """
+        送出請求,依設定重試
+
+        Args:
+            method: HTTP 方法
+            url: 網址
+            data: 表單資料 (判斷是否可重送)
+            send: send(attempt) 實際送出第 attempt 次請求
+
+        Returns:
+            requests.Response: 最後一次的回應
+
+        Raises:
+            CircuitOpenError: 斷路器開啟中
+            requests.RequestException: 重試後仍失敗
+        """
+        policy = self.policy_for(url)
+        attempts = policy.max_attempts if self.is_retryable(method, data) else 1
+        counters = self._counters_for(url)
+        start = time.perf_counter()
+        self._count(counters, "requests")
+
+        try:
+            for attempt in range(1, max(1, attempts) + 1):
+                if attempt > 1:
+                    self._count(counters, "retries")
+                    self._sleep(policy.delay(attempt - 1))
+
+                if not self.breaker.allow():
+                    self._count(counters, "rejected")
+                    raise CircuitOpenError(f"SSP 暫停連線中: {url}")
+
+                try:
+                    response = send(attempt)
+                except (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                ) as e:
+                    self.breaker.record_failure()
+                    if attempt >= attempts:
+                        self._count(counters, "failures")
+                        raise
+                    logger.warning(f"請求失敗 ({e.__class__.__name__}),重試 {url}")
+                    continue
+                except BaseException:
+                    # 其他例外 (TooManyRedirects、ChunkedEncodingError 等) 不重試,
+                    # 但仍須記錄失敗,否則半開時的試探請求不會被釋放
+                    self.breaker.record_failure()
+                    self._count(counters, "failures")
+                    raise
+
+                if response.status_code not in policy.retry_statuses:
+                    self.breaker.record_success()
+                    return response
+
+                self.breaker.record_failure()
+                if attempt >= attempts:
+                    self._count(counters, "failures")
+                    return response
+                logger.warning(f"伺服器回應 {response.status_code},重試 {url}")
+                response.close()
+        finally:
+            with self._lock:
+                counters["total_ms"] += (time.perf_counter() - start) * 1000
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        各端點的計數
+
+        Returns:
+            Dict[str, Dict]: {路徑: {requests, retries, failures, rejected, total_ms, avg_ms}}
+        """
+        with self._lock:
+            result = {}
+            for path, counters in self._counters.items():
+                stats = dict(counters)
+                stats["total_ms"] = round(stats["total_ms"], 2)
+                stats["avg_ms"] = round(stats["total_ms"] / max(1, stats["requests"]), 2)
+                result[path] = stats
+            return result
+
+    def _counters_for(self, url: str) -> Dict:
+        path = urlparse(url).path
+        with self._lock:
+            return self._counters.setdefault(
+                path,
+                {"requests": 0, "retries": 0, "failures": 0, "rejected": 0, "total_ms": 0.0},
+            )
+
+    def _count(self, counters: Dict, key: str):
+        with self._lock:
+            counters[key] += 1
@@ -0,0 +1,114 @@
+"""同一資源的並行請求合併"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class CancelToken:
+    """取消標記 (工作在適當時機檢查 cancelled,被新的工作取代時不再更新結果)"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+
+class _Call:
+    """進行中的呼叫"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0  # 等待共用結果的呼叫者數
+
+
+class SingleFlight:
+    """
+    並行請求合併 (single-flight)
+
+    同一個 key 同時只執行一次 func,執行期間其他呼叫者等待並共用同一個結果
+    (或同一個例外);完成後下一次呼叫重新執行。
+    另提供 supersede(key): 同一個 key 的新工作開始時取消前一個工作的標記,
+    讓重複點擊時只有最後一次的結果更新畫面。執行緒安全。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tokens: Dict[Hashable, CancelToken] = {}
+        # 累計次數 (不依 key 分別記錄,key 會隨登入 session 不斷增加)
+        self.executions = 0  # 實際執行次數
+        self.shared = 0  # 共用進行中結果的呼叫次數
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """
+        執行 func(*args, **kwargs),同一個 key 進行中時共用其結果
+
+        Args:
+            key: 資源鍵值
+            func: 實際執行的函式
+
+        Returns:
+            Any: func 的結果
+
+        Raises:
+            Exception: func 拋出的例外 (所有共用的呼叫者都會收到)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self, key: Hashable) -> bool:
+        """key 是否有進行中的呼叫"""
+        with self._lock:
+            return key in self._calls
+
+    def waiting(self, key: Hashable) -> int:
+        """key 進行中的呼叫目前有幾個呼叫者在等待 (沒有進行中的呼叫時為 0)"""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
+
+    def supersede(self, key: Hashable) -> CancelToken:
+        """
+        開始 key 的新工作: 取消前一個工作的標記並返回新標記
+
+        Returns:
+            CancelToken: 新工作的標記
+        """
+        token = CancelToken()
+        with self._lock:
+            previous = self._tokens.get(key)
+            self._tokens[key] = token
+        if previous is not None:
+            previous.cancel()
+        return token
@@ -0,0 +1,54 @@
+"""
+等寬文字排版 (考慮中日韓全形字元的顯示寬度)
+
+str.ljust / format 以字元數計算寬度,但全形字元在終端機佔兩格,
+中文欄位名稱會讓表格錯位;這裡以 unicodedata.east_asian_width 計算顯示寬度。
+"""
+
+import unicodedata
+
+# 顯示寬度為 2 的 East Asian Width 類別 (全形、寬字元)
+_WIDE = frozenset("WF")
+
+
+def display_width(text: str) -> int:
+    """
+    計算字串在等寬字型下的顯示寬度
+
+    Args:
+        text: 字串
+
+    Returns:
+        int: 顯示寬度 (全形字元計 2,組合字元計 0,其餘計 1)
+    """
+    if text.isascii():
+        return len(text)
+    width = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in _WIDE else 1
+    return width
+
+
+def pad(text: str, width: int, align: str = "<") -> str:
+    """
+    依顯示寬度補空白
+
+    Args:
+        text: 字串
+        width: 目標顯示寬度 (字串較寬時不截斷)
+        align: "<" 靠左、">" 靠右、"^" 置中
+
+    Returns:
+        str: 補齊後的字串
+    """
+    space = width - display_width(text)
+    if space <= 0:
+        return text
+    if align == ">":
+        return " " * space + text
+    if align == "^":
+        left = space // 2
+        return " " * left + text + " " * (space - left)
+    return text + " " * space
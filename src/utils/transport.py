@@ -0,0 +1,158 @@
+"""共用 HTTP 連線池"""
+
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .http import SspSession
+from .metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from ..config import Settings
+    from .resilience import ResilienceLayer
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    記錄連線池使用狀況的 HTTPAdapter
+
+    重試由 ResilienceLayer 處理,因此 urllib3 層不重試;
+    連線池滿時不阻塞,多出的連線用完即關閉 (計入 saturated_requests)。
+    """
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 16):
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.saturated_requests = 0
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+            pool_block=False,
+        )
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    def send(self, request, **kwargs):
+        with self._stats_lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if self.in_flight > self._pool_maxsize:
+                self.saturated_requests += 1
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self._stats_lock:
+                self.in_flight -= 1
+
+    def connection_counts(self) -> Dict[str, int]:
+        """目前各主機連線池累計建立的連線數與處理的請求數"""
+        opened = served = 0
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                served += pool.num_requests
+        return {"connections_opened": opened, "pooled_requests": served}
+
+
+class Transport:
+    """
+    HTTP 連線工廠
+
+    所有服務的 session 掛載同一個 PooledAdapter,
+    不同 session (含 clone_session 的複本與批次的各帳號) 共用 keep-alive 連線,
+    TLS 連線建立後即可重複使用,不需每個請求重新交握。
+    """
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 16):
+        """
+        Args:
+            pool_connections: 快取的主機連線池數
+            pool_maxsize: 每個主機保留的 keep-alive 連線數 (應不小於平行請求數)
+        """
+        self.adapter = PooledAdapter(pool_connections, pool_maxsize)
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "Transport":
+        """依 Settings 的 HTTP_POOL_* 設定建立"""
+        return cls(settings.HTTP_POOL_CONNECTIONS, settings.HTTP_POOL_MAXSIZE)
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """將共用連線池掛載到 session"""
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    def session(self) -> requests.Session:
+        """建立使用共用連線池的一般 session (非 SSP 請求使用)"""
+        return self.mount(requests.Session())
+
+    def ssp_session(
+        self,
+        metrics: Optional[MetricsRegistry] = None,
+        resilience: Optional["ResilienceLayer"] = None,
+    ) -> SspSession:
+        """建立使用共用連線池的 SspSession"""
+        return self.mount(SspSession(metrics=metrics, resilience=resilience))
+
+    def stats(self) -> Dict:
+        """
+        連線池統計
+
+        Returns:
+            Dict: requests / in_flight / peak_in_flight / pool_maxsize /
+                  saturated_requests / saturation (尖峰平行數 / 池大小) /
+                  connections_opened / reuse_rate (重複使用既有連線的請求比例)
+        """
+        adapter = self.adapter
+        counts = adapter.connection_counts()
+        with adapter._stats_lock:
+            stats = {
+                "requests": adapter.requests,
+                "in_flight": adapter.in_flight,
+                "peak_in_flight": adapter.peak_in_flight,
+                "pool_maxsize": adapter.pool_maxsize,
+                "saturated_requests": adapter.saturated_requests,
+            }
+        stats["saturation"] = round(stats["peak_in_flight"] / stats["pool_maxsize"], 2)
+        stats.update(counts)
+        served = counts["pooled_requests"]
+        stats["reuse_rate"] = (
+            round(1 - counts["connections_opened"] / served, 3) if served else 0.0
+        )
+        return stats
+
+    def close(self):
+        """關閉所有連線"""
+        self.adapter.close()
+
+
+_default: Optional[Transport] = None
+_default_lock = threading.Lock()
+
+
+def get_transport(settings: Optional["Settings"] = None) -> Transport:
+    """
+    取得全域共用的 Transport (第一次呼叫時依設定建立)
+
+    Args:
+        settings: 系統設定 (僅第一次呼叫時使用)
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            if settings is None:
+                from ..config import Settings
+
+                settings = Settings()
+            _default = Transport.from_settings(settings)
+        return _default
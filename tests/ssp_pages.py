@@ -0,0 +1,107 @@
+"""測試用假 SSP 連線 adapter (頁面產生器見 benchmarks/ssp_pages.py)"""
+
+import email.message
+import io
+import threading
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+
+class FakeSspAdapter(BaseAdapter):
+    """
+    假的 SSP 連線 adapter
+
+    依 URL 路徑與 PostBack 參數呼叫對應的處理函式產生回應,
+    並記錄所有收到的請求 (執行緒安全)。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.handlers: Dict[str, Callable[[str, Dict[str, str]], str]] = {}
+        self.requests: List[Dict] = []
+        self.fail_pages: set = set()
+        # 設定時,未帶此 ASP.NET_SessionId 的請求 (登入頁除外) 轉回登入頁,
+        # 登入成功時以 Set-Cookie 核發
+        self.session_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def route(self, path: str, handler: Callable[[str, Dict[str, str]], str]):
+        """註冊路徑處理函式 handler(method, form) -> html"""
+        self.handlers[path] = handler
+
+    def send(self, request, **kwargs):
+        parsed = urlparse(request.url)
+        form = {}
+        if request.body:
+            body = request.body if isinstance(request.body, str) else request.body.decode()
+            form = {k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()}
+        form.update({k: v[0] for k, v in parse_qs(parsed.query).items()})
+
+        with self._lock:
+            self.requests.append(
+                {
+                    "method": request.method,
+                    "path": parsed.path,
+                    "form": form,
+                    "cookie": request.headers.get("Cookie", ""),
+                    "thread": threading.get_ident(),
+                }
+            )
+
+        if form.get("__EVENTARGUMENT") in self.fail_pages:
+            raise requests.exceptions.ConnectionError("模擬連線失敗")
+
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+
+        cookie = request.headers.get("Cookie", "")
+        if (
+            self.session_id
+            and parsed.path != "/index.aspx"
+            and f"ASP.NET_SessionId={self.session_id}" not in cookie
+        ):
+            response.status_code = 302
+            response.headers["Location"] = "/index.aspx"
+            response._content = b""
+            response.raw = io.BytesIO()
+            return response
+
+        handler = self.handlers.get(parsed.path)
+        html = handler(request.method, form) if handler else "<html></html>"
+
+        response.status_code = 200 if handler else 404
+        response._content = html.encode("utf-8")
+        response.raw = io.BytesIO(response._content)
+        if self.session_id and parsed.path == "/index.aspx" and "登出" in html:
+            _set_cookie(response, f"ASP.NET_SessionId={self.session_id}; path=/")
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        return response
+
+    def close(self):
+        pass
+
+    def count(self, path: Optional[str] = None) -> int:
+        """計算請求數 (可依路徑篩選)"""
+        return len([r for r in self.requests if path is None or r["path"] == path])
+
+
+def _set_cookie(response: requests.Response, value: str):
+    """讓 requests 從回應取得 Set-Cookie (模擬 urllib3 的原始回應)"""
+    message = email.message.Message()
+    message["Set-Cookie"] = value
+    response.raw._original_response = SimpleNamespace(msg=message)
+    response.headers["Set-Cookie"] = value
+
+
+def make_session(adapter: FakeSspAdapter) -> requests.Session:
+    """建立掛載假 adapter 的 session"""
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.cookies.set("ASP.NET_SessionId", "fake-session-id")
+    return session
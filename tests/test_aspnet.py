@@ -0,0 +1,101 @@
+"""ASP.NET 隱藏欄位擷取測試"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.ssp_pages import report_form_handler
+from src.config import Settings
+from src.models import OvertimeSubmissionRecord
+from src.services import OvertimeReportService
+from src.utils.aspnet import ViewState, extract_viewstate
+from src.utils.html import make_soup
+from tests.ssp_pages import FakeSspAdapter, make_session
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _extract_with_soup(html: str):
+    soup = make_soup(html, "html.parser")
+    fields = {}
+    for name in ("__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION"):
+        tag = soup.find("input", {"name": name})
+        fields[name] = tag["value"] if tag else ""
+    return fields
+
+
+@pytest.mark.parametrize(
+    "fixture", ["index.html", "fw99001z_page1.html", "fw21003z.html"]
+)
+def test_regex_matches_soup_extraction(fixture):
+    """正規表示式擷取結果與 BeautifulSoup 相同"""
+    html = (FIXTURES / fixture).read_text(encoding="utf-8")
+
+    viewstate = extract_viewstate(html.encode("utf-8"))
+
+    assert viewstate is not None
+    assert viewstate.to_form_data() == _extract_with_soup(html)
+
+
+def test_attribute_order_and_quotes():
+    """屬性順序、引號與大小寫不影響擷取"""
+    html = (
+        "<INPUT value='abc+/=' id=\"__VIEWSTATE\" type=\"hidden\" name='__VIEWSTATE'>"
+        '<input type="hidden" name="__VIEWSTATEGENERATOR" value="GEN" />'
+        '<input name="__EVENTVALIDATION" type="hidden" value="a&amp;b" />'
+    )
+
+    assert extract_viewstate(html) == ViewState(
+        viewstate="abc+/=", viewstate_generator="GEN", event_validation="a&b"
+    )
+
+
+def test_prefixed_attributes_are_ignored():
+    """data-value= / data-name= 不被當成 value / name"""
+    html = (
+        '<input name="__VIEWSTATE" data-value="WRONG" value="RIGHT">'
+        '<input data-name="__EVENTVALIDATION" name="other" value="WRONG" />'
+        '<input name="__EVENTVALIDATION" value="EV" />'
+    )
+
+    assert extract_viewstate(html) == ViewState(viewstate="RIGHT", event_validation="EV")
+
+
+def test_missing_optional_fields():
+    """缺少選用欄位時以空字串代替"""
+    html = '<input type="hidden" name="__VIEWSTATE" value="ONLY" />'
+
+    assert extract_viewstate(html).to_form_data() == {
+        "__VIEWSTATE": "ONLY",
+        "__VIEWSTATEGENERATOR": "",
+        "__EVENTVALIDATION": "",
+    }
+
+
+def test_missing_viewstate_returns_none():
+    """沒有 __VIEWSTATE 時返回 None (不誤判 __VIEWSTATEGENERATOR)"""
+    html = '<input type="hidden" name="__VIEWSTATEGENERATOR" value="GEN" />'
+
+    assert extract_viewstate(html) is None
+
+
+def test_report_form_uses_latest_viewstate():
+    """增加列時使用前一次回應的 ViewState,表單帶入最後的 ViewState"""
+    adapter = FakeSspAdapter()
+    adapter.route("/FW21001Z.aspx", report_form_handler())
+    service = OvertimeReportService(Settings())
+    records = [
+        OvertimeSubmissionRecord(date=f"2025/11/{day:02d}", description="開發", overtime_hours=1.5)
+        for day in range(1, 4)
+    ]
+
+    result = service.preview_form(make_session(adapter), records)
+
+    postbacks = [r["form"]["__VIEWSTATE"] for r in adapter.requests if r["method"] == "POST"]
+    assert postbacks == ["VS-FORM-1", "VS-FORM-2"]
+    assert result["success"] is True
+    assert result["form_data"]["__VIEWSTATE"] == "VS-FORM-3"
+    assert (
+        result["form_data"]["ctl00$ContentPlaceHolder1$gvFlow211i$ctl05$txtOT_Datei"]
+        == "2025/11/03"
+    )
@@ -0,0 +1,146 @@
+"""非同步服務層與 UI 結果佇列測試"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from benchmarks.ssp_pages import (
+    attendance_handler,
+    history_page,
+    make_attendance_records,
+    make_history_rows,
+)
+from src.config import Settings
+from src.services import (
+    AsyncDataService,
+    AsyncOvertimeStatusService,
+    DataService,
+    EventLoopThread,
+    OvertimeStatusService,
+)
+from tests.ssp_pages import FakeSspAdapter, make_session
+from ui.dispatcher import UiDispatcher
+
+RECORDS = make_attendance_records(25)
+
+
+class FakeWidget:
+    """只提供 after / after_cancel 的假 Tk 元件 (不實際排程)"""
+
+    def after(self, ms, func, *args):
+        return "after-id"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+@pytest.fixture
+def runner():
+    runner = EventLoopThread(max_workers=4)
+    yield runner
+    runner.stop()
+
+
+@pytest.fixture
+def adapter():
+    adapter = FakeSspAdapter()
+    adapter.route("/FW99001Z.aspx", attendance_handler(RECORDS))
+    adapter.route(
+        "/FW21003Z.aspx", lambda method, form: history_page(make_history_rows(3))
+    )
+    return adapter
+
+
+def test_services_fan_out_on_shared_loop(runner, adapter):
+    """多個 session 的請求在同一個事件迴圈平行展開"""
+    settings = Settings()
+
+    async def fetch_all():
+        data = [
+            AsyncDataService(DataService(make_session(adapter), settings), runner)
+            for _ in range(3)
+        ]
+        status = AsyncOvertimeStatusService(OvertimeStatusService(settings), runner)
+        return await asyncio.gather(
+            *(service.get_attendance_data(prefetch=False) for service in data),
+            status.fetch_submitted_records(make_session(adapter)),
+        )
+
+    *attendance, submitted = runner.submit(fetch_all()).result(timeout=10)
+
+    assert [len(records) for records in attendance] == [len(RECORDS)] * 3
+    assert len(submitted) == 3
+    # 阻塞呼叫在執行緒池執行,不佔用事件迴圈執行緒
+    assert runner.loop.is_running()
+    assert threading.get_ident() not in {r["thread"] for r in adapter.requests}
+
+
+def test_dispatcher_delivers_results_on_caller_thread(runner):
+    """背景結果只在 drain (主執行緒) 時執行回呼"""
+    dispatcher = UiDispatcher(FakeWidget(), runner)
+    results = []
+
+    dispatcher.run_blocking(lambda x: x * 2, 21, callback=results.append)
+    dispatcher.run_blocking(
+        lambda: 1 / 0, errback=lambda error: results.append(type(error).__name__)
+    )
+    deadline = time.monotonic() + 5
+    while dispatcher._queue.qsize() < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert results == []  # 尚未回到主執行緒
+    dispatcher.drain()
+
+    assert sorted(results, key=str) == [42, "ZeroDivisionError"]
+
+
+def test_dispatcher_isolates_callback_errors(runner):
+    """單一回呼失敗不影響其他回呼"""
+    dispatcher = UiDispatcher(FakeWidget(), runner)
+    calls = []
+
+    dispatcher.post(lambda: 1 / 0)
+    dispatcher.post(calls.append, "ok")
+    dispatcher.drain()
+
+    assert calls == ["ok"]
+
+
+def test_dispatcher_ignores_cancelled_work(runner):
+    """被取消的工作不呼叫 callback / errback"""
+    dispatcher = UiDispatcher(FakeWidget(), runner)
+    calls = []
+
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    dispatcher.run_async(cancelled(), callback=calls.append, errback=calls.append)
+    dispatcher.run_blocking(lambda: "done", callback=calls.append)
+    deadline = time.monotonic() + 5
+    while not dispatcher._queue.qsize() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    dispatcher.drain()
+
+    assert calls == ["done"]
+
+
+def test_stop_does_not_close_a_busy_loop():
+    """等待逾時時不關閉仍在執行的事件迴圈,由迴圈執行緒結束時關閉"""
+    runner = EventLoopThread(max_workers=1)
+    loop, started = runner.loop, threading.Event()
+    thread = runner._thread
+
+    async def block():
+        started.set()
+        time.sleep(0.5)  # 阻塞事件迴圈
+
+    runner.submit(block())
+    assert started.wait(5)
+    runner.stop(timeout=0.05)
+
+    assert thread.is_alive() and not loop.is_closed()
+    thread.join(5)
+    assert loop.is_closed()
@@ -0,0 +1,36 @@
+"""AttendanceTab UI 邏輯測試"""
+
+import pytest
+import customtkinter as ctk
+from tkinter import TclError
+
+from src.models import AttendanceRecord
+from ui.components.attendance_tab import AttendanceTab
+
+
+@pytest.fixture
+def tk_root():
+    """建立 Tk 根節點,測試結束後銷毀"""
+    try:
+        root = ctk.CTk()
+    except TclError:
+        pytest.skip("Tkinter 環境不可用,略過 UI 測試")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def test_same_day_records_get_separate_rows(tk_root):
+    """同一天的多筆刷卡記錄各自一列,重送同一筆時只更新該列"""
+    tab = AttendanceTab(tk_root, on_export=lambda: None, on_refresh=lambda: None)
+    morning = AttendanceRecord("2025/11/25", "08:00:00", "12:00:00")
+    evening = AttendanceRecord("2025/11/25", "13:00:00", "20:30:00", overtime_hours=1.5)
+
+    tab.append_records([morning, evening])
+    evening.overtime_hours = 2.0
+    tab.append_records([evening])
+
+    rows = [tab.tree.item(item, "values") for item in tab.tree.get_children()]
+    assert len(rows) == 2
+    assert [row[1] for row in rows] == ["08:00:00", "13:00:00"]
+    assert rows[1][4] == "2.0"
@@ -0,0 +1,133 @@
+"""多帳號批次計算服務測試"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from benchmarks.ssp_pages import attendance_handler, login_handler, make_attendance_records
+from src.config import Settings
+from src.models import BatchAccount
+from src.services import AuthService, BatchReportService, ExportService
+from tests.ssp_pages import FakeSspAdapter
+
+
+@pytest.fixture
+def adapter():
+    adapter = FakeSspAdapter()
+    adapter.route("/index.aspx", login_handler({"alice": "pw-a", "bob": "pw-b"}))
+    adapter.route("/FW99001Z.aspx", attendance_handler(make_attendance_records(25)))
+    return adapter
+
+
+@pytest.fixture
+def service(adapter, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    settings = Settings()
+
+    def auth_factory():
+        auth = AuthService(settings)
+        auth.session.mount("https://", adapter)
+        return auth
+
+    return BatchReportService(settings, auth_factory=auth_factory)
+
+
+def test_load_accounts_csv_and_json(tmp_path):
+    """讀取 CSV (含 BOM) 與 JSON 帳號清單"""
+    csv_path = tmp_path / "accounts.csv"
+    csv_path.write_text("username,password\nalice,pw-a\nbob,pw-b\n", encoding="utf-8-sig")
+    json_path = tmp_path / "accounts.json"
+    json_path.write_text(json.dumps([{"username": "carol", "password": "pw-c"}]))
+
+    accounts = BatchReportService.load_accounts(csv_path)
+
+    assert [a.username for a in accounts] == ["alice", "bob"]
+    assert "pw-a" not in repr(accounts[0])
+    assert BatchReportService.load_accounts(json_path) == [BatchAccount("carol", "pw-c")]
+
+
+def test_load_accounts_rejects_missing_password(tmp_path):
+    """缺少密碼時拋出 ValueError"""
+    path = tmp_path / "accounts.csv"
+    path.write_text("username,password\nalice,\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="第 1 筆"):
+        BatchReportService.load_accounts(path)
+
+
+def test_run_isolates_failed_accounts(service):
+    """單一帳號登入失敗不影響其他帳號,結果依清單順序返回"""
+    accounts = [
+        BatchAccount("alice", "pw-a"),
+        BatchAccount("mallory", "wrong"),
+        BatchAccount("bob", "pw-b"),
+    ]
+    progress = []
+
+    results = service.run(
+        accounts, workers=3, on_progress=lambda done, total, r: progress.append((done, total))
+    )
+
+    assert [r.username for r in results] == ["alice", "mallory", "bob"]
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error == "登入失敗"
+    assert results[0].report.total_days == 25
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_failed_or_empty_fetch_is_not_success(service, adapter):
+    """出勤資料查詢失敗或沒有任何記錄時,該帳號視為失敗"""
+    adapter.fail_pages.add("Page$2")
+
+    results = service.run([BatchAccount("alice", "pw-a")])
+
+    assert results[0].success is False
+    assert results[0].error == "查詢出勤資料失敗"
+    assert results[0].report is None
+
+    adapter.fail_pages.clear()
+    adapter.route("/FW99001Z.aspx", attendance_handler([]))
+    assert service.run([BatchAccount("bob", "pw-b")])[0].error == "查詢出勤資料失敗"
+
+
+def test_combined_export(service, tmp_path):
+    """合併報表包含帳號摘要與所有帳號的記錄"""
+    results = service.run(
+        [BatchAccount("alice", "pw-a"), BatchAccount("mallory", "wrong")],
+        export_each=True,
+    )
+
+    output = ExportService(Settings()).export_batch_to_excel(
+        results, str(tmp_path / "combined.xlsx")
+    )
+
+    summary = pd.read_excel(output, sheet_name="帳號摘要")
+    records = pd.read_excel(output, sheet_name="加班記錄")
+    assert summary["帳號"].tolist() == ["alice", "mallory"]
+    assert summary["狀態"].tolist() == ["成功", "失敗"]
+    assert records["帳號"].unique().tolist() == ["alice"]
+    assert len(records) == 25
+    assert results[0].export_path.startswith("reports/overtime_report_alice_")
+    assert results[1].export_path is None
+
+
+def test_per_account_export_uses_selected_format(service):
+    """個別匯出使用指定的格式"""
+    results = service.run(
+        [BatchAccount("alice", "pw-a")], export_each=True, export_format="csv"
+    )
+
+    assert results[0].export_path.startswith("reports/overtime_report_alice_")
+    assert results[0].export_path.endswith(".csv")
+
+
+def test_cli_rejects_sheets_with_columnar_format(capsys):
+    """--sheets 只能搭配 xlsx"""
+    import batch_report
+
+    with pytest.raises(SystemExit):
+        batch_report.parse_args(["accounts.csv", "--sheets", "--format", "csv"])
+    assert "--sheets" in capsys.readouterr().err
+    assert batch_report.parse_args(["accounts.csv", "--sheets"]).sheets is True
+
@@ -0,0 +1,59 @@
+"""離線 SSP 模擬伺服器與效能測試流程測試"""
+
+import json
+
+import pytest
+
+from benchmarks import run_benchmarks
+from benchmarks.ssp_pages import make_attendance_records
+from benchmarks.ssp_stub import SspStubServer
+from src.config import Settings
+from src.models import OvertimeSubmissionRecord
+from src.services import AuthService, OvertimeReportService
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_stub_server_serves_report_form(workdir):
+    """模擬伺服器支援登入與加班補報的增加列 PostBack"""
+    with SspStubServer(make_attendance_records(5)) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url)
+        auth = AuthService(settings)
+        assert auth.login("bench", "bench")
+        assert not AuthService(settings).login("bench", "wrong")
+
+        records = [
+            OvertimeSubmissionRecord(
+                date=f"2025/12/{day:02d}", description="專案開發", overtime_hours=1.0
+            )
+            for day in range(1, 4)
+        ]
+        result = OvertimeReportService(settings).submit_form(auth.session, records)
+
+    assert result["success"]
+    assert result["submitted_count"] == 3
+
+
+def test_benchmark_report(workdir):
+    """效能測試輸出各記錄數、各階段的計時,並可與先前報告比較"""
+    report_path = workdir / "report.json"
+
+    exit_code = run_benchmarks.main(
+        ["--sizes", "10", "45", "--repeat", "1", "-o", str(report_path)]
+    )
+
+    assert exit_code == 0
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert [r["size"] for r in report["results"]] == [10, 45]
+    assert set(report["results"][1]["stages"]) == set(run_benchmarks.STAGES)
+    assert report["results"][1]["pages"] == 5
+    assert report["results"][1]["requests_per_run"] == 2 + 5 + 1
+
+    table = run_benchmarks.compare(report, report)
+    assert table.count("1.00") == 2 * len(run_benchmarks.STAGES)
+    assert not list((workdir / "reports").glob("*.xlsx"))
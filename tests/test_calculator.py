@@ -1,9 +1,12 @@
 """測試加班計算核心邏輯"""
 
+import random
+
 import pytest
 from datetime import datetime
 from src.core import OvertimeCalculator
 from src.config import Settings
+from src.models import OvertimeReport
 
 
 class TestOvertimeCalculator:
@@ -77,3 +80,136 @@ class TestOvertimeCalculator:
         assert report.total_overtime_hours >= 0
         assert report.average_overtime_hours >= 0
         assert report.max_overtime_hours >= 0
+
+
+class TestBatchCalculation:
+    """測試向量化計算與逐筆計算結果一致"""
+
+    @pytest.fixture
+    def calculator(self):
+        return OvertimeCalculator()
+
+    @staticmethod
+    def _random_records(count: int, seed: int = 20241028):
+        """產生含邊界與錯誤格式的隨機記錄"""
+        rng = random.Random(seed)
+        records = []
+        for _ in range(count):
+            year, month, day = rng.choice([2024, 2025]), rng.randint(1, 12), rng.randint(1, 28)
+            date = rng.choice([f"{year}/{month:02d}/{day:02d}", f"{year}/{month}/{day}"])
+            start = f"{rng.randint(6, 12):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+            end = f"{rng.randint(12, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+            time_range = f"{start}~{end}"
+
+            roll = rng.random()
+            if roll < 0.02:
+                time_range = time_range.replace("~", "-")
+            elif roll < 0.04:
+                time_range += "~18:00:00"
+            elif roll < 0.06:
+                time_range = f"25:00:00~{end}"
+            elif roll < 0.08:
+                date = "2024/13/01"
+            elif roll < 0.10:
+                time_range = f" {start} ~ {end} "
+            records.append({"date": date, "time_range": time_range})
+        return records
+
+    def test_batch_matches_scalar(self, calculator):
+        """隨機記錄的向量化結果與逐筆計算完全相同 (含排序與略過的記錄)"""
+        records = self._random_records(3000)
+
+        scalar = calculator._calculate_overtime_scalar(records)
+        batch = calculator.calculate_overtime_batch(records)
+
+        assert batch.records == scalar.records
+        assert len(batch.records) < len(records)
+
+    def test_batch_rounding_and_clamp(self, calculator):
+        """進位與上下限與逐筆計算一致"""
+        records = [
+            {"date": "2024/10/28", "time_range": "09:00:00~18:40:18"},  # 0.005 小時邊界
+            {"date": "2024/10/28", "time_range": "09:00:00~12:00:00"},  # 負值 → 0
+            {"date": "2024/10/29", "time_range": "07:00:00~23:59:59"},  # 超過上限
+            {"date": "2024/10/27", "time_range": "10:30:00~19:00:00"},  # 晚到
+        ]
+
+        batch = calculator.calculate_overtime_batch(records)
+
+        scalar = calculator._calculate_overtime_scalar(records)
+        assert batch.records == scalar.records
+        # 被限制的值與逐筆計算同型別 (0 / MAX_OVERTIME_HOURS 為 int)
+        assert [type(r.overtime_hours) for r in batch.records] == [
+            type(r.overtime_hours) for r in scalar.records
+        ]
+        assert [r.date for r in batch.records] == [
+            "2024/10/29",
+            "2024/10/28",
+            "2024/10/28",
+            "2024/10/27",
+        ]
+
+    def test_batch_rounding_parity_every_second(self, calculator):
+        """逐秒的下班時間 (含所有 .xx5 進位邊界) 向量化進位與逐筆計算完全相同"""
+        records = [
+            {
+                "date": "2024/10/28",
+                "time_range": f"09:00:00~{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}",
+            }
+            for s in range(18 * 3600, 24 * 3600)
+        ]
+
+        batch = calculator.calculate_overtime_batch(records)
+        scalar = calculator._calculate_overtime_scalar(records)
+
+        assert [(r.overtime_hours, type(r.overtime_hours)) for r in batch.records] == [
+            (r.overtime_hours, type(r.overtime_hours)) for r in scalar.records
+        ]
+
+    def test_extend_report_matches_full_calculation(self, calculator):
+        """逐頁累加的結果與一次計算全部記錄相同"""
+        records = self._random_records(95, seed=7)
+        report = OvertimeReport(records=[])
+
+        added = [
+            calculator.extend_report(report, records[start : start + 10])
+            for start in range(0, len(records), 10)
+        ]
+
+        assert report.records == calculator.calculate_overtime(records).records
+        assert sum(len(page) for page in added) == len(report.records)
+
+    def test_batch_empty(self, calculator):
+        """空記錄返回空報表"""
+        assert calculator.calculate_overtime_batch([]).records == []
+
+    def test_batch_calculation_is_opt_in(self, monkeypatch):
+        """預設不使用向量化計算"""
+        calculator = OvertimeCalculator(Settings())
+        calls = []
+        monkeypatch.setattr(
+            calculator,
+            "calculate_overtime_batch",
+            lambda records: calls.append(len(records)) or OvertimeReport(),
+        )
+
+        calculator.calculate_overtime(self._random_records(1000))
+
+        assert calls == []
+
+    def test_threshold_dispatches_to_batch(self, monkeypatch):
+        """記錄數達門檻時 calculate_overtime 使用向量化計算"""
+        settings = Settings()
+        settings.BATCH_CALCULATION_THRESHOLD = 2
+        calculator = OvertimeCalculator(settings)
+        calls = []
+        monkeypatch.setattr(
+            calculator,
+            "calculate_overtime_batch",
+            lambda records: calls.append(len(records)) or OvertimeReport(),
+        )
+
+        calculator.calculate_overtime([{"date": "2024/10/28", "time_range": "x"}])
+        calculator.calculate_overtime(self._random_records(2))
+
+        assert calls == [2]
@@ -0,0 +1,155 @@
+"""DataService 出勤資料擷取測試"""
+
+from datetime import date
+
+import pytest
+
+from benchmarks.ssp_pages import attendance_handler, make_attendance_records
+from src.config import Settings
+from src.services.data_service import DataService
+from tests.ssp_pages import FakeSspAdapter, make_session
+
+
+@pytest.fixture
+def adapter():
+    return FakeSspAdapter()
+
+
+def _build_service(adapter, records, page_size=10, **settings_kwargs):
+    adapter.route("/FW99001Z.aspx", attendance_handler(records, page_size))
+    return DataService(make_session(adapter), Settings(**settings_kwargs))
+
+
+@pytest.mark.parametrize("record_count", [0, 7, 10, 45, 100])
+def test_prefetch_matches_sequential(adapter, record_count):
+    """平行預取的結果應與循序翻頁完全相同"""
+    records = make_attendance_records(record_count)
+    service = _build_service(adapter, records)
+
+    sequential = service.get_attendance_data(prefetch=False)
+    prefetched = service.get_attendance_data(prefetch=True)
+
+    assert prefetched == sequential
+    assert sequential == records[: len(sequential)]
+
+
+def test_prefetch_stops_at_pager_window_like_sequential(adapter):
+    """分頁列視窗外 ("...") 的頁面,預取與循序翻頁皆不跟進"""
+    records = make_attendance_records(150)
+    service = _build_service(adapter, records)
+
+    sequential = service.get_attendance_data(max_pages=15, prefetch=False)
+    prefetched = service.get_attendance_data(max_pages=15, prefetch=True)
+
+    assert len(sequential) == 100
+    assert prefetched == sequential
+
+
+def test_prefetch_respects_max_pages(adapter):
+    """預取不應超過最大頁數"""
+    records = make_attendance_records(100)
+    service = _build_service(adapter, records)
+
+    result = service.get_attendance_data(max_pages=3, prefetch=True)
+
+    assert result == records[:30]
+    assert adapter.count("/FW99001Z.aspx") == 3
+
+
+def test_prefetch_deduplicates_across_pages(adapter):
+    """跨頁重複的記錄只保留一筆"""
+    records = make_attendance_records(20)
+    records[12] = dict(records[3])
+    service = _build_service(adapter, records)
+
+    sequential = service.get_attendance_data(prefetch=False)
+    prefetched = service.get_attendance_data(prefetch=True)
+
+    assert len(sequential) == 19
+    assert prefetched == sequential
+
+
+def test_prefetch_uses_cloned_sessions_with_same_state(adapter):
+    """預取請求使用複製的 session,帶有相同 cookie 與第 1 頁 ViewState"""
+    records = make_attendance_records(40)
+    service = _build_service(adapter, records, PREFETCH_WORKERS=3)
+
+    service.get_attendance_data(prefetch=True)
+
+    postbacks = [r for r in adapter.requests if r["method"] == "POST"]
+    assert sorted(r["form"]["__EVENTARGUMENT"] for r in postbacks) == [
+        "Page$2",
+        "Page$3",
+        "Page$4",
+    ]
+    for request in postbacks:
+        assert request["form"]["__VIEWSTATE"] == "VS-ATT-1"
+        assert "ASP.NET_SessionId=fake-session-id" in request["cookie"]
+
+
+def test_prefetch_truncates_at_failed_page(adapter):
+    """預取失敗的頁面之後不合併,與循序翻頁行為一致"""
+    records = make_attendance_records(50)
+    service = _build_service(adapter, records)
+    adapter.fail_pages = {"Page$3"}
+
+    sequential = service.get_attendance_data(prefetch=False)
+    assert str(service.last_error) == "第 3 頁翻頁失敗"
+    prefetched = service.get_attendance_data(prefetch=True)
+    assert str(service.last_error) == "第 3 頁翻頁失敗"
+
+    assert sequential == records[:20]
+    assert prefetched == sequential
+
+    adapter.fail_pages = set()
+    service.get_attendance_data()
+    assert service.last_error is None
+
+
+def test_prefetch_setting_default(adapter):
+    """未指定時依設定決定是否預取"""
+    records = make_attendance_records(30)
+    service = _build_service(adapter, records, ATTENDANCE_PREFETCH=True)
+
+    assert service.get_attendance_data() == records
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_since_stops_at_older_page(adapter, prefetch):
+    """指定 since 時讀到較舊日期的頁面即停止翻頁"""
+    records = make_attendance_records(100)
+    service = _build_service(adapter, records)
+
+    result = service.get_attendance_data(since=date(2025, 12, 10), prefetch=prefetch)
+
+    assert result == records[:20]
+    assert {r["date"] for r in records[:19]} <= {r["date"] for r in result}
+    if not prefetch:
+        assert adapter.count("/FW99001Z.aspx") == 2
+
+
+def test_since_on_first_page_skips_paging(adapter):
+    """第 1 頁已包含較舊記錄時不翻頁"""
+    records = make_attendance_records(100)
+    service = _build_service(adapter, records)
+
+    result = service.get_attendance_data(since=date(2025, 12, 25), prefetch=True)
+
+    assert result == records[:10]
+    assert adapter.count("/FW99001Z.aspx") == 1
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_on_page_streams_new_records(adapter, prefetch):
+    """每頁完成即回呼本頁新增的記錄,依頁碼順序且合併後與回傳結果相同"""
+    records = make_attendance_records(35)
+    service = _build_service(adapter, records)
+    pages = []
+
+    result = service.get_attendance_data(
+        prefetch=prefetch, on_page=lambda page, new: pages.append((page, new))
+    )
+
+    assert [page for page, _ in pages] == [1, 2, 3, 4]
+    assert pages[0][1] == records[:10]
+    assert [r for _, new in pages for r in new] == result == records
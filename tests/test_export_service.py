@@ -0,0 +1,221 @@
+"""匯出服務測試"""
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from src.models import AttendanceRecord, OvertimeReport
+from src.services import ExportService
+from src.services.export_service import RECORD_COLUMNS
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _report():
+    return OvertimeReport(
+        records=[
+            AttendanceRecord("2025/12/02", "08:30:00", "20:00:00", 2.0, 690),
+            AttendanceRecord("2025/12/01", "09:00:00", "18:00:00", 0.0, 540),
+        ]
+    )
+
+
+def test_excel_keeps_columns_widths_and_summary(workdir):
+    """串流匯出保留原本的欄位、欄寬與統計區塊"""
+    output = ExportService().export_to_excel(_report(), "report.xlsx")
+
+    sheet = openpyxl.load_workbook(output)["加班記錄"]
+    rows = list(sheet.iter_rows(values_only=True))
+
+    assert rows[0] == RECORD_COLUMNS
+    assert sheet["A1"].font.b
+    assert rows[1] == ("2025/12/02", "08:30:00", "20:00:00", 690, 2)
+    assert rows[3] == (None,) * 5
+    assert [row[:2] for row in rows[4:]] == [
+        ("統計資訊", None),
+        ("記錄天數", 2),
+        ("加班天數", 1),
+        ("總加班時數", "2.0 hr"),
+        ("平均每日加班", "1.0 hr"),
+        ("最長加班", "2.0 hr"),
+        ("最長加班日期", "2025/12/02"),
+    ]
+    assert sheet.column_dimensions["A"].width == 15
+    assert sheet.column_dimensions["E"].width == 12
+
+
+def test_empty_report_is_not_exported(workdir):
+    """沒有記錄時不產生檔案"""
+    assert ExportService().export_to_excel(OvertimeReport(records=[])) is None
+    assert not list((workdir / "reports").iterdir())
+
+
+def test_export_benchmark_runs(workdir):
+    """匯出效能測試可執行並回報耗時與尖峰記憶體"""
+    from benchmarks import export_benchmark
+
+    (result,) = export_benchmark.run([50], include_pandas=False)
+
+    assert result["rows"] == 50
+    assert result["streaming"]["seconds"] >= 0
+    assert result["streaming"]["peak_mb"] > 0
+
+
+def test_export_report_as_csv_and_jsonl(workdir):
+    """CSV / JSONL 只輸出記錄明細,欄位與 Excel 相同"""
+    import csv
+    import json
+
+    service = ExportService()
+    csv_path = service.export_report(_report(), "csv")
+    jsonl_path = service.export_report(_report(), "jsonl")
+
+    assert csv_path.endswith(".csv") and jsonl_path.endswith(".jsonl")
+    with open(csv_path, encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == RECORD_COLUMNS
+    assert rows[1] == ["2025/12/02", "08:30:00", "20:00:00", "690", "2.0"]
+    assert len(rows) == 3
+
+    with open(jsonl_path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[1] == {
+        "日期": "2025/12/01",
+        "上班時間": "09:00:00",
+        "下班時間": "18:00:00",
+        "總工時(分)": 540,
+        "加班時數": 0.0,
+    }
+
+
+def test_export_personal_records_and_batch(workdir):
+    """個人記錄與批次結果可匯出為欄位式格式"""
+    import csv
+
+    from src.models import BatchAccountResult, PersonalRecord
+    from src.services.export_service import PERSONAL_RECORD_COLUMNS
+
+    service = ExportService()
+    personal = service.export_personal_records(
+        [PersonalRecord("2025/12/02", "系統維護", "簽核中", 2.0, 10.0, 30.0, "加班")],
+        "csv",
+        "personal.csv",
+    )
+    with open(personal, encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == PERSONAL_RECORD_COLUMNS
+    assert rows[1][:3] == ["2025/12/02", "系統維護", "簽核中"]
+
+    results = [
+        BatchAccountResult("alice", True, report=_report()),
+        BatchAccountResult("bob", False, error="登入失敗"),
+    ]
+    batch = service.export_batch(results, "csv", "batch.csv")
+    with open(batch, encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "帳號"
+    assert [row[0] for row in rows[1:]] == ["alice", "alice"]
+
+
+def test_export_report_as_parquet(workdir):
+    """Parquet 匯出 (需要 pyarrow)"""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    output = ExportService().export_report(_report(), "parquet")
+
+    table = pq.read_table(output)
+    assert tuple(table.column_names) == RECORD_COLUMNS
+    assert table.column("加班時數").to_pylist() == [2.0, 0.0]
+
+
+def test_parquet_schema_does_not_depend_on_first_batch(workdir):
+    """Parquet 欄位型別依宣告的 schema,第一批全為 None 或整數也不影響後續批次"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    from src.services.export_service import PERSONAL_RECORD_COLUMNS, PERSONAL_RECORD_COLUMN_TYPES
+    from src.services.report_writers import ParquetRecordWriter
+
+    with ParquetRecordWriter(
+        "personal.parquet", PERSONAL_RECORD_COLUMNS, PERSONAL_RECORD_COLUMN_TYPES, batch_size=1
+    ) as writer:
+        writer.write_row(("2025/12/01", None, "簽核中", 2, 2, 2, None))
+        writer.write_row(("2025/12/02", "開發", "簽核完成", 1.5, 3.5, 3.5, "加班"))
+
+    table = pq.read_table("personal.parquet")
+    assert table.schema.field("加班內容").type == pa.string()
+    assert table.schema.field("加班時數").type == pa.float64()
+    assert table.column("加班時數").to_pylist() == [2.0, 1.5]
+    assert table.column("申報類型").to_pylist() == [None, "加班"]
+
+
+def test_unsupported_format_is_not_exported(workdir):
+    """不支援的格式返回 None"""
+    assert ExportService().export_report(_report(), "xml") is None
+
+
+def test_team_workbook_has_summary_and_employee_sheets(workdir):
+    """團隊活頁簿: 摘要工作表在最前,每位員工一個工作表"""
+    from src.services.export_service import TEAM_SUMMARY_COLUMNS
+
+    bob = OvertimeReport(
+        records=[AttendanceRecord("2025/12/03", "08:00:00", "22:00:00", 4.5, 840)]
+    )
+    output = ExportService().export_team_workbook(
+        {"alice": _report(), "bob/dev": bob, "alice ": OvertimeReport(records=[])},
+        "team.xlsx",
+    )
+
+    workbook = openpyxl.load_workbook(output)
+    assert workbook.sheetnames == ["摘要", "alice", "bob_dev", "alice (2)"]
+
+    summary = list(workbook["摘要"].iter_rows(values_only=True))
+    assert summary[0] == TEAM_SUMMARY_COLUMNS
+    assert summary[1] == ("alice", 2, 1, 2, 1, 2, "2025/12/02")
+    assert summary[2] == ("bob/dev", 1, 1, 4.5, 4.5, 4.5, "2025/12/03")
+    assert summary[3] == ("alice ", 0, 0, 0, 0, 0, None)
+    assert summary[4] == ("部門合計", 3, 2, 6.5, 2.17, 4.5, "2025/12/03")
+    assert summary[6][:2] == ("員工數", 3)
+    assert summary[7][:2] == ("人均加班時數", 2.17)
+    assert summary[8][:2] == ("最長加班", "bob/dev 2025/12/03")
+
+    # 員工工作表與單人匯出相同 (記錄 + 統計資訊)
+    single = ExportService().export_to_excel(_report(), "single.xlsx")
+    assert list(workbook["alice"].iter_rows(values_only=True)) == list(
+        openpyxl.load_workbook(single)["加班記錄"].iter_rows(values_only=True)
+    )
+
+
+def test_team_workbook_requires_reports(workdir):
+    """沒有報表時不產生檔案"""
+    assert ExportService().export_team_workbook({}) is None
+
+
+def test_text_report_aligns_cjk_columns(workdir):
+    """文字報表依顯示寬度對齊中文欄位名稱"""
+    from src.utils import display_width
+
+    text = ExportService().generate_text_report(_report())
+    lines = text.splitlines()
+    header = next(i for i, line in enumerate(lines) if "上班時間" in line)
+
+    assert display_width(lines[header]) == display_width(lines[header + 1])
+    assert lines[header + 1].split() == ["2025/12/02", "08:30:00", "20:00:00", "2.00"]
+    assert "最長加班日期: 2025/12/02" in lines
+
+
+def test_text_report_streams_to_file(workdir):
+    """指定 output 時逐行寫入檔案,內容與字串版本相同"""
+    import io
+
+    service = ExportService()
+    report = _report()
+    buffer = io.StringIO()
+
+    assert service.generate_text_report(report, show_all=False, output=buffer) == ""
+    assert buffer.getvalue() == service.generate_text_report(report, show_all=False)
+    assert "2025/12/01" not in buffer.getvalue()
+    assert service.generate_text_report(OvertimeReport(records=[])) == "沒有找到任何出勤記錄"
@@ -0,0 +1,77 @@
+"""啟動資料並行抓取測試"""
+
+import threading
+
+import pytest
+import requests
+
+from src.services import FetchOrchestrator
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    session.cookies.set("ASP.NET_SessionId", "original", domain="ssp.test", path="/")
+    return session
+
+
+def test_tasks_run_concurrently_and_stream_results(session):
+    """各工作同時執行,先完成的結果不必等待較慢的工作"""
+    barrier = threading.Barrier(2, timeout=5)
+    fast_reported = threading.Event()
+    order = []
+
+    def fast(task_session):
+        barrier.wait()  # 兩個工作必須同時在執行中才能通過
+        return "fast"
+
+    def slow(task_session):
+        barrier.wait()
+        assert fast_reported.wait(timeout=5)
+        return "slow"
+
+    def on_result(result):
+        order.append(result.name)
+        if result.name == "fast":
+            fast_reported.set()
+
+    results = FetchOrchestrator().run(session, {"slow": slow, "fast": fast}, on_result)
+
+    assert order == ["fast", "slow"]
+    assert list(results) == ["slow", "fast"]
+    assert results["slow"].value == "slow"
+
+
+def test_tasks_use_isolated_sessions_and_merge_cookies(session):
+    """工作使用複製的 session,伺服器更新的 cookie 合併回原 session"""
+    seen = []
+
+    def rotate(task_session):
+        seen.append(task_session)
+        assert task_session.cookies.get("ASP.NET_SessionId") == "original"
+        task_session.cookies.set("ASP.NET_SessionId", "rotated", domain="ssp.test", path="/")
+
+    def add_token(task_session):
+        seen.append(task_session)
+        task_session.cookies.set("token", "abc", domain="ssp.test", path="/")
+
+    FetchOrchestrator().run(session, {"rotate": rotate, "token": add_token})
+
+    assert all(s is not session for s in seen)
+    assert session.cookies.get("ASP.NET_SessionId") == "rotated"
+    assert session.cookies.get("token") == "abc"
+
+
+def test_failure_is_isolated(session):
+    """單一工作失敗不影響其他工作"""
+
+    def broken(task_session):
+        raise requests.exceptions.ConnectionError("boom")
+
+    results = FetchOrchestrator().run(
+        session, {"broken": broken, "ok": lambda task_session: 42}
+    )
+
+    assert not results["broken"].success
+    assert isinstance(results["broken"].error, requests.exceptions.ConnectionError)
+    assert results["ok"].success and results["ok"].value == 42
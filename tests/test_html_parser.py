@@ -0,0 +1,78 @@
+"""HTML 解析器後端一致性測試"""
+
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.config import Settings
+from src.services import DataService, OvertimeStatusService, PersonalRecordService
+from src.utils.html import make_soup
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PARSERS = ["html.parser", "lxml"]
+
+
+def _read(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def _parse_attendance(parser: str):
+    service = DataService(requests.Session(), Settings(HTML_PARSER=parser))
+    soup = make_soup(_read("fw99001z_page1.html"), parser)
+    return (
+        service._parse_attendance_table(soup),
+        service._get_pager_pages(soup),
+    )
+
+
+def _parse_history(parser: str):
+    settings = Settings(HTML_PARSER=parser)
+    soup = make_soup(_read("fw21003z.html"), parser)
+    personal_service = PersonalRecordService(settings.SSP_BASE_URL, settings=settings)
+    return (
+        OvertimeStatusService(settings)._parse_status_table(soup),
+        personal_service._parse_personal_records_table(soup),
+    )
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_attendance_page_parity(parser):
+    """出勤異常頁面在各解析器的結果一致"""
+    assert _parse_attendance(parser) == _parse_attendance("html.parser")
+
+
+def test_attendance_page_values():
+    """出勤異常頁面解析結果正確"""
+    records, pages = _parse_attendance("lxml")
+
+    assert records == [
+        {"date": "2025/11/28", "time_range": "08:42:11~19:06:52"},
+        {"date": "2025/11/27", "time_range": "09:12:40~20:31:05"},
+        {"date": "2025/11/26", "time_range": "07:58:03~18:45:00"},
+        {"date": "2025/11/24", "time_range": "08:30:00~21:15:44"},
+    ]
+    assert pages == [2, 3]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_history_page_parity(parser):
+    """個人紀錄查詢頁面在各解析器的結果一致"""
+    assert _parse_history(parser) == _parse_history("html.parser")
+
+
+def test_history_page_values():
+    """個人紀錄查詢頁面解析結果正確"""
+    submitted, personal = _parse_history("lxml")
+
+    assert sorted(submitted) == ["2025/11/20", "2025/11/27", "2025/11/28"]
+    assert submitted["2025/11/28"].status == "簽核中(主管)"
+    assert personal[0].content == '專案開發 & 上線支援 "ERP"'
+    assert personal[1].report_type == "調休"
+    assert len(personal) == 4
+
+
+def test_unknown_parser_falls_back():
+    """未安裝的解析器退回 html.parser"""
+    soup = make_soup("<p>測試</p>", "no-such-parser")
+    assert soup.p.get_text() == "測試"
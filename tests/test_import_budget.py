@@ -0,0 +1,88 @@
+"""啟動匯入成本測試"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 只有匯出 / 批次計算才需要的重量級套件,不應出現在登入畫面的匯入路徑上
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl")
+
+
+def _loaded_heavy_modules(module: str) -> list:
+    """在乾淨的直譯器中匯入指定模組,返回已載入的重量級套件"""
+    code = (
+        "import json, sys\n"
+        f"import {module}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, f"無法匯入 {module}:\n{result.stderr}"
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", ["app", "src.services"])
+def test_startup_does_not_import_export_stack(module):
+    """啟動時的匯入路徑不包含 pandas / numpy / openpyxl"""
+    assert _loaded_heavy_modules(module) == []
+
+
+def test_export_imports_on_first_use(tmp_path, monkeypatch):
+    """匯出時才載入 openpyxl,功能不受影響"""
+    from src.models import AttendanceRecord, OvertimeReport
+    from src.services import ExportService
+
+    monkeypatch.chdir(tmp_path)
+    report = OvertimeReport(
+        records=[
+            AttendanceRecord(
+                "2025/12/01", "08:00:00", "19:30:00", overtime_hours=1.5, total_minutes=690
+            )
+        ]
+    )
+
+    output = ExportService().export_to_excel(report, "report.xlsx")
+
+    assert output == "reports/report.xlsx"
+    assert (tmp_path / output).exists()
+
+
+def test_excel_export_does_not_import_pandas(tmp_path):
+    """Excel 匯出 (含批次結果) 以 openpyxl 串流寫出,文字報表自行排版,都不需要 pandas"""
+    code = (
+        "import json, sys\n"
+        "from src.models import AttendanceRecord, OvertimeReport\n"
+        "from src.services import ExportService\n"
+        "report = OvertimeReport(records=[AttendanceRecord("
+        "'2025/12/01', '08:00:00', '19:30:00', 1.5, 690)])\n"
+        "assert ExportService().export_to_excel(report, 'r.xlsx')\n"
+        "assert ExportService().generate_text_report(report)\n"
+        "from src.models import BatchAccountResult\n"
+        "assert ExportService().export_batch_to_excel("
+        "[BatchAccountResult('alice', True, report=report)], 'b.xlsx')\n"
+        "print(json.dumps('pandas' in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "reports" / "r.xlsx").exists()
+    assert (tmp_path / "b.xlsx").exists()
+    assert json.loads(result.stdout.strip().splitlines()[-1]) is False
@@ -0,0 +1,117 @@
+"""本機資料存放服務測試"""
+
+from datetime import date
+
+import pytest
+
+from benchmarks.ssp_pages import make_attendance_records
+from src.config import Settings
+from src.models.personal_record import PersonalRecord
+from src.services import LocalStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalStore(tmp_path / "store.db", Settings())
+
+
+def test_attendance_round_trip(store):
+    """寫入後依日期由新到舊讀回"""
+    records = make_attendance_records(30)
+
+    store.merge_attendance("alice", list(reversed(records)))
+
+    assert store.load_attendance("alice") == records
+    assert store.load_attendance("bob") == []
+
+
+def test_sync_since_uses_latest_day_and_overlap(store):
+    """增量同步起始日期為最新記錄往前重疊天數,未同步過時為 None"""
+    assert store.attendance_sync_since("alice") is None
+
+    store.merge_attendance("alice", make_attendance_records(5))
+
+    overlap = Settings().LOCAL_STORE_OVERLAP_DAYS
+    assert store.attendance_sync_since("alice") == date(2025, 12, 28 - overlap)
+
+
+def test_merge_replaces_only_since_window(store):
+    """增量合併只取代 since 之後的記錄,較舊的記錄保留"""
+    store.merge_attendance(
+        "alice",
+        [
+            {"date": "2025/11/03", "time_range": "08:00:00~19:00:00"},
+            {"date": "2025/11/10", "time_range": "08:00:00~19:00:00"},
+            {"date": "2025/11/12", "time_range": "08:00:00~20:00:00"},
+        ],
+    )
+
+    store.merge_attendance(
+        "alice",
+        [
+            {"date": "2025/11/20", "time_range": "08:00:00~21:00:00"},
+            {"date": "2025/11/12", "time_range": "08:30:00~20:00:00"},
+            {"date": "2025/11/08", "time_range": "08:00:00~18:00:00"},
+        ],
+        since=date(2025, 11, 10),
+    )
+
+    # 11/10 在本次涵蓋範圍內但未回傳 (已不在線上清單),11/08 較 since 舊則直接寫入
+    assert store.load_attendance("alice") == [
+        {"date": "2025/11/20", "time_range": "08:00:00~21:00:00"},
+        {"date": "2025/11/12", "time_range": "08:30:00~20:00:00"},
+        {"date": "2025/11/08", "time_range": "08:00:00~18:00:00"},
+        {"date": "2025/11/03", "time_range": "08:00:00~19:00:00"},
+    ]
+
+
+def test_truncated_fetch_keeps_uncovered_days(store):
+    """抓取中斷 (未回傳到 since) 時只取代實際涵蓋的日期"""
+    cached = make_attendance_records(20)
+    store.merge_attendance("alice", cached)
+
+    # 只回傳最新 5 筆 (例如第 2 頁翻頁失敗)
+    store.merge_attendance("alice", cached[:5], since=date(2025, 1, 1))
+    assert store.load_attendance("alice") == cached
+
+    store.merge_attendance("alice", [], since=date(2025, 1, 1))
+    assert store.load_attendance("alice") == cached
+
+
+def test_rows_outside_page_window_are_pruned(tmp_path):
+    """只保留最新 MAX_PAGES 頁範圍內的記錄"""
+    store = LocalStore(
+        tmp_path / "store.db", Settings(MAX_PAGES=2, ATTENDANCE_PAGE_SIZE=5)
+    )
+    records = make_attendance_records(30)
+
+    store.merge_attendance("alice", records)
+
+    assert store.load_attendance("alice") == records[:10]
+
+
+def test_personal_records_replaced_per_user(store):
+    """個人記錄整批取代並保留原始順序,不影響其他使用者"""
+    first = PersonalRecord("2025/11/05", "開發", "簽核中", 2.0, 2.0, 5.0, "加班")
+    second = PersonalRecord("2025/11/01", "維護", "簽核完成", 1.5, 3.5, 6.5, "調休")
+    store.replace_personal_records("alice", [first, second])
+    store.replace_personal_records("bob", [second])
+
+    updated = PersonalRecord("2025/11/05", "開發", "簽核完成", 2.0, 2.0, 5.0, "加班")
+    store.replace_personal_records("alice", [updated, second])
+
+    assert store.load_personal_records("alice") == [updated, second]
+    assert store.load_personal_records("bob") == [second]
+    assert store.get_synced_at("alice", "personal_records") is not None
+
+
+def test_clear_user(store):
+    """清除指定使用者的資料與同步狀態"""
+    store.merge_attendance("alice", make_attendance_records(3))
+    store.merge_attendance("bob", make_attendance_records(3))
+
+    store.clear("alice")
+
+    assert store.load_attendance("alice") == []
+    assert store.get_synced_at("alice") is None
+    assert len(store.load_attendance("bob")) == 3
@@ -0,0 +1,89 @@
+"""HTTP 請求計時測試"""
+
+import json
+
+import pytest
+import requests
+
+from benchmarks.ssp_pages import attendance_handler, make_attendance_records
+from src.config import Settings
+from src.services import DataService
+from src.utils import MetricsRegistry, SspSession, clone_session, track_parse
+from tests.ssp_pages import FakeSspAdapter
+
+PAGER_TARGET = "ctl00$ContentPlaceHolder1$gvWeb012"
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def session(registry):
+    adapter = FakeSspAdapter()
+    adapter.route("/FW99001Z.aspx", attendance_handler(make_attendance_records(35)))
+    session = SspSession(registry)
+    session.mount("https://", adapter)
+    return session
+
+
+def test_records_span_per_request(session, registry):
+    """翻頁的每次請求都記錄 URL、PostBack 目標、傳輸量與解析時間"""
+    service = DataService(session, Settings())
+
+    records = service.get_attendance_data(prefetch=False)
+
+    spans = registry.spans()
+    assert len(records) == 35
+    assert [s.method for s in spans] == ["GET", "POST", "POST", "POST"]
+    assert [s.event_target for s in spans] == ["", PAGER_TARGET, PAGER_TARGET, PAGER_TARGET]
+    assert all(s.path == "/FW99001Z.aspx" and s.status == 200 for s in spans)
+    assert all(s.response_bytes > 0 and s.parse_ms > 0 for s in spans)
+
+
+def test_summary_groups_by_event_target(session, registry, tmp_path):
+    """彙總依頁面與 PostBack 目標分組,並可輸出 JSON"""
+    DataService(session, Settings()).get_attendance_data(prefetch=True)
+
+    summary = {(g["method"], g["event_target"]): g for g in registry.summary()}
+    assert summary[("GET", "")]["count"] == 1
+    assert summary[("POST", PAGER_TARGET)]["count"] == 3
+
+    output = registry.dump_json(tmp_path / "metrics" / "run.json")
+    dumped = json.loads(open(output, encoding="utf-8").read())
+    assert len(dumped["spans"]) == 4
+    assert dumped["summary"] == registry.summary()
+
+
+def test_failed_request_is_recorded(registry):
+    """連線失敗也記錄 span,並保留原本的例外"""
+    adapter = FakeSspAdapter()
+    adapter.fail_pages.add("Page$2")
+    session = SspSession(registry)
+    session.mount("https://", adapter)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.post("https://ssp.test/FW99001Z.aspx", data={"__EVENTARGUMENT": "Page$2"})
+
+    (span,) = registry.spans()
+    assert span.error == "ConnectionError"
+    assert span.status is None
+
+
+def test_clone_shares_registry(session, registry):
+    """複製的 session 記錄到同一個登錄"""
+    clone = clone_session(session)
+    response = clone.get("https://ssp.test/FW99001Z.aspx")
+
+    with track_parse(response):
+        pass
+
+    assert isinstance(clone, SspSession)
+    assert registry.spans() == [response.span]
+
+
+def test_track_parse_ignores_plain_responses():
+    """一般 requests.Response 沒有 span 時不受影響"""
+    with track_parse(requests.Response()):
+        pass
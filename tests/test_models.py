@@ -128,3 +128,153 @@ class TestOvertimeReport:
         assert report.average_overtime_hours == 0
         assert report.max_overtime_hours == 0
         assert report.max_overtime_date == ""
+
+
+def _fresh_summary(report):
+    """以新報表重新計算的統計 (對照組)"""
+    return OvertimeReport(records=list(report.records)).get_summary()
+
+
+class TestOvertimeReportCache:
+    """OvertimeReport 統計快取測試"""
+
+    @staticmethod
+    def _record(day, hours):
+        return AttendanceRecord(f"2024/10/{day:02d}", "08:00:00", "18:00:00", hours)
+
+    def test_append_updates_cached_stats_incrementally(self):
+        """append / extend 增量更新,不重新建立快取"""
+        report = OvertimeReport(records=[self._record(1, 1.0)])
+        stats = report._stats()
+
+        report.records.append(self._record(2, 3.0))
+        report.records.extend([self._record(3, 0.0), self._record(4, 2.0)])
+
+        assert report._stats() is stats
+        assert report.overtime_days == 3
+        assert report.total_overtime_hours == 6.0
+        assert report.max_overtime_date == "2024/10/02"
+        assert report.get_summary() == _fresh_summary(report)
+
+    def test_update_record_adjusts_stats(self):
+        """修改單筆記錄後統計與重新計算相同"""
+        report = OvertimeReport(records=[self._record(d, d % 3) for d in range(1, 8)])
+        report.get_summary()
+
+        record = report.update_record(1, overtime_hours=5.0)
+        assert record.overtime_hours == 5.0
+        assert report.max_overtime_date == "2024/10/02"
+
+        report.update_record(1, overtime_hours=0.0)
+        assert report.max_overtime_date == "2024/10/05"
+        assert report.get_summary() == _fresh_summary(report)
+
+    def test_update_record_total_has_no_float_drift(self):
+        """修改記錄後總時數與依序加總完全相同 (不累積加減差值的誤差)"""
+        import random
+
+        rng = random.Random(3)
+        report = OvertimeReport(
+            records=[self._record(d, round(rng.uniform(0, 4), 2)) for d in range(1, 29)]
+        )
+        report.get_summary()
+        for _ in range(200):
+            report.update_record(
+                rng.randrange(len(report.records)), overtime_hours=round(rng.uniform(0, 4), 2)
+            )
+            assert report.total_overtime_hours == sum(
+                r.overtime_hours for r in report.records
+            )
+        report.records.sort(key=lambda r: r.overtime_hours)
+        assert report.total_overtime_hours == sum(r.overtime_hours for r in report.records)
+
+    def test_mutations_keep_stats_consistent(self):
+        """任意修改序列後,快取的統計都與重新計算相同"""
+        import random
+
+        rng = random.Random(7)
+        report = OvertimeReport(
+            records=[self._record(d, rng.choice([0, 1, 2])) for d in range(1, 10)]
+        )
+        for step in range(300):
+            report.get_summary()
+            action = rng.randrange(6)
+            if action == 0:
+                report.records.append(
+                    self._record(rng.randrange(1, 29), rng.choice([0, 1, 2, 3]))
+                )
+            elif action == 1 and report.records:
+                report.update_record(
+                    rng.randrange(len(report.records)),
+                    overtime_hours=rng.choice([0, 1, 2, 3]),
+                )
+            elif action == 2:
+                report.records.sort(key=lambda r: r.date, reverse=rng.random() < 0.5)
+            elif action == 3 and report.records:
+                report.records.pop(rng.randrange(len(report.records)))
+            elif action == 4:
+                report.records.insert(0, self._record(rng.randrange(1, 29), 3))
+            else:
+                report.records.reverse()
+
+            assert report.get_summary() == _fresh_summary(report), step
+            assert report.max_overtime_hours == max(
+                (r.overtime_hours for r in report.records), default=0.0
+            )
+
+    def test_reassigning_records_resets_stats(self):
+        """重新指定 records 或 invalidate 後重新計算"""
+        report = OvertimeReport(records=[self._record(1, 1.0)])
+        assert report.total_overtime_hours == 1.0
+
+        report.records = [self._record(2, 2.5)]
+        assert report.total_overtime_hours == 2.5
+
+        report.records[0].overtime_hours = 4.0  # 直接修改欄位無法偵測
+        report.invalidate()
+        assert report.max_overtime_hours == 4.0
+
+    def test_report_survives_pickle(self):
+        """序列化後仍可正常修改與統計"""
+        import pickle
+
+        report = OvertimeReport(records=[self._record(1, 1.0)])
+        report.get_summary()
+        restored = pickle.loads(pickle.dumps(report))
+
+        restored.records.append(self._record(2, 2.0))
+        assert restored == OvertimeReport(
+            records=restored.records, generated_at=report.generated_at
+        )
+        assert restored.get_summary() == _fresh_summary(restored)
+
+    def test_copy_gets_its_own_record_list(self):
+        """淺複製有自己的記錄清單,修改複本不影響原報表的統計"""
+        import copy
+
+        report = OvertimeReport(records=[self._record(1, 1.0)])
+        report.get_summary()
+        clone = copy.copy(report)
+
+        clone.records.append(self._record(2, 3.0))
+
+        assert clone.records is not report.records
+        assert clone.records[0] is report.records[0]
+        assert report.total_overtime_hours == 1.0
+        assert clone.total_overtime_hours == 4.0
+        assert clone.get_summary() == _fresh_summary(clone)
+
+    def test_deepcopy(self):
+        """深複製可用且與原報表相等,之後各自更新統計"""
+        import copy
+
+        report = OvertimeReport(records=[self._record(1, 1.0), self._record(2, 2.0)])
+        report.get_summary()
+        clone = copy.deepcopy(report)
+
+        assert clone == report
+        assert clone.records[0] is not report.records[0]
+        clone.update_record(0, overtime_hours=4.0)
+        assert report.max_overtime_hours == 2.0
+        assert clone.max_overtime_hours == 4.0
+        assert clone.get_summary() == _fresh_summary(clone)
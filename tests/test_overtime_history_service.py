@@ -0,0 +1,108 @@
+"""個人紀錄查詢共用擷取服務測試"""
+
+import pytest
+
+from benchmarks.ssp_pages import history_page, make_history_rows
+from src.config import Settings
+from src.services import (
+    OvertimeHistoryService,
+    OvertimeStatusService,
+    PersonalRecordService,
+)
+from tests.ssp_pages import FakeSspAdapter, make_session
+
+HISTORY_PATH = "/FW21003Z.aspx"
+
+
+@pytest.fixture
+def adapter():
+    fake = FakeSspAdapter()
+    rows = make_history_rows(40)
+    fake.route(HISTORY_PATH, lambda method, form: history_page(rows))
+    return fake
+
+
+@pytest.fixture
+def session(adapter):
+    return make_session(adapter)
+
+
+def _build_services(settings=None):
+    settings = settings or Settings()
+    history_service = OvertimeHistoryService(settings)
+    status_service = OvertimeStatusService(settings, history_service=history_service)
+    personal_service = PersonalRecordService(
+        settings.SSP_BASE_URL, history_service=history_service
+    )
+    return history_service, status_service, personal_service
+
+
+def test_status_and_personal_share_single_request(adapter, session):
+    """已申請狀態與個人記錄共用同一次下載"""
+    _, status_service, personal_service = _build_services()
+
+    records, summary = personal_service.fetch_personal_records(session)
+    submitted = status_service.fetch_submitted_records(session)
+
+    assert adapter.count(HISTORY_PATH) == 1
+    assert len(records) == 40
+    assert summary.total_records == 40
+    assert len(submitted) == len({r.date for r in records})
+
+
+def test_shared_results_match_standalone_services(adapter, session):
+    """共用擷取的解析結果與各服務單獨查詢相同"""
+    _, status_service, personal_service = _build_services()
+    settings = Settings()
+
+    shared_records, shared_summary = personal_service.fetch_personal_records(session)
+    shared_submitted = status_service.fetch_submitted_records(session)
+
+    records, summary = PersonalRecordService(
+        settings.SSP_BASE_URL
+    ).fetch_personal_records(session)
+    submitted = OvertimeStatusService(settings).fetch_submitted_records(session)
+
+    assert shared_records == records
+    assert shared_summary == summary
+    assert shared_submitted == submitted
+
+
+def test_force_and_ttl_trigger_refetch(adapter, session):
+    """強制更新或快取逾期時重新下載"""
+    history_service, status_service, _ = _build_services()
+
+    status_service.fetch_submitted_records(session)
+    status_service.fetch_submitted_records(session, force=True)
+    assert adapter.count(HISTORY_PATH) == 2
+
+    history_service._cached_at -= Settings().OVERTIME_HISTORY_TTL + 1
+    status_service.fetch_submitted_records(session)
+    assert adapter.count(HISTORY_PATH) == 3
+
+    history_service.invalidate()
+    status_service.fetch_submitted_records(session)
+    assert adapter.count(HISTORY_PATH) == 4
+
+
+def test_cache_is_scoped_to_session(adapter, session):
+    """不同 session (例如重新登入) 不共用快取"""
+    _, status_service, _ = _build_services()
+
+    status_service.fetch_submitted_records(session)
+    status_service.fetch_submitted_records(make_session(adapter))
+
+    assert adapter.count(HISTORY_PATH) == 2
+
+
+def test_returned_collections_are_copies(adapter, session):
+    """回傳的集合為複本,呼叫端修改不影響快取"""
+    _, status_service, personal_service = _build_services()
+
+    submitted = status_service.fetch_submitted_records(session)
+    submitted.clear()
+    records, _ = personal_service.fetch_personal_records(session)
+    records.clear()
+
+    assert status_service.fetch_submitted_records(session)
+    assert personal_service.fetch_personal_records(session)[0]
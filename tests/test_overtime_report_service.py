@@ -0,0 +1,81 @@
+"""測試加班補報表單填寫服務"""
+
+from benchmarks.ssp_pages import report_form_handler
+from src.config import Settings
+from src.models import OvertimeSubmissionRecord
+from src.services import OvertimeReportService
+from tests.ssp_pages import FakeSspAdapter, make_session
+
+FORM_PATH = "/FW21001Z.aspx"
+COMMIT = "ctl00$ContentPlaceHolder1$btnCommit"
+ADD_ROW = "ctl00$ContentPlaceHolder1$lbgvAddRowi"
+
+
+def _records(count: int):
+    return [
+        OvertimeSubmissionRecord(
+            date=f"2025/11/{day:02d}", description="開發", overtime_hours=1.5
+        )
+        for day in range(1, count + 1)
+    ]
+
+
+def _committed_dates(adapter: FakeSspAdapter):
+    """依申請單分組取出送出的日期"""
+    forms = []
+    for request in adapter.requests:
+        form = request["form"]
+        if COMMIT in form:
+            forms.append(
+                sorted(value for key, value in form.items() if key.endswith("$txtOT_Datei"))
+            )
+    return sorted(forms)
+
+
+def test_submit_fills_one_form():
+    """所有記錄填在同一張申請單,只補足頁面缺少的輸入列"""
+    adapter = FakeSspAdapter()
+    adapter.route(FORM_PATH, report_form_handler())
+
+    result = OvertimeReportService(Settings()).submit_form(
+        make_session(adapter), _records(12)
+    )
+
+    assert result == {"success": True, "submitted_count": 12}
+    assert _committed_dates(adapter) == [[f"2025/11/{day:02d}" for day in range(1, 13)]]
+    add_rows = [r for r in adapter.requests if r["form"].get("__EVENTTARGET") == ADD_ROW]
+    assert len(add_rows) == 11
+    assert adapter.count(FORM_PATH) == 1 + 11 + 1
+
+
+def test_existing_rows_are_reused():
+    """頁面已有足夠輸入列時不送出增加列 PostBack"""
+    adapter = FakeSspAdapter()
+    adapter.route(FORM_PATH, report_form_handler(initial_rows=3))
+
+    result = OvertimeReportService(Settings()).preview_form(
+        make_session(adapter), _records(3)
+    )
+
+    assert result["success"] is True
+    assert adapter.count(FORM_PATH) == 1
+    assert result["form_data"]["__VIEWSTATE"] == "VS-FORM-3"
+
+
+def test_failed_submission_is_reported():
+    """申請單送出失敗時回報失敗"""
+    adapter = FakeSspAdapter()
+    form_handler = report_form_handler()
+
+    def handler(method, form):
+        if COMMIT in form:
+            return "<html><body>系統錯誤</body></html>"
+        return form_handler(method, form)
+
+    adapter.route(FORM_PATH, handler)
+
+    result = OvertimeReportService(Settings()).submit_form(
+        make_session(adapter), _records(2)
+    )
+
+    assert result == {"success": False, "error": "表單送出失敗,請檢查日誌"}
@@ -114,3 +114,32 @@ def test_template_menu_updates_with_saved_values(tk_root, template_manager):
     assert tab.template_menu is not None
     assert tuple(tab.template_menu.cget("values")) == ("套用範本",)
     assert tab.template_menu.cget("state") == "disabled"
+
+
+def test_record_list_recycles_rows(tk_root, template_manager):
+    """大量記錄只建立可視列,捲動時重複使用並保留編輯結果"""
+    records = [
+        OvertimeSubmissionRecord(
+            date=f"2025/{month:02d}/{day:02d}",
+            description="",
+            overtime_hours=1.0,
+        )
+        for month in range(1, 13)
+        for day in range(1, 26)
+    ]
+
+    tab = _build_tab_with_records(tk_root, records, template_manager)
+    records_list = tab.records_list
+
+    assert len(records_list.rows) < 20
+    first_row = records_list.rows[0]
+    assert first_row.record is records[0]
+
+    first_row.hours_var.set("2.5")
+    records_list.scroll_to(records_list.content_height)
+
+    assert records[0].overtime_hours == 2.5
+    assert first_row.record is not records[0]
+    assert any(row.record is records[-1] for row in records_list.rows)
+    assert len(records_list.rows) < 20
+    assert len(tab.record_content_entries) <= len(records_list.rows)
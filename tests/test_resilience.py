@@ -0,0 +1,177 @@
+"""請求重試與斷路器測試"""
+
+import pytest
+import requests
+
+from benchmarks.ssp_pages import attendance_handler, make_attendance_records
+from src.config import Settings
+from src.services import DataService
+from src.utils.http import SspSession
+from src.utils.metrics import MetricsRegistry
+from src.utils.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilienceLayer,
+    RetryPolicy,
+)
+from tests.ssp_pages import FakeSspAdapter
+
+BASE = "https://ssp.teco.com.tw"
+RECORDS = make_attendance_records(35)
+
+
+class FlakyAdapter(FakeSspAdapter):
+    """前 failures 次符合條件的請求失敗的 adapter"""
+
+    def __init__(self, failures=1, match=lambda form: True, status=None):
+        super().__init__()
+        self.failures = failures
+        self.match = match
+        self.status = status
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        form = self.requests[-1]["form"]
+        if self.failures and self.match(form):
+            self.failures -= 1
+            if self.status is None:
+                raise requests.exceptions.ConnectionError("模擬連線逾時")
+            response.status_code = self.status
+        return response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _session(adapter, layer=None, metrics=None):
+    layer = layer or ResilienceLayer(RetryPolicy(backoff_base=0), sleep=lambda _: None)
+    session = SspSession(metrics=metrics or MetricsRegistry(), resilience=layer)
+    session.mount("https://", adapter)
+    return session, layer
+
+
+def test_transient_page_failure_is_retried():
+    """翻頁暫時失敗時重試,不再截斷結果"""
+    adapter = FlakyAdapter(match=lambda form: form.get("__EVENTARGUMENT") == "Page$3")
+    adapter.route("/FW99001Z.aspx", attendance_handler(RECORDS))
+    metrics = MetricsRegistry()
+    session, layer = _session(adapter, metrics=metrics)
+
+    records = DataService(session, Settings()).get_attendance_data(prefetch=False)
+
+    assert len(records) == len(RECORDS)
+    stats = layer.stats()["/FW99001Z.aspx"]
+    assert stats["retries"] == 1
+    assert stats["failures"] == 0
+    assert [s.attempt for s in metrics.spans()].count(2) == 1
+
+
+def test_commit_postback_is_never_retried():
+    """送出申請單的 PostBack 失敗時不重送"""
+    adapter = FlakyAdapter()
+    session, layer = _session(
+        adapter,
+        ResilienceLayer(
+            RetryPolicy(backoff_base=0),
+            non_idempotent_fields=Settings().NON_IDEMPOTENT_FIELDS,
+            sleep=lambda _: None,
+        ),
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.post(
+            f"{BASE}/FW21001Z.aspx",
+            data={"ctl00$ContentPlaceHolder1$btnCommit": "送出"},
+        )
+
+    assert adapter.count() == 1
+    assert layer.stats()["/FW21001Z.aspx"]["failures"] == 1
+
+
+def test_server_error_status_retried_until_limit():
+    """5xx 回應依設定次數重試,仍失敗時返回最後的回應"""
+    adapter = FlakyAdapter(failures=5, status=503)
+    adapter.route("/FW99001Z.aspx", attendance_handler(RECORDS))
+    delays = []
+    layer = ResilienceLayer(
+        RetryPolicy(max_attempts=3, backoff_base=1.0, backoff_max=1.5),
+        sleep=delays.append,
+    )
+    session, _ = _session(adapter, layer)
+
+    response = session.get(f"{BASE}/FW99001Z.aspx")
+
+    assert response.status_code == 503
+    assert adapter.count() == 3
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 1.5
+
+
+def test_endpoint_policy_from_settings():
+    """個別端點可設定不同的重試次數"""
+    settings = Settings(RETRY_POLICIES={"/index.aspx": {"max_attempts": 1}})
+    layer = ResilienceLayer.from_settings(settings)
+
+    assert layer.policy_for(f"{BASE}/index.aspx").max_attempts == 1
+    assert layer.policy_for(f"{BASE}/FW99001Z.aspx").max_attempts == 3
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """連續失敗後暫停送出,等待後放行一個試探請求"""
+    clock = FakeClock()
+    adapter = FlakyAdapter(failures=2)
+    adapter.route("/FW99001Z.aspx", attendance_handler(RECORDS))
+    layer = ResilienceLayer(
+        RetryPolicy(max_attempts=1),
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock),
+    )
+    session, _ = _session(adapter, layer)
+    url = f"{BASE}/FW99001Z.aspx"
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get(url)
+    with pytest.raises(CircuitOpenError):
+        session.get(url)
+    assert adapter.count() == 2
+    assert layer.stats()["/FW99001Z.aspx"]["rejected"] == 1
+
+    clock.now = 10
+    assert layer.breaker.state == CircuitBreaker.HALF_OPEN
+    assert session.get(url).status_code == 200
+    assert layer.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_unexpected_probe_error_releases_half_open_probe():
+    """半開時試探請求拋出其他例外,仍記錄失敗並在下次等待後再放行試探"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    layer = ResilienceLayer(RetryPolicy(max_attempts=1), breaker=breaker)
+    url = f"{BASE}/FW99001Z.aspx"
+    ok = requests.Response()
+    ok.status_code = 200
+
+    def fail(attempt, error):
+        raise error
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        layer.execute(
+            "GET", url, None, lambda a: fail(a, requests.exceptions.ConnectionError())
+        )
+    clock.now = 10
+    with pytest.raises(requests.exceptions.TooManyRedirects):
+        layer.execute(
+            "GET", url, None, lambda a: fail(a, requests.exceptions.TooManyRedirects())
+        )
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert layer.stats()["/FW99001Z.aspx"]["failures"] == 2
+
+    clock.now = 20
+    assert layer.execute("GET", url, None, lambda a: ok) is ok
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,169 @@
+"""Session 逾時自動重新登入測試"""
+
+import pytest
+
+from benchmarks.ssp_pages import attendance_handler, login_handler, make_attendance_records
+from src.config import Settings
+from src.services import AuthService, DataService, SessionGuard
+from src.utils.http import SessionExpiredError, SspSession, clone_session
+from tests.ssp_pages import FakeSspAdapter
+
+RECORDS = make_attendance_records(35)
+
+
+@pytest.fixture
+def adapter():
+    adapter = FakeSspAdapter()
+    adapter.route("/index.aspx", login_handler({"alice": "pw"}))
+    adapter.route("/FW99001Z.aspx", attendance_handler(RECORDS))
+    adapter.session_id = "first"
+    return adapter
+
+
+def _guarded_session(adapter, password="pw"):
+    auth = AuthService(Settings())
+    auth.session.mount("https://", adapter)
+    assert auth.login("alice", "pw")
+    guard = SessionGuard("alice", lambda: password, Settings())
+    return guard.attach(auth.get_session()), guard
+
+
+def test_expired_session_relogs_in_and_replays(adapter):
+    """session 逾時時自動重新登入,原請求重送後取得完整資料"""
+    session, guard = _guarded_session(adapter)
+    adapter.session_id = "second"  # 伺服器端 session 逾時
+
+    records = DataService(session, Settings()).get_attendance_data(prefetch=False)
+
+    assert len(records) == len(RECORDS)
+    assert guard.reauth_count == 1
+    assert session.cookies.get("ASP.NET_SessionId") == "second"
+
+
+def test_unexpired_session_does_not_relogin(adapter):
+    """session 有效時不重新登入"""
+    session, guard = _guarded_session(adapter)
+    logins = adapter.count("/index.aspx")
+
+    DataService(session, Settings()).get_attendance_data(prefetch=False)
+
+    assert guard.reauth_count == 0
+    assert adapter.count("/index.aspx") == logins
+
+
+def test_parallel_clones_share_single_relogin(adapter):
+    """平行預取的 session 同時逾時時只重新登入一次"""
+    session, guard = _guarded_session(adapter)
+    adapter.session_id = "second"
+
+    records = DataService(session, Settings()).get_attendance_data(prefetch=True)
+
+    assert len(records) == len(RECORDS)
+    assert guard.reauth_count == 1
+
+    # 原 session 之後的請求沿用新的 cookie,不再重新登入
+    response = clone_session(session).get("https://ssp.teco.com.tw/FW99001Z.aspx")
+    assert response.status_code == 200
+    assert guard.reauth_count == 1
+
+
+def test_failed_relogin_returns_original_response(adapter):
+    """重新登入失敗時回傳原本的轉址結果,不重複嘗試"""
+    session, guard = _guarded_session(adapter, password="wrong")
+    adapter.session_id = "second"
+
+    response = session.get(
+        "https://ssp.teco.com.tw/FW99001Z.aspx", allow_redirects=False
+    )
+
+    assert response.status_code == 302
+    assert guard.reauth_count == 0
+
+
+def test_detach_stops_relogin(adapter):
+    """移除守衛後不再自動重新登入"""
+    session, guard = _guarded_session(adapter)
+    guard.detach(session)
+    adapter.session_id = "second"
+
+    response = session.get(
+        "https://ssp.teco.com.tw/FW99001Z.aspx", allow_redirects=False
+    )
+
+    assert response.status_code == 302
+    assert guard.reauth_count == 0
+
+
+def test_expired_postback_is_not_replayed(adapter):
+    """PostBack 逾時時重新登入但不重送,拋出 SessionExpiredError"""
+    session, guard = _guarded_session(adapter)
+    adapter.session_id = "second"
+    attendance = adapter.count("/FW99001Z.aspx")
+
+    with pytest.raises(SessionExpiredError):
+        session.post(
+            "https://ssp.teco.com.tw/FW99001Z.aspx", data={"__VIEWSTATE": "OLD"}
+        )
+
+    assert guard.reauth_count == 1
+    assert adapter.count("/FW99001Z.aspx") == attendance + 1
+    # 重新登入後 GET 可正常使用
+    assert session.get("https://ssp.teco.com.tw/FW99001Z.aspx").status_code == 200
+
+
+def test_guard_reads_password_only_when_relogging_in(adapter):
+    """密碼由 provider 在重新登入時才取得,登出後不再讀取"""
+    calls = []
+
+    def provider():
+        calls.append(1)
+        return "pw"
+
+    auth = AuthService(Settings())
+    auth.session.mount("https://", adapter)
+    assert auth.login("alice", "pw")
+    session = SessionGuard("alice", provider, Settings()).attach(auth.get_session())
+    assert calls == []
+
+    adapter.session_id = "second"
+    session.get("https://ssp.teco.com.tw/FW99001Z.aspx")
+    assert calls == [1]
+
+    session.session_guard.detach(session)
+    assert session.session_guard is None
+
+
+def test_expired_paging_reloads_page_through_stub():
+    """經由模擬伺服器: 翻頁 PostBack 逾時時重新載入第 1 頁,不重送舊 ViewState"""
+    from benchmarks.ssp_stub import SspStubServer
+
+    with SspStubServer(RECORDS) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url)
+        auth = AuthService(settings, session=SspSession())
+        assert auth.login("bench", "bench")
+        guard = SessionGuard("bench", lambda: "bench", settings)
+        session = guard.attach(auth.get_session())
+
+        page = server.handlers["/FW99001Z.aspx"]
+        calls = []
+
+        def expire_after_first_page(method, form):
+            html = page(method, form)
+            calls.append((method, form.get("__EVENTARGUMENT")))
+            if len(calls) == 1:
+                server.expire_sessions()
+            return html
+
+        server.handlers["/FW99001Z.aspx"] = expire_after_first_page
+        records = DataService(session, settings).get_attendance_data(prefetch=False)
+
+    assert len(records) == len(RECORDS)
+    assert guard.reauth_count == 1
+    # 逾時的 Page$2 被轉回登入頁,重新 GET 後才以新的 ViewState 翻頁
+    assert calls == [
+        ("GET", None),
+        ("GET", None),
+        ("POST", "Page$2"),
+        ("POST", "Page$3"),
+        ("POST", "Page$4"),
+    ]
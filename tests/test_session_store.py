@@ -0,0 +1,111 @@
+"""登入 session 保存與沿用測試"""
+
+import pytest
+from cryptography.fernet import Fernet
+
+from benchmarks.ssp_pages import attendance_handler, login_handler
+from src.config import Settings
+from src.services import AuthService, SessionStore
+from tests.ssp_pages import FakeSspAdapter
+
+
+class FakeCredentialManager:
+    """只提供加解密的憑證管理器 (不使用系統 keyring)"""
+
+    def __init__(self):
+        self._cipher = Fernet(Fernet.generate_key())
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._cipher.encrypt(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        return self._cipher.decrypt(token)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(FakeCredentialManager(), path=tmp_path / "session.bin")
+
+
+@pytest.fixture
+def adapter():
+    adapter = FakeSspAdapter()
+    adapter.route("/index.aspx", login_handler({"alice": "pw"}))
+    adapter.route("/FW99001Z.aspx", attendance_handler([]))
+    adapter.session_id = "live-session"
+    return adapter
+
+
+def _auth(adapter):
+    auth = AuthService(Settings())
+    auth.session.mount("https://", adapter)
+    return auth
+
+
+def _logged_in_auth(adapter, session_id="live-session"):
+    auth = _auth(adapter)
+    auth.session.cookies.set(
+        "ASP.NET_SessionId", session_id, domain="ssp.teco.com.tw", path="/"
+    )
+    return auth
+
+
+def test_save_is_encrypted_and_bound_to_user(store, adapter):
+    """存檔內容經過加密,且只還原給同一個帳號"""
+    store.save("alice", _logged_in_auth(adapter).session)
+
+    assert b"live-session" not in store.path.read_bytes()
+    assert not store.restore("bob", _auth(adapter).session)
+
+    auth = _auth(adapter)
+    assert store.restore("alice", auth.session)
+    assert auth.session.cookies.get("ASP.NET_SessionId") == "live-session"
+
+
+def test_restore_skips_old_or_corrupt_files(store, adapter):
+    """超過保存期限或無法解密時不還原,損毀的檔案會被刪除"""
+    store.save("alice", _logged_in_auth(adapter).session)
+    store.settings.SESSION_MAX_AGE = -1
+    assert not store.restore("alice", _auth(adapter).session)
+
+    store.path.write_bytes(b"not a fernet token")
+    assert not store.restore("alice", _auth(adapter).session)
+    assert not store.path.exists()
+
+
+def test_resume_valid_session_skips_login(store, adapter):
+    """session 仍有效時沿用,不經過登入頁"""
+    store.save("alice", _logged_in_auth(adapter).session)
+
+    auth = _auth(adapter)
+
+    assert auth.resume("alice", store)
+    assert adapter.count("/index.aspx") == 0
+    assert adapter.count("/FW99001Z.aspx") == 1
+
+
+def test_resume_expired_session_falls_back_to_login(store, adapter):
+    """session 已失效時清除保存的 cookie,改為重新登入"""
+    store.save("alice", _logged_in_auth(adapter, "expired-session").session)
+
+    auth = _auth(adapter)
+
+    assert not auth.resume("alice", store)
+    assert not auth.session.cookies
+    assert not store.path.exists()
+    assert auth.login("alice", "pw")
+
+
+def test_default_path_is_in_user_app_data(tmp_path, monkeypatch):
+    """預設存檔位置在使用者的程式資料夾,不隨目前目錄改變"""
+    import sys
+
+    from src.config import app_data_dir
+
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    store = SessionStore(FakeCredentialManager(), settings=Settings())
+
+    assert app_data_dir() == tmp_path / "OvertimeAssistant"
+    assert store.path == tmp_path / "OvertimeAssistant" / "session.bin"
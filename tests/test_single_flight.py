@@ -0,0 +1,182 @@
+"""並行請求合併測試"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.ssp_pages import history_page, make_history_rows
+from src.config import Settings
+from src.services import (
+    OvertimeHistoryService,
+    OvertimeStatusService,
+    PersonalRecordService,
+)
+from src.services.overtime_history_service import _session_key
+from src.utils.http import clone_session
+from src.utils.single_flight import SingleFlight
+from tests.ssp_pages import FakeSspAdapter, make_session
+
+HISTORY_PATH = "/FW21003Z.aspx"
+
+
+def _run_while_blocked(flight, key, count, func):
+    """在 func 執行中讓 count 個呼叫者同時呼叫 flight.do"""
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return func()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(flight.do, key, slow) for _ in range(count)]
+        while flight.waiting(key) < count - 1:
+            threading.Event().wait(0.005)
+        release.set()
+        return futures
+
+
+def test_concurrent_callers_share_one_execution():
+    """同一個 key 同時的呼叫只執行一次,共用結果"""
+    flight = SingleFlight()
+    calls = []
+
+    futures = _run_while_blocked(flight, "k", 5, lambda: calls.append(1) or "result")
+
+    assert [f.result() for f in futures] == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.executions == 1
+    assert not flight.in_flight("k")
+
+    # 完成後的呼叫重新執行
+    assert flight.do("k", lambda: "again") == "again"
+    assert flight.executions == 2
+    assert flight.shared == 4
+    # 完成的 key 不留下任何記錄
+    assert flight._calls == {} and flight.waiting("k") == 0
+
+
+def test_error_is_shared_by_all_callers():
+    """執行失敗時所有等待的呼叫者都收到例外"""
+    flight = SingleFlight()
+
+    futures = _run_while_blocked(flight, "k", 3, lambda: 1 / 0)
+
+    for future in futures:
+        with pytest.raises(ZeroDivisionError):
+            future.result()
+    assert flight.executions == 1
+
+
+def test_supersede_cancels_previous_token():
+    """同一個 key 的新工作取消前一個標記,不影響其他 key"""
+    flight = SingleFlight()
+
+    first = flight.supersede("status")
+    other = flight.supersede("personal")
+    second = flight.supersede("status")
+
+    assert first.cancelled
+    assert not second.cancelled
+    assert not other.cancelled
+
+
+def test_concurrent_tab_refreshes_send_one_request():
+    """強制重新整理進行中時,其他分頁的查詢共用同一次個人紀錄查詢"""
+    release = threading.Event()
+    rows = make_history_rows(10)
+
+    def handler(method, form):
+        release.wait(5)
+        return history_page(rows)
+
+    adapter = FakeSspAdapter()
+    adapter.route(HISTORY_PATH, handler)
+    session = make_session(adapter)
+
+    settings = Settings()
+    history = OvertimeHistoryService(settings)
+    status = OvertimeStatusService(settings, history_service=history)
+    personal = PersonalRecordService(
+        settings.SSP_BASE_URL, history_service=history, settings=settings
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(status.fetch_submitted_records, session, True)]
+        key = (_session_key(session), 0)
+        while not history._flight.in_flight(key):
+            threading.Event().wait(0.005)
+        futures += [
+            executor.submit(personal.fetch_personal_records, session),
+            executor.submit(personal.fetch_personal_records, clone_session(session)),
+            executor.submit(status.fetch_submitted_records, session),
+        ]
+        while history._flight.waiting(key) < 3:
+            threading.Event().wait(0.005)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert adapter.count(HISTORY_PATH) == 1
+    assert len(results[1][0]) == 10
+    assert results[0] == results[3]
+
+    # 進行中的請求結束後,再次強制重新整理會送出新的請求
+    status.fetch_submitted_records(session, force=True)
+    assert adapter.count(HISTORY_PATH) == 2
+
+
+def test_concurrent_forced_refreshes_send_one_request():
+    """同時的強制重新整理 (重複點擊、兩個分頁) 共用同一次下載"""
+    release = threading.Event()
+
+    def handler(method, form):
+        release.wait(5)
+        return history_page(make_history_rows(3))
+
+    adapter = FakeSspAdapter()
+    adapter.route(HISTORY_PATH, handler)
+    session = make_session(adapter)
+    history = OvertimeHistoryService(Settings())
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(history.fetch, session, True) for _ in range(2)]
+        key = (_session_key(session), 0)
+        while history._flight.waiting(key) < 1:
+            threading.Event().wait(0.005)
+        release.set()
+        first, second = [f.result() for f in futures]
+
+    assert adapter.count(HISTORY_PATH) == 1
+    assert first is second
+
+
+def test_fetch_after_invalidate_does_not_join_earlier_download():
+    """invalidate 之後的查詢不共用之前已開始的下載,舊結果也不寫入快取"""
+    started = threading.Event()
+    release = threading.Event()
+    responses = iter([make_history_rows(1), make_history_rows(2)])
+
+    def handler(method, form):
+        rows = next(responses)
+        if len(rows) == 1:
+            started.set()
+            release.wait(5)
+        return history_page(rows)
+
+    adapter = FakeSspAdapter()
+    adapter.route(HISTORY_PATH, handler)
+    session = make_session(adapter)
+    history = OvertimeHistoryService(Settings())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stale = executor.submit(history.fetch, session)
+        started.wait(5)
+        history.invalidate()  # 例如送出申請後
+        fresh = history.fetch(session, force=True)
+        release.set()
+        assert len(stale.result().personal_records) == 1
+
+    assert len(fresh.personal_records) == 2
+    assert adapter.count(HISTORY_PATH) == 2
+    # 快取保留 invalidate 之後的下載結果
+    assert len(history.fetch(session).personal_records) == 2
@@ -0,0 +1,19 @@
+"""等寬文字排版測試"""
+
+from src.utils.text_width import display_width, pad
+
+
+def test_display_width_counts_wide_characters_twice():
+    """全形字元計 2,組合字元計 0"""
+    assert display_width("08:30:00") == 8
+    assert display_width("加班時數") == 8
+    assert display_width("ＡB") == 3
+    assert display_width("é") == 1
+
+
+def test_pad_uses_display_width():
+    """依顯示寬度靠左、靠右、置中補齊,過寬時不截斷"""
+    assert pad("日期", 6) == "日期  "
+    assert pad("日期", 6, ">") == "  日期"
+    assert pad("日期", 7, "^") == " 日期  "
+    assert pad("加班時數", 4) == "加班時數"
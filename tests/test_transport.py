@@ -0,0 +1,54 @@
+"""共用連線池測試"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.ssp_pages import make_attendance_records
+from benchmarks.ssp_stub import SspStubServer
+from src.config import Settings
+from src.services import AuthService, DataService
+from src.utils.http import clone_session
+from src.utils.transport import Transport
+
+
+def test_sessions_reuse_keep_alive_connections():
+    """不同 session 共用同一條 keep-alive 連線"""
+    transport = Transport(pool_maxsize=2)
+    with SspStubServer(make_attendance_records(25)) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url)
+        for _ in range(2):
+            auth = AuthService(settings, session=transport.ssp_session())
+            assert auth.login("bench", "bench")
+            DataService(auth.get_session(), settings).get_attendance_data()
+
+    stats = transport.stats()
+    assert stats["connections_opened"] == 1
+    assert stats["pooled_requests"] == stats["requests"] > 1
+    assert stats["reuse_rate"] > 0.8
+    assert stats["saturated_requests"] == 0
+    transport.close()
+
+
+def test_reports_pool_saturation():
+    """平行請求超過連線池大小時記錄飽和"""
+    transport = Transport(pool_maxsize=1)
+    with SspStubServer(make_attendance_records(5), latency=0.05) as server:
+        session = transport.ssp_session()
+        url = f"{server.base_url}/FW99001Z.aspx"
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: clone_session(session).get(url), range(3)))
+
+    stats = transport.stats()
+    assert stats["peak_in_flight"] > 1
+    assert stats["saturated_requests"] >= 1
+    assert stats["saturation"] > 1
+    transport.close()
+
+
+def test_default_services_share_transport():
+    """未指定 session 的服務都從全域連線池取得連線"""
+    from src.services import UpdateService
+    from src.utils.transport import get_transport
+
+    adapter = get_transport().adapter
+    assert AuthService(Settings()).session.get_adapter("https://x") is adapter
+    assert UpdateService().session.get_adapter("https://x") is adapter
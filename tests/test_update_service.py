@@ -38,7 +38,7 @@ class TestUpdateService:
             == "https://api.github.com/repos/test_owner/test_repo/releases/latest"
         )
 
-    @patch("src.services.update_service.requests.get")
+    @patch("src.services.update_service.requests.Session.get")
     def test_check_for_updates_has_update(self, mock_get):
         """測試檢查更新 - 有新版本"""
         # 模擬 API 回應
@@ -69,7 +69,7 @@ class TestUpdateService:
             == "https://github.com/test/repo/releases/tag/v999.0.0"
         )
 
-    @patch("src.services.update_service.requests.get")
+    @patch("src.services.update_service.requests.Session.get")
     def test_check_for_updates_no_update(self, mock_get):
         """測試檢查更新 - 已是最新版"""
         # 模擬 API 回應 (版本號與當前相同)
@@ -89,7 +89,7 @@ class TestUpdateService:
         assert result is not None
         assert result["has_update"] is False
 
-    @patch("src.services.update_service.requests.get")
+    @patch("src.services.update_service.requests.Session.get")
     def test_check_for_updates_timeout(self, mock_get):
         """測試檢查更新 - 超時"""
         import requests
@@ -100,7 +100,7 @@ class TestUpdateService:
 
         assert result is None
 
-    @patch("src.services.update_service.requests.get")
+    @patch("src.services.update_service.requests.Session.get")
     def test_check_for_updates_connection_error(self, mock_get):
         """測試檢查更新 - 連線錯誤"""
         import requests
@@ -111,7 +111,7 @@ class TestUpdateService:
 
         assert result is None
 
-    @patch("src.services.update_service.requests.get")
+    @patch("src.services.update_service.requests.Session.get")
     def test_check_for_updates_404(self, mock_get):
         """測試檢查更新 - 倉庫不存在"""
         mock_response = Mock()
@@ -183,7 +183,7 @@ class TestUpdateService:
         self.service.clear_cache()
         assert not self.service.cache_file.exists()
 
-    @patch("src.services.update_service.requests.get")
+    @patch("src.services.update_service.requests.Session.get")
     def test_always_check_no_cache(self, mock_get):
         """測試每次啟動都檢查,不使用快取"""
         # 第一次請求會呼叫 API
@@ -0,0 +1,34 @@
+"""VirtualRecordList UI 邏輯測試"""
+
+import pytest
+import customtkinter as ctk
+from tkinter import TclError
+
+from ui.components.virtual_record_list import WHEEL_SEQUENCES, VirtualRecordList
+
+
+@pytest.fixture
+def tk_root():
+    """建立 Tk 根節點,測試結束後銷毀"""
+    try:
+        root = ctk.CTk()
+    except TclError:
+        pytest.skip("Tkinter 環境不可用,略過 UI 測試")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def test_destroy_removes_only_own_wheel_binding(tk_root):
+    """銷毀列表時只移除自己的滾輪綁定,不影響其他列表"""
+    first = VirtualRecordList(tk_root, on_check=lambda *_: None, entry_registry={})
+    second = VirtualRecordList(tk_root, on_check=lambda *_: None, entry_registry={})
+    first_ids = [funcid for _, funcid in first._wheel_bindings]
+    second_ids = [funcid for _, funcid in second._wheel_bindings]
+
+    first.destroy()
+
+    for sequence, first_id, second_id in zip(WHEEL_SEQUENCES, first_ids, second_ids):
+        script = tk_root.tk.call("bind", "all", sequence)
+        assert first_id not in script
+        assert second_id in script
@@ -1,13 +1,18 @@
 """異常清單分頁元件 (遷移自 ReportFrame)"""
 
 import customtkinter as ctk
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from tkinter import ttk
 import tkinter as tk
 
-from src.models import OvertimeReport
+from src.models import AttendanceRecord, OvertimeReport
+from src.services.export_service import EXPORT_FORMATS
 from ui.config.design_system import colors, typography, spacing, border_radius
 
+# 匯出格式選單顯示名稱 → ExportService 格式
+EXPORT_FORMAT_NAMES = {"xlsx": "Excel", "csv": "CSV", "jsonl": "JSONL", "parquet": "Parquet"}
+EXPORT_FORMAT_LABELS = tuple(EXPORT_FORMAT_NAMES[fmt] for fmt in EXPORT_FORMATS)
+
 
 class AttendanceTab(ctk.CTkFrame):
     """
@@ -27,9 +32,20 @@ class AttendanceTab(ctk.CTkFrame):
         self.on_export = on_export
         self.on_refresh = on_refresh
         self.current_report: Optional[OvertimeReport] = None
+        # {(日期, 上班時間, 下班時間): 表格列 id};同一天可能有多筆刷卡記錄
+        self._row_ids: Dict[Tuple[str, str, str], str] = {}
 
         self._create_ui()
 
+    @property
+    def export_format(self) -> str:
+        """目前選擇的匯出格式 (ExportService 格式名稱)"""
+        label = self.export_format_var.get()
+        for fmt, name in EXPORT_FORMAT_NAMES.items():
+            if name == label:
+                return fmt
+        return "xlsx"
+
     def _create_ui(self):
         """建立 UI (優化版面設計)"""
         # 標題列 (使用卡片样式)
@@ -85,10 +101,24 @@ class AttendanceTab(ctk.CTkFrame):
         )
         self.copy_button.pack(side="left", padx=(0, spacing.xs))
 
+        # 匯出格式
+        self.export_format_var = ctk.StringVar(
+            master=self, value=EXPORT_FORMAT_LABELS[0]
+        )
+        self.export_format_menu = ctk.CTkOptionMenu(
+            button_container,
+            values=list(EXPORT_FORMAT_LABELS),
+            variable=self.export_format_var,
+            width=90,
+            height=36,
+            corner_radius=border_radius.sm,
+        )
+        self.export_format_menu.pack(side="left", padx=(0, spacing.xs))
+
         # 匯出按鈕
         self.export_button = ctk.CTkButton(
             button_container,
-            text="📥 匯出 Excel",
+            text="📥 匯出",
             command=self.on_export,
             width=110,
             height=36,
@@ -199,19 +229,12 @@ class AttendanceTab(ctk.CTkFrame):
         # 清空表格
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self._row_ids.clear()
 
         # 填入資料
         for record in report.records:
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    record.date,
-                    record.start_time,
-                    record.end_time,
-                    record.total_minutes,
-                    record.overtime_hours,
-                ),
+            self._row_ids[self._row_key(record)] = self.tree.insert(
+                "", "end", values=self._record_values(record)
             )
 
         # 更新統計資訊
@@ -229,6 +252,58 @@ class AttendanceTab(ctk.CTkFrame):
 
         self.stats_label.configure(text=stats_text)
 
+    def append_records(self, records: List[AttendanceRecord]):
+        """
+        逐頁加入記錄 (出勤資料分頁到達時呼叫)
+
+        同一筆記錄 (日期與上下班時間相同) 已有列時更新該列 (例如已先顯示本機資料),
+        否則依日期由新到舊插入。全部頁面完成後應再呼叫 display_report。
+
+        Args:
+            records: 本頁計算結果
+        """
+        for record in records:
+            values = self._record_values(record)
+            key = self._row_key(record)
+            item = self._row_ids.get(key)
+            if item and self.tree.exists(item):
+                self.tree.item(item, values=values)
+            else:
+                self._row_ids[key] = self.tree.insert(
+                    "", self._insert_index(record.date), values=values
+                )
+
+        self.stats_label.configure(
+            text=f"載入中... 已取得 {len(self.tree.get_children())} 筆"
+        )
+
+    def _insert_index(self, date: str):
+        """依日期 (YYYY/MM/DD,由新到舊) 找出插入位置"""
+        children = self.tree.get_children()
+        # 分頁依日期由新到舊到達,通常直接加在最後
+        if not children or self.tree.set(children[-1], "日期") >= date:
+            return "end"
+        for index, item in enumerate(children):
+            if self.tree.set(item, "日期") < date:
+                return index
+        return "end"
+
+    @staticmethod
+    def _row_key(record: AttendanceRecord) -> Tuple[str, str, str]:
+        """表格列的識別鍵 (與 AttendanceRecord.__hash__ 相同欄位)"""
+        return (record.date, record.start_time, record.end_time)
+
+    @staticmethod
+    def _record_values(record: AttendanceRecord) -> tuple:
+        """表格列的欄位值"""
+        return (
+            record.date,
+            record.start_time,
+            record.end_time,
+            record.total_minutes,
+            record.overtime_hours,
+        )
+
     def copy_total_hours(self):
         """複製總加班時數到剪貼簿"""
         if not self.current_report:
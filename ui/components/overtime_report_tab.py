@@ -1,7 +1,7 @@
 """加班補報分頁元件"""
 
 import customtkinter as ctk
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict
 import threading
 import logging
 from tkinter import messagebox
@@ -9,57 +9,20 @@ from requests import Session
 
 from src.models import OvertimeSubmissionRecord, SubmittedRecord
 from src.services import (
+    OvertimeHistoryService,
     OvertimeReportService,
     OvertimeStatusService,
     TemplateManager,
 )
 from src.config import Settings
-from ui.config.design_system import colors, typography, spacing, border_radius
-
-logger = logging.getLogger(__name__)
+from src.utils.single_flight import CancelToken, SingleFlight
+from ui.config.design_system import colors, spacing, border_radius
+from ui.components.virtual_record_list import VirtualRecordList, get_font_config
 
+if TYPE_CHECKING:
+    from ui.dispatcher import UiDispatcher
 
-def get_font_config(style: str) -> dict:
-    """取得字體配置"""
-    configs = {
-        "h1": {
-            "family": typography.font_family_primary,
-            "size": typography.size_h1,
-            "weight": typography.weight_bold,
-        },
-        "h2": {
-            "family": typography.font_family_primary,
-            "size": typography.size_h2,
-            "weight": typography.weight_bold,
-        },
-        "h3": {
-            "family": typography.font_family_primary,
-            "size": typography.size_h3,
-            "weight": typography.weight_bold,
-        },
-        "body": {
-            "family": typography.font_family_primary,
-            "size": typography.size_body,
-            "weight": typography.weight_normal,
-        },
-        "body_bold": {
-            "family": typography.font_family_primary,
-            "size": typography.size_body,
-            "weight": typography.weight_bold,
-        },
-        "caption": {
-            "family": typography.font_family_primary,
-            "size": typography.size_caption,
-            "weight": typography.weight_normal,
-        },
-    }
-    return {
-        "font": (
-            configs[style]["family"],
-            configs[style]["size"],
-            configs[style]["weight"],
-        )
-    }
+logger = logging.getLogger(__name__)
 
 
 class OvertimeReportTab(ctk.CTkFrame):
@@ -74,13 +37,24 @@ class OvertimeReportTab(ctk.CTkFrame):
     """
 
     def __init__(
-        self, master, template_manager: Optional[TemplateManager] = None, **kwargs
+        self,
+        master,
+        template_manager: Optional[TemplateManager] = None,
+        history_service: Optional[OvertimeHistoryService] = None,
+        dispatcher: Optional["UiDispatcher"] = None,
+        **kwargs,
     ):
         super().__init__(master, **kwargs)
 
+        # 背景工作與結果分派 (未提供時使用獨立執行緒與 after)
+        self.dispatcher = dispatcher
+        self._flights = SingleFlight()
+
         self.settings = Settings()
         self.report_service = OvertimeReportService(self.settings)
-        self.status_service = OvertimeStatusService(self.settings)
+        self.status_service = OvertimeStatusService(
+            self.settings, history_service=history_service
+        )
         self.template_manager = template_manager or TemplateManager(
             default_templates=self.settings.OVERTIME_DESCRIPTION_TEMPLATES
         )
@@ -208,8 +182,8 @@ class OvertimeReportTab(ctk.CTkFrame):
 
     def _create_records_frame(self):
         """建立記錄列表 (改善可讀性與層次)"""
-        # 使用卡片式可滾動框架
-        self.records_container = ctk.CTkScrollableFrame(
+        # 使用卡片式框架,內部為虛擬化列表 (只建立可視範圍的列)
+        self.records_container = ctk.CTkFrame(
             self,
             fg_color=colors.background_primary,
             corner_radius=border_radius.md,
@@ -220,6 +194,12 @@ class OvertimeReportTab(ctk.CTkFrame):
             row=1, column=0, sticky="nsew", padx=spacing.lg, pady=(0, spacing.md)
         )
 
+        self.records_list = VirtualRecordList(
+            self.records_container,
+            on_check=self._on_record_check,
+            entry_registry=self.record_content_entries,
+        )
+
         # 載入/空狀態容器
         self.loading_container = ctk.CTkFrame(
             self.records_container, fg_color="transparent"
@@ -231,7 +211,7 @@ class OvertimeReportTab(ctk.CTkFrame):
             self.loading_container,
             text="⏳ 正在載入加班記錄...\n\n正在查詢已申請狀態,請稍候",
             **get_font_config("body"),
-            text_color=colors.text_secondary,
+            text_color=colors.info,
             justify="center",
         )
 
@@ -245,6 +225,15 @@ class OvertimeReportTab(ctk.CTkFrame):
         )
         self.empty_label.pack(pady=spacing.xl)
 
+    def _show_placeholder(self, label: ctk.CTkLabel):
+        """隱藏記錄列表並顯示提示訊息 (載入中/無資料)"""
+        self.records_list.pack_forget()
+        for widget in (self.loading_label, self.empty_label):
+            if widget is not label:
+                widget.pack_forget()
+        label.pack(expand=True, pady=spacing.xl)
+        self.loading_container.pack(expand=True, fill="both", pady=spacing.xl)
+
     def _create_status_frame(self):
         """建立狀態訊息區 (增加視覺回饋)"""
         status_container = ctk.CTkFrame(
@@ -267,7 +256,11 @@ class OvertimeReportTab(ctk.CTkFrame):
         self.status_label.pack(side="left", padx=spacing.md, pady=spacing.sm)
 
     def load_data(
-        self, submission_records: List[OvertimeSubmissionRecord], session: Session
+        self,
+        submission_records: List[OvertimeSubmissionRecord],
+        session: Session,
+        submitted_records: Optional[Dict[str, SubmittedRecord]] = None,
+        fetch_status: bool = True,
     ):
         """
         載入加班記錄資料
@@ -275,33 +268,40 @@ class OvertimeReportTab(ctk.CTkFrame):
         Args:
             submission_records: 加班補報記錄列表
             session: 已登入的 session
+            submitted_records: 已取得的已申請記錄 (提供時不再查詢)
+            fetch_status: 未提供已申請記錄時是否自行查詢
+                          (False 表示狀態由呼叫端稍後以 apply_submitted_records 提供)
         """
         self.submission_records = submission_records
         self.session = session
 
+        if submitted_records is not None:
+            self.apply_submitted_records(submitted_records)
+            return
+
         # 顯示載入狀態
         self._show_loading_state()
 
         # 啟動背景執行緒查詢已申請狀態
-        threading.Thread(target=self._load_submitted_status, daemon=True).start()
+        if fetch_status:
+            self._in_background(
+                self._load_submitted_status, False, self._flights.supersede("status")
+            )
 
-    def _show_loading_state(self):
-        """顯示載入狀態"""
-        # 清空容器
-        for widget in self.records_container.winfo_children():
-            widget.destroy()
+    def apply_submitted_records(self, submitted_records: Dict[str, SubmittedRecord]):
+        """
+        套用已申請狀態並更新列表 (主執行緒呼叫)
 
-        self.record_content_entries.clear()
+        Args:
+            submitted_records: 已申請記錄 {日期: SubmittedRecord}
+        """
+        self._mark_submitted(submitted_records)
+        self._refresh_records_ui()
 
-        # 顯示載入提示
-        self.loading_label = ctk.CTkLabel(
-            self.records_container,
-            text="⏳ 正在載入加班記錄...\n\n正在查詢已申請狀態,請稍候",
-            **get_font_config("body"),
-            text_color=colors.info,
-            justify="center",
-        )
-        self.loading_label.pack(expand=True, pady=spacing.xl)
+    def _show_loading_state(self):
+        """顯示載入狀態"""
+        self.records_list.set_records([])
+        self._show_placeholder(self.loading_label)
 
         # 更新按鈕狀態
         self.submit_button.configure(state="disabled")
@@ -310,53 +310,60 @@ class OvertimeReportTab(ctk.CTkFrame):
         # 更新狀態訊息
         self._show_status("🔍 正在查詢已申請狀態...", colors.info)
 
-    def _load_submitted_status(self):
-        """背景載入已申請狀態"""
+    def _load_submitted_status(
+        self, force: bool = False, token: Optional[CancelToken] = None
+    ):
+        """
+        背景載入已申請狀態
+
+        Args:
+            force: 是否忽略共用快取 (重新整理或送出後使用)
+            token: 取消標記 (已被較新的查詢取代時不更新畫面)
+        """
         try:
             if not self.session:
                 return
 
-            # 查詢已申請記錄
-            self.submitted_records = self.status_service.fetch_submitted_records(
-                self.session
+            # 查詢已申請記錄並更新記錄狀態
+            submitted_records = self.status_service.fetch_submitted_records(
+                self.session, force=force
             )
-
-            # 更新記錄狀態
-            for record in self.submission_records:
-                if record.date in self.submitted_records:
-                    submitted = self.submitted_records[record.date]
-                    record.submitted_status = submitted.status
-                    record.is_selected = False  # 已申請的不勾選
+            if token and token.cancelled:
+                return
+            self._mark_submitted(submitted_records)
 
             # 回到主執行緒更新 UI
-            self.after(0, self._refresh_records_ui)
+            self._post(self._refresh_records_ui)
 
         except Exception as error:
             logger.error("載入已申請狀態失敗: %s", error)
-            self.after(
-                0, lambda: self._show_status(f"載入狀態失敗: {error}", colors.error)
+            self._post(
+                lambda: self._show_status(f"載入狀態失敗: {error}", colors.error)
             )
 
+    def _mark_submitted(self, submitted_records: Dict[str, SubmittedRecord]):
+        """依已申請記錄更新各記錄的狀態"""
+        self.submitted_records = submitted_records
+        for record in self.submission_records:
+            if record.date in submitted_records:
+                record.submitted_status = submitted_records[record.date].status
+                record.is_selected = False  # 已申請的不勾選
+
     def _refresh_records_ui(self):
         """重新整理記錄列表 UI"""
-        # 清空容器
-        for widget in self.records_container.winfo_children():
-            widget.destroy()
-
         if not self.submission_records:
-            self.empty_label = ctk.CTkLabel(
-                self.records_container,
-                text="尚無加班記錄",
-                **get_font_config("body"),
-                text_color=colors.text_secondary,
-            )
-            self.empty_label.pack(pady=spacing.lg)
+            self.records_list.set_records([])
+            self.empty_label.configure(text="尚無加班記錄")
+            self._show_placeholder(self.empty_label)
             return
 
-        # 建立每筆記錄的 UI
-        self.record_content_entries.clear()
-        for record in self.submission_records:
-            self._create_record_item(record)
+        # 虛擬化列表只為可視範圍建立列,記錄狀態保存在模型中
+        self.loading_container.pack_forget()
+        self.records_list.pack(fill="both", expand=True, padx=1, pady=spacing.xs)
+        if self.records_list.records is self.submission_records:
+            self.records_list.refresh()
+        else:
+            self.records_list.set_records(self.submission_records)
 
         # 啟用按鈕
         self.submit_button.configure(state="normal")
@@ -365,167 +372,6 @@ class OvertimeReportTab(ctk.CTkFrame):
         # 更新狀態
         self._update_status()
 
-    def _create_record_item(self, record: OvertimeSubmissionRecord):
-        """建立單筆記錄的 UI (卡片式設計)"""
-        # 記錄卡片容器
-        item_frame = ctk.CTkFrame(
-            self.records_container,
-            fg_color=(
-                colors.background_secondary
-                if not record.is_submitted
-                else colors.background_tertiary
-            ),
-            corner_radius=border_radius.md,
-            border_width=1,
-            border_color=(
-                colors.border_light if not record.is_submitted else colors.border_dark
-            ),
-        )
-        item_frame.pack(fill="x", padx=spacing.md, pady=spacing.sm)
-
-        # 左側: 勾選框
-        checkbox_var = ctk.BooleanVar(value=record.is_selected)
-        checkbox = ctk.CTkCheckBox(
-            item_frame,
-            text="",
-            variable=checkbox_var,
-            command=lambda: self._on_record_check(record, checkbox_var.get()),
-            state="disabled" if record.is_submitted else "normal",
-        )
-        checkbox.pack(side="left", padx=spacing.sm)
-
-        # 日期標籤 (使用徽章樣式)
-        date_badge = ctk.CTkFrame(
-            item_frame,
-            fg_color=(
-                colors.primary if not record.is_submitted else colors.text_tertiary
-            ),
-            corner_radius=border_radius.sm,
-        )
-        date_badge.pack(side="left", padx=spacing.sm)
-
-        date_label = ctk.CTkLabel(
-            date_badge,
-            text=record.date,
-            **get_font_config("body_bold"),
-            text_color=colors.text_primary,
-            width=90,
-        )
-        date_label.pack(padx=spacing.sm, pady=spacing.xs)
-
-        # 加班內容 (可編輯 - 必填)
-        if not record.is_submitted:
-            content_entry = ctk.CTkEntry(
-                item_frame,
-                placeholder_text="請輸入加班內容 (必填)",
-                **get_font_config("body"),
-                width=300,
-                border_color=(
-                    colors.error
-                    if not record.description
-                    else colors.background_tertiary
-                ),
-            )
-            content_entry.insert(0, record.description)
-
-            def on_content_change(e):
-                record.description = content_entry.get()
-                # 更新邊框顏色
-                content_entry.configure(
-                    border_color=(
-                        colors.background_tertiary
-                        if record.description
-                        else colors.error
-                    )
-                )
-
-            content_entry.bind("<KeyRelease>", on_content_change)
-            content_entry.pack(side="left", padx=spacing.sm)
-            self.record_content_entries[id(record)] = content_entry
-        else:
-            self.record_content_entries.pop(id(record), None)
-            content_label = ctk.CTkLabel(
-                item_frame,
-                text=record.description,
-                **get_font_config("body"),
-                text_color=colors.text_secondary,
-                width=300,
-            )
-            content_label.pack(side="left", padx=spacing.sm)
-
-        # 時數 (小時 - 可編輯)
-        if not record.is_submitted:
-            hours_var = ctk.StringVar(value=f"{record.overtime_hours:.2f}")
-            hours_entry = ctk.CTkEntry(
-                item_frame,
-                textvariable=hours_var,
-                **get_font_config("body"),
-                width=70,
-                justify="center",
-            )
-
-            def on_hours_change(e):
-                try:
-                    new_hours = float(hours_var.get())
-                    if new_hours >= 0:
-                        record.overtime_hours = round(new_hours, 2)
-                        hours_var.set(f"{record.overtime_hours:.2f}")
-                except ValueError:
-                    pass  # 不合法輸入不更新
-
-            hours_entry.bind("<FocusOut>", on_hours_change)
-            hours_entry.bind("<Return>", on_hours_change)
-            hours_entry.pack(side="left", padx=spacing.sm)
-
-            # 單位標籤
-            unit_label = ctk.CTkLabel(
-                item_frame,
-                text="hr",
-                **get_font_config("body"),
-                text_color=colors.text_tertiary,
-                width=30,
-            )
-            unit_label.pack(side="left")
-        else:
-            hours_label = ctk.CTkLabel(
-                item_frame,
-                text=f"{record.overtime_hours:.2f} hr",
-                **get_font_config("body"),
-                width=70,
-            )
-            hours_label.pack(side="left", padx=spacing.sm)
-
-        # 加班/調休選擇
-        if not record.is_submitted:
-            type_var = ctk.StringVar(value="加班" if record.is_overtime else "調休")
-
-            overtime_radio = ctk.CTkRadioButton(
-                item_frame,
-                text="加班",
-                variable=type_var,
-                value="加班",
-                command=lambda: setattr(record, "is_overtime", True),
-            )
-            overtime_radio.pack(side="left", padx=spacing.sm)
-
-            change_radio = ctk.CTkRadioButton(
-                item_frame,
-                text="調休",
-                variable=type_var,
-                value="調休",
-                command=lambda: setattr(record, "is_overtime", False),
-            )
-            change_radio.pack(side="left", padx=spacing.sm)
-        else:
-            # 已申請: 顯示狀態
-            status_label = ctk.CTkLabel(
-                item_frame,
-                text=f"已申請 ({record.submitted_status})",
-                **get_font_config("caption"),
-                text_color=colors.warning,
-            )
-            status_label.pack(side="left", padx=spacing.sm)
-
     def _on_record_check(self, record: OvertimeSubmissionRecord, checked: bool):
         """記錄勾選狀態變更"""
         record.is_selected = checked
@@ -744,7 +590,7 @@ class OvertimeReportTab(ctk.CTkFrame):
 
         # 背景執行緒執行送出
         self._show_status("正在送出申請...", colors.info)
-        threading.Thread(target=self._do_submit, args=(selected,), daemon=True).start()
+        self._in_background(self._do_submit, selected)
 
     def _do_submit(self, records: List[OvertimeSubmissionRecord]):
         """執行送出 (背景執行緒)"""
@@ -753,36 +599,53 @@ class OvertimeReportTab(ctk.CTkFrame):
                 return
 
             result = self.report_service.submit_form(self.session, records)
+            if result["success"] and self.status_service.history_service:
+                # 已送出的申請單改變了查詢結果,捨棄快取與送出前已開始的下載
+                self.status_service.history_service.invalidate()
 
             if result["success"]:
-                self.after(
-                    0,
+                self._post(
                     lambda: messagebox.showinfo(
                         "成功", f"已成功送出 {result['submitted_count']} 筆加班申請"
                     ),
                 )
-                self.after(0, lambda: self._show_status("送出成功", colors.success))
+                self._post(lambda: self._show_status("送出成功", colors.success))
                 # 重新整理狀態
-                self.after(0, self.on_refresh)
+                self._post(self.on_refresh)
             else:
-                self.after(
-                    0,
+                self._post(
                     lambda: messagebox.showerror(
                         "錯誤", result.get("error", "送出失敗")
                     ),
                 )
-                self.after(0, lambda: self._show_status("送出失敗", colors.error))
+                self._post(lambda: self._show_status("送出失敗", colors.error))
 
         except Exception as error:
             logger.error("送出失敗: %s", error)
-            self.after(0, lambda: messagebox.showerror("錯誤", str(error)))
-            self.after(0, lambda: self._show_status(f"送出失敗: {error}", colors.error))
+            self._post(lambda: messagebox.showerror("錯誤", str(error)))
+            self._post(lambda: self._show_status(f"送出失敗: {error}", colors.error))
 
     def on_refresh(self):
         """重新整理"""
         if self.session:
             self._show_status("正在重新整理...", colors.info)
-            threading.Thread(target=self._load_submitted_status, daemon=True).start()
+            self._in_background(
+                self._load_submitted_status, True, self._flights.supersede("status")
+            )
+
+    def _in_background(self, func, *args):
+        """在背景執行 func(*args)"""
+        if self.dispatcher:
+            self.dispatcher.run_blocking(func, *args)
+        else:
+            threading.Thread(target=func, args=args, daemon=True).start()
+
+    def _post(self, callback, *args):
+        """在主執行緒執行 callback(*args) (背景執行緒呼叫)"""
+        if self.dispatcher:
+            self.dispatcher.post(callback, *args)
+        else:
+            self.after(0, callback, *args)
 
     def _show_status(self, message: str, color: Optional[str] = None):
         """顯示狀態訊息"""
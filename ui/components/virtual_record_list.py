@@ -0,0 +1,426 @@
+"""虛擬化加班記錄列表元件"""
+
+import math
+from typing import Callable, Dict, List, Optional
+
+import customtkinter as ctk
+
+from src.models import OvertimeSubmissionRecord
+from ui.config.design_system import border_radius, colors, spacing, typography
+
+# 每列固定高度 (卡片高度 + 上下間距),虛擬化需以固定列高計算位置
+ROW_HEIGHT = 56
+# 尚未取得可視高度時 (例如視窗未顯示) 預先建立的列數
+DEFAULT_VISIBLE_ROWS = 12
+# 滑鼠滾輪每一格捲動的像素
+SCROLL_STEP = ROW_HEIGHT
+# 滾輪事件 (Windows/macOS 為 MouseWheel,X11 為 Button-4/5)
+WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+def get_font_config(style: str) -> dict:
+    """取得字體配置"""
+    configs = {
+        "h1": {
+            "family": typography.font_family_primary,
+            "size": typography.size_h1,
+            "weight": typography.weight_bold,
+        },
+        "h2": {
+            "family": typography.font_family_primary,
+            "size": typography.size_h2,
+            "weight": typography.weight_bold,
+        },
+        "h3": {
+            "family": typography.font_family_primary,
+            "size": typography.size_h3,
+            "weight": typography.weight_bold,
+        },
+        "body": {
+            "family": typography.font_family_primary,
+            "size": typography.size_body,
+            "weight": typography.weight_normal,
+        },
+        "body_bold": {
+            "family": typography.font_family_primary,
+            "size": typography.size_body,
+            "weight": typography.weight_bold,
+        },
+        "caption": {
+            "family": typography.font_family_primary,
+            "size": typography.size_caption,
+            "weight": typography.weight_normal,
+        },
+    }
+    return {
+        "font": (
+            configs[style]["family"],
+            configs[style]["size"],
+            configs[style]["weight"],
+        )
+    }
+
+
+class RecordRow(ctk.CTkFrame):
+    """
+    可重複使用的單筆記錄列
+
+    所有子元件只建立一次,捲動時以 bind_record 換上另一筆記錄;
+    編輯結果直接寫回目前綁定的 OvertimeSubmissionRecord。
+    """
+
+    def __init__(
+        self,
+        master,
+        on_check: Callable[[OvertimeSubmissionRecord, bool], None],
+        entry_registry: Dict[int, ctk.CTkEntry],
+        **kwargs,
+    ):
+        super().__init__(master, fg_color="transparent", height=ROW_HEIGHT, **kwargs)
+        self.pack_propagate(False)  # 固定列高,不隨內容縮放
+        self.record: Optional[OvertimeSubmissionRecord] = None
+        self._on_check = on_check
+        self._entry_registry = entry_registry
+
+        body_font = get_font_config("body")
+
+        # 記錄卡片
+        self.card = ctk.CTkFrame(
+            self, corner_radius=border_radius.md, border_width=1
+        )
+        self.card.pack(fill="both", expand=True, padx=spacing.md, pady=spacing.xs)
+
+        # 勾選框
+        self.checkbox_var = ctk.BooleanVar(master=self, value=False)
+        self.checkbox = ctk.CTkCheckBox(
+            self.card,
+            text="",
+            width=24,
+            variable=self.checkbox_var,
+            command=self._handle_check,
+        )
+        self.checkbox.grid(row=0, column=0, padx=spacing.sm, pady=spacing.xs)
+
+        # 日期標籤 (使用徽章樣式)
+        self.date_badge = ctk.CTkFrame(self.card, corner_radius=border_radius.sm)
+        self.date_badge.grid(row=0, column=1, padx=spacing.sm)
+        self.date_label = ctk.CTkLabel(
+            self.date_badge,
+            text="",
+            **get_font_config("body_bold"),
+            text_color=colors.text_primary,
+            width=90,
+        )
+        self.date_label.pack(padx=spacing.sm, pady=spacing.xs)
+
+        # 加班內容 (可編輯 / 已申請時唯讀)
+        self.content_entry = ctk.CTkEntry(
+            self.card,
+            placeholder_text="請輸入加班內容 (必填)",
+            **body_font,
+            width=300,
+        )
+        self.content_entry.bind("<KeyRelease>", self._handle_content_change)
+        self.content_label = ctk.CTkLabel(
+            self.card,
+            text="",
+            **body_font,
+            text_color=colors.text_secondary,
+            width=300,
+        )
+        for widget in (self.content_entry, self.content_label):
+            widget.grid(row=0, column=2, padx=spacing.sm)
+
+        # 時數 (小時 - 可編輯 / 已申請時唯讀)
+        self.hours_var = ctk.StringVar(master=self, value="")
+        self.hours_entry = ctk.CTkEntry(
+            self.card,
+            textvariable=self.hours_var,
+            **body_font,
+            width=70,
+            justify="center",
+        )
+        self.hours_entry.bind("<FocusOut>", self._commit_hours)
+        self.hours_entry.bind("<Return>", self._commit_hours)
+        self.hours_label = ctk.CTkLabel(self.card, text="", **body_font, width=70)
+        for widget in (self.hours_entry, self.hours_label):
+            widget.grid(row=0, column=3, padx=spacing.sm)
+
+        # 單位標籤
+        self.unit_label = ctk.CTkLabel(
+            self.card,
+            text="hr",
+            **body_font,
+            text_color=colors.text_tertiary,
+            width=30,
+        )
+        self.unit_label.grid(row=0, column=4)
+
+        # 加班/調休選擇 (已申請時改顯示狀態)
+        self.type_var = ctk.StringVar(master=self, value="加班")
+        self.overtime_radio = ctk.CTkRadioButton(
+            self.card,
+            text="加班",
+            variable=self.type_var,
+            value="加班",
+            command=lambda: self._set_overtime(True),
+        )
+        self.overtime_radio.grid(row=0, column=5, padx=spacing.sm)
+        self.change_radio = ctk.CTkRadioButton(
+            self.card,
+            text="調休",
+            variable=self.type_var,
+            value="調休",
+            command=lambda: self._set_overtime(False),
+        )
+        self.change_radio.grid(row=0, column=6, padx=spacing.sm)
+        self.status_label = ctk.CTkLabel(
+            self.card,
+            text="",
+            **get_font_config("caption"),
+            text_color=colors.warning,
+        )
+        self.status_label.grid(row=0, column=5, columnspan=2, padx=spacing.sm, sticky="w")
+
+    def bind_record(self, record: OvertimeSubmissionRecord, force: bool = False):
+        """
+        將此列綁定到指定記錄並更新顯示
+
+        Args:
+            record: 要顯示的記錄
+            force: 同一筆記錄也重新套用 (記錄內容在外部被修改時)
+        """
+        if record is self.record and not force:
+            return
+
+        self.unbind_record()
+        self.record = record
+        submitted = record.is_submitted
+
+        self.card.configure(
+            fg_color=(
+                colors.background_tertiary if submitted else colors.background_secondary
+            ),
+            border_color=colors.border_dark if submitted else colors.border_light,
+        )
+        self.checkbox_var.set(record.is_selected)
+        self.checkbox.configure(state="disabled" if submitted else "normal")
+        self.date_badge.configure(
+            fg_color=colors.text_tertiary if submitted else colors.primary
+        )
+        self.date_label.configure(text=record.date)
+
+        if submitted:
+            self.content_entry.grid_remove()
+            self.hours_entry.grid_remove()
+            self.unit_label.grid_remove()
+            self.overtime_radio.grid_remove()
+            self.change_radio.grid_remove()
+
+            self.content_label.configure(text=record.description)
+            self.hours_label.configure(text=f"{record.overtime_hours:.2f} hr")
+            self.status_label.configure(text=f"已申請 ({record.submitted_status})")
+            self.content_label.grid()
+            self.hours_label.grid()
+            self.status_label.grid()
+        else:
+            self.content_label.grid_remove()
+            self.hours_label.grid_remove()
+            self.status_label.grid_remove()
+
+            self.content_entry.delete(0, "end")
+            if record.description:
+                self.content_entry.insert(0, record.description)
+            self._update_content_border()
+            self.hours_var.set(f"{record.overtime_hours:.2f}")
+            self.type_var.set("加班" if record.is_overtime else "調休")
+            self.content_entry.grid()
+            self.hours_entry.grid()
+            self.unit_label.grid()
+            self.overtime_radio.grid()
+            self.change_radio.grid()
+            self._entry_registry[id(record)] = self.content_entry
+
+    def unbind_record(self):
+        """解除目前綁定的記錄 (先寫回尚未確認的時數)"""
+        if self.record is None:
+            return
+
+        if not self.record.is_submitted:
+            self._commit_hours()
+        if self._entry_registry.get(id(self.record)) is self.content_entry:
+            del self._entry_registry[id(self.record)]
+        self.record = None
+
+    def _handle_check(self):
+        if self.record is not None:
+            self._on_check(self.record, self.checkbox_var.get())
+
+    def _handle_content_change(self, _event=None):
+        if self.record is None or self.record.is_submitted:
+            return
+        self.record.description = self.content_entry.get()
+        self._update_content_border()
+
+    def _update_content_border(self):
+        self.content_entry.configure(
+            border_color=(
+                colors.background_tertiary if self.record.description else colors.error
+            )
+        )
+
+    def _commit_hours(self, _event=None):
+        if self.record is None or self.record.is_submitted:
+            return
+        try:
+            new_hours = float(self.hours_var.get())
+            if new_hours >= 0:
+                self.record.overtime_hours = round(new_hours, 2)
+        except ValueError:
+            pass  # 不合法輸入不更新
+        self.hours_var.set(f"{self.record.overtime_hours:.2f}")
+
+    def _set_overtime(self, is_overtime: bool):
+        if self.record is not None:
+            self.record.is_overtime = is_overtime
+
+
+class VirtualRecordList(ctk.CTkFrame):
+    """
+    虛擬化記錄列表
+
+    只建立可視範圍所需的 RecordRow,捲動時重複使用並換上對應的記錄,
+    不論記錄筆數多少,Tk 元件數量維持固定。記錄狀態保存在
+    OvertimeSubmissionRecord 模型中,列只是其檢視。
+    """
+
+    def __init__(
+        self,
+        master,
+        on_check: Callable[[OvertimeSubmissionRecord, bool], None],
+        entry_registry: Dict[int, ctk.CTkEntry],
+        **kwargs,
+    ):
+        """
+        Args:
+            master: 父元件
+            on_check: 勾選狀態變更時呼叫 on_check(record, checked)
+            entry_registry: 可視記錄的加班內容輸入框 {id(record): entry}
+        """
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self._on_check = on_check
+        self._entry_registry = entry_registry
+        self.records: List[OvertimeSubmissionRecord] = []
+        self.rows: List[RecordRow] = []
+        self._offset = 0
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.viewport.bind("<Configure>", lambda _e: self._render())
+
+        # CTk 元件不允許 bind_all,改綁在最上層視窗並於處理時判斷事件來源;
+        # 綁定會留在 "all" 標籤上,destroy 時需自行移除
+        toplevel = self.winfo_toplevel()
+        self._wheel_bindings = [
+            (sequence, toplevel.bind_all(sequence, self._on_mouse_wheel, add="+"))
+            for sequence in WHEEL_SEQUENCES
+        ]
+
+    def destroy(self):
+        """移除滾輪綁定後再銷毀元件"""
+        for sequence, funcid in self._wheel_bindings:
+            # tkinter 的 unbind_all 會清掉整個序列 (含其他列表的綁定),只移除本列表那一行
+            script = self.tk.call("bind", "all", sequence)
+            kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+            self.tk.call("bind", "all", sequence, kept)
+            self.deletecommand(funcid)
+        self._wheel_bindings = []
+        super().destroy()
+
+    def set_records(self, records: List[OvertimeSubmissionRecord]):
+        """設定要顯示的記錄並回到頂端"""
+        self.records = records
+        self._offset = 0
+        self.refresh()
+
+    def refresh(self):
+        """記錄內容在外部被修改時,重新套用到可視列"""
+        for row in self.rows:
+            row.unbind_record()
+        self._render()
+
+    def scroll_to(self, offset: float):
+        """捲動到指定像素位置"""
+        self._offset = offset
+        self._render()
+
+    @property
+    def content_height(self) -> int:
+        return len(self.records) * ROW_HEIGHT
+
+    def _viewport_height(self) -> int:
+        """可視高度 (未縮放的座標,與 ROW_HEIGHT 相同單位)"""
+        height = self.viewport.winfo_height()
+        if height <= 1:
+            return DEFAULT_VISIBLE_ROWS * ROW_HEIGHT
+        return int(self._reverse_widget_scaling(height))
+
+    def _render(self):
+        """依捲動位置配置可視列"""
+        view_height = self._viewport_height()
+        max_offset = max(0, self.content_height - view_height)
+        self._offset = int(min(max(self._offset, 0), max_offset))
+
+        # 可視列數 + 1 列作為捲動時上下露出的部分
+        needed = min(len(self.records), math.ceil(view_height / ROW_HEIGHT) + 1)
+        while len(self.rows) < needed:
+            self.rows.append(
+                RecordRow(self.viewport, self._on_check, self._entry_registry)
+            )
+
+        first = self._offset // ROW_HEIGHT
+        shift = self._offset - first * ROW_HEIGHT
+        for position, row in enumerate(self.rows):
+            index = first + position
+            if position < needed and index < len(self.records):
+                row.bind_record(self.records[index])
+                row.place(x=0, y=position * ROW_HEIGHT - shift, relwidth=1)
+            else:
+                row.unbind_record()
+                row.place_forget()
+
+        if self.content_height <= view_height:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(
+                self._offset / self.content_height,
+                (self._offset + view_height) / self.content_height,
+            )
+
+    def _on_scrollbar(self, action: str, value, unit: Optional[str] = None):
+        """處理捲軸拖曳 (moveto) 與點擊 (scroll)"""
+        if action == "moveto":
+            self.scroll_to(float(value) * self.content_height)
+        elif action == "scroll":
+            step = self._viewport_height() if unit == "pages" else SCROLL_STEP
+            self.scroll_to(self._offset + int(value) * step)
+
+    def _on_mouse_wheel(self, event):
+        """滑鼠在列表範圍內時處理滾輪捲動"""
+        path, own_path = str(event.widget), str(self)
+        if path != own_path and not path.startswith(own_path + "."):
+            return
+
+        if event.num == 4:
+            direction = -1
+        elif event.num == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self.scroll_to(self._offset + direction * SCROLL_STEP)
@@ -0,0 +1,112 @@
+"""背景工作與 Tk 主執行緒之間的結果佇列"""
+
+import asyncio
+import concurrent.futures
+import logging
+import queue
+from typing import Any, Awaitable, Callable, Optional
+
+from src.services.async_services import EventLoopThread
+
+logger = logging.getLogger(__name__)
+
+
+class UiDispatcher:
+    """
+    UI 結果分派器
+
+    背景執行緒與事件迴圈只將回呼放進同一個執行緒安全的佇列,
+    由 Tk 主執行緒定期取出執行;Tk 元件只會在主執行緒被更新。
+    """
+
+    def __init__(
+        self,
+        widget,
+        runner: EventLoopThread,
+        interval_ms: int = 30,
+    ):
+        """
+        Args:
+            widget: 用於排程輪詢的 Tk 元件 (通常為主視窗)
+            runner: 執行背景工作的事件迴圈執行緒
+            interval_ms: 輪詢佇列的間隔 (毫秒)
+        """
+        self.widget = widget
+        self.runner = runner
+        self.interval_ms = interval_ms
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._after_id: Optional[str] = None
+
+    def start(self):
+        """開始輪詢佇列"""
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.interval_ms, self._poll)
+
+    def stop(self):
+        """停止輪詢 (視窗關閉時呼叫)"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def post(self, callback: Callable, *args):
+        """在主執行緒執行 callback(*args) (任何執行緒皆可呼叫)"""
+        self._queue.put((callback, args))
+
+    def run_async(
+        self,
+        coro: Awaitable,
+        callback: Optional[Callable[[Any], None]] = None,
+        errback: Optional[Callable[[Exception], None]] = None,
+    ):
+        """
+        在事件迴圈執行協程,完成後於主執行緒呼叫 callback(結果)
+
+        Args:
+            coro: 協程
+            callback: 成功時呼叫
+            errback: 失敗時呼叫 (未提供時只記錄日誌);工作被取消時兩者都不呼叫
+        """
+
+        def done(future):
+            try:
+                result = future.result()
+            except (concurrent.futures.CancelledError, asyncio.CancelledError):
+                # 取消 (例如關閉視窗時停止事件迴圈) 不是失敗,不呼叫 callback / errback
+                logger.debug("背景工作已取消")
+                return
+            except Exception as error:
+                if errback:
+                    self.post(errback, error)
+                else:
+                    logger.error(f"背景工作失敗: {error}", exc_info=error)
+                return
+            if callback:
+                self.post(callback, result)
+
+        self.runner.submit(coro).add_done_callback(done)
+
+    def run_blocking(
+        self,
+        func: Callable,
+        *args,
+        callback: Optional[Callable[[Any], None]] = None,
+        errback: Optional[Callable[[Exception], None]] = None,
+    ):
+        """在背景執行同步函式 func(*args),完成後於主執行緒呼叫 callback(結果)"""
+        self.run_async(self.runner.run_blocking(func, *args), callback, errback)
+
+    def drain(self):
+        """執行佇列中所有待處理的回呼 (主執行緒)"""
+        while True:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(*args)
+            except Exception as error:
+                logger.error(f"UI 回呼發生錯誤: {error}", exc_info=True)
+
+    def _poll(self):
+        self.drain()
+        self._after_id = self.widget.after(self.interval_ms, self._poll)
@@ -4,7 +4,6 @@
 """
 
 import sys
-import threading
 import logging
 from tkinter import messagebox as mb
 from typing import Optional
@@ -12,11 +11,25 @@ from pathlib import Path
 from datetime import datetime
 from PIL import Image, ImageTk
 import customtkinter as ctk
-from src.models import OvertimeReport
+from src.models import OvertimeHistory, OvertimeReport
 from src.models.personal_record import PersonalRecord, PersonalRecordSummary
-from src.services import AuthService, DataService, ExportService, UpdateService
+from src.services import (
+    AuthService,
+    DataService,
+    ExportService,
+    UpdateService,
+    OvertimeHistoryService,
+    LocalStore,
+    SessionStore,
+    SessionGuard,
+    FetchOrchestrator,
+    FetchResult,
+)
+from src.services.async_services import get_event_loop_thread
+from src.services.data_service import PageCallback
 from src.services.personal_record_service import PersonalRecordService
 from src.services.credential_manager import CredentialManager
+from src.utils.single_flight import SingleFlight
 from src.core import OvertimeCalculator, VERSION
 from src.config import Settings
 from ui.components import (
@@ -27,6 +40,7 @@ from ui.components import (
     PersonalRecordTab,
 )
 from ui.components.statistics_card import StatisticsCard
+from ui.dispatcher import UiDispatcher
 from ui.config import (
     colors,
     typography,
@@ -79,6 +93,12 @@ class MainWindow(ctk.CTk):
         # 建立 UI
         self._create_ui()
 
+        # 關閉視窗時保存登入狀態
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # 背景工作的結果經由佇列回到主執行緒
+        self.dispatcher.start()
+
         # 啟動後檢查更新 (非阻塞式)
         self.after(1000, self._check_for_updates)
 
@@ -117,8 +137,38 @@ class MainWindow(ctk.CTk):
         self.credential_manager = CredentialManager()
         self.auth_service: Optional[AuthService] = None
         self.data_service: Optional[DataService] = None
-        self.export_service = ExportService(self.settings)
+        self._export_service: Optional[ExportService] = None
+        self.history_service = OvertimeHistoryService(self.settings)
         self.calculator = OvertimeCalculator(self.settings)
+        self.fetch_orchestrator = FetchOrchestrator()
+        self.background = get_event_loop_thread(self.settings.BACKGROUND_WORKERS)
+        self.dispatcher = UiDispatcher(self, self.background)
+        # 重複點擊重新整理時只套用最後一次的結果
+        self.refresh_flights = SingleFlight()
+        self.local_store = self._create_local_store()
+        self.session_store: Optional[SessionStore] = (
+            SessionStore(self.credential_manager, settings=self.settings)
+            if self.settings.SESSION_PERSISTENCE
+            else None
+        )
+
+    @property
+    def export_service(self) -> ExportService:
+        """匯出服務 (第一次匯出時才建立)"""
+        if self._export_service is None:
+            self._export_service = ExportService(self.settings)
+        return self._export_service
+
+    def _create_local_store(self) -> Optional[LocalStore]:
+        """建立本機資料存放區 (失敗時停用,不影響線上功能)"""
+        if not self.settings.LOCAL_STORE_ENABLED:
+            return None
+
+        try:
+            return LocalStore(settings=self.settings)
+        except Exception as e:
+            logger.warning(f"本機資料存放區初始化失敗,停用快取: {e}")
+            return None
 
     def _init_data(self):
         """初始化資料"""
@@ -129,6 +179,12 @@ class MainWindow(ctk.CTk):
         self._login_username: Optional[str] = None
         self._login_password: Optional[str] = None
         self._remember_me: bool = False
+        self._logged_in: bool = False
+
+        # 並行抓取時,出勤異常與個人紀錄的到達順序不固定
+        self._startup_history: Optional[OvertimeHistory] = None
+        self._history_pending: bool = False
+        self._overtime_waiting_status: bool = False
 
     def _create_ui(self):
         """建立使用者介面"""
@@ -156,7 +212,8 @@ class MainWindow(ctk.CTk):
 
         OWASP 考量:
         - 僅在使用者之前選擇「記住我」時才自動填入
-        - 不自動登入,仅填入欄位
+        - 啟用 session 保存時只嘗試沿用保存的 session;失效時停留在登入頁,
+          由使用者按下登入按鈕才以密碼登入
         """
         if self.credential_manager.has_saved_credentials():
             username, password = self.credential_manager.load_credentials()
@@ -169,6 +226,47 @@ class MainWindow(ctk.CTk):
                     self.login_frame.set_password(password)
                     logger.info("已載入儲存的憑證")
 
+                    if self.session_store:
+                        self.after(0, self._resume_session, username)
+
+    def _resume_session(self, username: str):
+        """啟動時在背景嘗試沿用保存的 session (不送出密碼)"""
+        self.login_frame.set_loading(True)
+        self._login_username = username
+        self._remember_me = True
+        self._execute_in_background(
+            self._resume_task, args=(username,), callback=self._on_resume_complete
+        )
+
+    def _resume_task(self, username: str) -> bool:
+        """
+        沿用 session 任務 (背景執行)
+
+        Returns:
+            bool: 是否成功沿用
+        """
+        try:
+            auth_service = AuthService(self.settings)
+            if not auth_service.resume(username, self.session_store):
+                return False
+            self.auth_service = auth_service
+            self._attach_session_guard(username)
+            return True
+        except Exception as e:
+            logger.warning(f"沿用 session 失敗: {e}")
+            return False
+
+    def _on_resume_complete(self, resumed: bool):
+        """沿用 session 完成回調 (失敗時等待使用者按下登入)"""
+        self.login_frame.set_loading(False)
+        if not resumed:
+            logger.info("保存的 session 已失效,請按登入重新登入")
+            return
+
+        self._logged_in = True
+        self._switch_to_main_page()
+        self._start_data_fetch()
+
     def _create_main_page(self):
         """建立主頁面 (使用分頁介面)"""
         self.main_content = ctk.CTkFrame(
@@ -297,7 +395,11 @@ class MainWindow(ctk.CTk):
 
         # 建立分頁 1: 加班補報
         self.tabview.add("⚙️ 加班補報")
-        self.overtime_tab = OvertimeReportTab(self.tabview.tab("⚙️ 加班補報"))
+        self.overtime_tab = OvertimeReportTab(
+            self.tabview.tab("⚙️ 加班補報"),
+            history_service=self.history_service,
+            dispatcher=self.dispatcher,
+        )
         self.overtime_tab.pack(fill="both", expand=True, padx=0, pady=0)
 
         # 建立分頁 2: 異常清單
@@ -463,26 +565,50 @@ class MainWindow(ctk.CTk):
         """
         try:
             self.auth_service = AuthService(self.settings)
-            success = self.auth_service.login(username, password)
+
+            # 記住我時先沿用保存的 session,失效才重新登入
+            success = bool(
+                self._remember_me
+                and self.session_store
+                and self.auth_service.resume(username, self.session_store)
+            ) or self.auth_service.login(username, password)
+
+            # 長時間開啟時 session 可能逾時,由守衛以已儲存的憑證自動重新登入
+            # (未勾選記住我時不保留密碼,逾時需手動重新登入)
+            if success and self._remember_me:
+                self._attach_session_guard(username)
             return (success, None)
         except Exception as e:
             logger.error(f"登入錯誤: {e}", exc_info=True)
             return (False, str(e))
 
+    def _attach_session_guard(self, username: str):
+        """掛上 session 逾時守衛 (重新登入時才從 CredentialManager 讀取密碼)"""
+        if not self.settings.SESSION_AUTO_RELOGIN:
+            return
+        SessionGuard.from_credential_manager(
+            username, self.credential_manager, self.settings
+        ).attach(self.auth_service.get_session())
+
     def _on_login_complete(self, result: tuple[bool, Optional[str]]):
         """登入完成回調"""
         success, error = result
         self.login_frame.set_loading(False)
 
         if success:
+            self._logged_in = True
+
             # 儲存憑證 (如果選擇記住我)
             if self._remember_me:
                 self.credential_manager.save_credentials(
                     self._login_username, self._login_password
                 )
+                self._save_session()
             else:
-                # 清除之前儲存的憑證
+                # 清除之前儲存的憑證與 session
                 self.credential_manager.clear_credentials()
+                if self.session_store:
+                    self.session_store.clear()
 
             self._switch_to_main_page()
             self._start_data_fetch()
@@ -506,12 +632,54 @@ class MainWindow(ctk.CTk):
         # 建立資料服務
         self.data_service = DataService(self.auth_service.get_session(), self.settings)
 
-        # 建立個人記錄服務
-        self.personal_record_service = PersonalRecordService(self.settings.SSP_BASE_URL)
+        # 建立個人記錄服務 (與加班補報分頁共用 FW21003Z 查詢結果)
+        self.personal_record_service = PersonalRecordService(
+            self.settings.SSP_BASE_URL,
+            history_service=self.history_service,
+            settings=self.settings,
+        )
 
-        # 抓取資料
+        # 先顯示本機資料,再於背景增量同步
+        self._render_local_data()
         self.fetch_data()
 
+    def _render_local_data(self):
+        """以本機資料立即顯示上次同步的結果"""
+        if not self.local_store or not self._login_username:
+            return
+
+        try:
+            raw_records = self.local_store.load_attendance(self._login_username)
+            personal_records = self.local_store.load_personal_records(
+                self._login_username
+            )
+            synced_at = self.local_store.get_synced_at(self._login_username)
+        except Exception as e:
+            logger.warning(f"讀取本機資料失敗: {e}")
+            return
+
+        if personal_records:
+            self.personal_records = personal_records
+            self.personal_summary = self.personal_record_service.summarize(
+                personal_records
+            )
+            self.personal_record_tab.display_records(
+                personal_records, self.personal_summary
+            )
+
+        if raw_records:
+            report = self.calculator.calculate_overtime(raw_records)
+            self.current_report = report
+            self.stats_container.pack(fill="x", padx=spacing.lg, pady=(0, spacing.md))
+            self._update_statistics_cards(report)
+            self.attendance_tab.display_report(report)
+
+            if synced_at:
+                self.update_time_label.configure(
+                    text=f"最後更新: {synced_at:%Y-%m-%d %H:%M:%S} (同步中...)"
+                )
+            logger.info(f"已顯示本機資料: {len(raw_records)} 筆出勤記錄")
+
     def _show_login_error(self, error: Optional[str]):
         """顯示登入錯誤 (OWASP - 不洩漏過多系統資訊)"""
         import tkinter.messagebox as mb
@@ -520,76 +688,142 @@ class MainWindow(ctk.CTk):
         mb.showerror("登入失敗", error_msg)
 
     def fetch_data(self):
-        """抓取出勤資料"""
+        """抓取出勤資料與個人紀錄 (並行抓取,各自完成即顯示)"""
+        self._startup_history = None
+        self._history_pending = True
+        self._overtime_waiting_status = False
         self._execute_in_background(
-            self._fetch_data_task, callback=self._on_fetch_complete
+            self._fetch_data_task, args=(self.auth_service.get_session(),)
         )
 
-    def _fetch_data_task(
-        self,
-    ) -> tuple[
-        Optional[OvertimeReport],
-        Optional[str],
-        list[PersonalRecord],
-        Optional[PersonalRecordSummary],
-    ]:
+    def _fetch_data_task(self, session) -> dict[str, FetchResult]:
         """
         資料抓取任務 (背景執行)
 
+        出勤異常 (FW99001Z) 與個人紀錄查詢 (FW21003Z) 彼此獨立,
+        同時抓取,每項完成後立即回到主執行緒顯示。
+
+        Args:
+            session: 已登入的 session
+
         Returns:
-            tuple: (報表資料, 錯誤訊息, 個人記錄, 個人記錄摘要)
+            dict: {工作名稱: FetchResult}
         """
-        try:
-            # 抓取出勤異常資料
-            raw_records = self.data_service.get_attendance_data()
+        return self.fetch_orchestrator.run(
+            session,
+            {"attendance": self._attendance_task, "history": self._history_task},
+            on_result=lambda result: self.dispatcher.post(self._on_fetch_result, result),
+        )
 
-            if not raw_records:
-                return (None, "沒有找到出勤記錄", [], None)
+    def _attendance_task(self, session) -> Optional[OvertimeReport]:
+        """
+        抓取出勤異常資料並計算加班時數 (背景執行)
 
-            report = self.calculator.calculate_overtime(raw_records)
+        每頁到達時先逐頁計算並顯示,全部完成後返回完整報表。
+        """
+        progressive_report = OvertimeReport(records=[])
+
+        def on_page(page_num: int, records: list[dict]):
+            page_records = self.calculator.extend_report(progressive_report, records)
+            self.dispatcher.post(self.attendance_tab.append_records, page_records)
 
-            # 同時抓取個人記錄
-            personal_records, personal_summary = [], None
-            try:
-                if self.personal_record_service and self.auth_service:
-                    session = self.auth_service.get_session()
-                    personal_records, personal_summary = (
-                        self.personal_record_service.fetch_personal_records(session)
-                    )
-                    logger.info(f"成功載入個人記錄: {len(personal_records)} 筆")
-            except Exception as e:
-                logger.warning(f"個人記錄載入失敗 (不影響主功能): {e}")
+        raw_records = self._sync_attendance(
+            DataService(session, self.settings), on_page=on_page
+        )
+        if not raw_records:
+            return None
+        return self.calculator.calculate_overtime(raw_records)
+
+    def _history_task(self, session) -> OvertimeHistory:
+        """查詢個人紀錄 (強制更新,同時提供已申請狀態與個人記錄;背景執行)"""
+        history = self.history_service.fetch(session, force=True)
+        logger.info(f"成功載入個人記錄: {len(history.personal_records)} 筆")
+        self._store_personal_records(history.personal_records)
+        return history
+
+    def _sync_attendance(
+        self, data_service: DataService, on_page: Optional[PageCallback] = None
+    ) -> list[dict]:
+        """
+        同步出勤異常資料 (背景執行)
 
-            return (report, None, personal_records, personal_summary)
+        有本機資料時只抓取最後同步日期之後的分頁並合併,
+        返回合併後的完整記錄。
 
+        Args:
+            data_service: 抓取用的資料服務
+            on_page: 每頁解析完成時呼叫 (逐頁顯示用)
+
+        Returns:
+            list[dict]: 出勤記錄列表
+        """
+        user = self._login_username
+        if not self.local_store or not user:
+            return data_service.get_attendance_data(on_page=on_page)
+
+        try:
+            since = self.local_store.attendance_sync_since(user)
+            records = data_service.get_attendance_data(since=since, on_page=on_page)
+
+            # 抓取失敗時 (無任何記錄) 保留本機資料,不覆寫
+            if records:
+                self.local_store.merge_attendance(user, records, since)
+            return self.local_store.load_attendance(user)
         except Exception as e:
-            logger.error(f"抓取資料錯誤: {e}", exc_info=True)
-            return (None, str(e), [], None)
+            logger.warning(f"本機資料同步失敗,改為完整抓取: {e}")
+            return data_service.get_attendance_data(on_page=on_page)
 
-    def _on_fetch_complete(
-        self,
-        result: tuple[
-            Optional[OvertimeReport],
-            Optional[str],
-            list[PersonalRecord],
-            Optional[PersonalRecordSummary],
-        ],
-    ):
-        """資料抓取完成回調"""
-        report, error, personal_records, personal_summary = result
+    def _store_personal_records(self, personal_records: list[PersonalRecord]):
+        """將個人記錄寫入本機資料 (背景執行)"""
+        if not self.local_store or not self._login_username:
+            return
 
-        # 儲存個人記錄
-        self.personal_records = personal_records
-        self.personal_summary = personal_summary
+        try:
+            self.local_store.replace_personal_records(
+                self._login_username, personal_records
+            )
+        except Exception as e:
+            logger.warning(f"個人記錄寫入本機失敗: {e}")
+
+    def _on_fetch_result(self, result: FetchResult):
+        """單項抓取完成回調 (主執行緒,依完成順序呼叫)"""
+        if result.name == "attendance":
+            report = result.value
+            if report and report.records:
+                self._handle_successful_fetch(report)
+            else:
+                self._handle_failed_fetch(
+                    str(result.error) if result.error else "沒有找到出勤記錄"
+                )
+        elif result.name == "history":
+            self._handle_history_loaded(result.value if result.success else None)
+
+    def _handle_history_loaded(self, history: Optional[OvertimeHistory]):
+        """處理個人紀錄查詢結果 (個人記錄分頁、統計卡片、已申請狀態)"""
+        self._history_pending = False
+        self._startup_history = history
+        waiting = self._overtime_waiting_status
+        self._overtime_waiting_status = False
+
+        if history is None:
+            logger.warning("個人記錄載入失敗 (不影響主功能)")
+            # 加班補報分頁仍在等待狀態,改由分頁自行查詢
+            if waiting:
+                self.overtime_tab.on_refresh()
+            return
 
-        # 顯示個人記錄
-        if personal_records and personal_summary:
-            self.personal_record_tab.display_records(personal_records, personal_summary)
+        self.personal_records = list(history.personal_records)
+        self.personal_summary = history.summary
+        if self.personal_records:
+            self.personal_record_tab.display_records(
+                self.personal_records, self.personal_summary
+            )
 
-        if report and report.records:
-            self._handle_successful_fetch(report)
-        else:
-            self._handle_failed_fetch(error)
+        if self.current_report:
+            self._update_statistics_cards(self.current_report)
+
+        if waiting:
+            self.overtime_tab.apply_submitted_records(dict(history.submitted_records))
 
     def _handle_successful_fetch(self, report: OvertimeReport):
         """處理成功的資料抓取 (載入資料到分頁)"""
@@ -602,11 +836,20 @@ class MainWindow(ctk.CTk):
         # 載入資料到異常清單分頁
         self.attendance_tab.display_report(report)
 
-        # 載入資料到加班補報分頁
+        # 載入資料到加班補報分頁 (已申請狀態沿用個人紀錄查詢結果,不重複查詢)
         submission_records = report.to_submission_records()
         if self.auth_service and hasattr(self.auth_service, "get_session"):
             session = self.auth_service.get_session()
-            self.overtime_tab.load_data(submission_records, session)
+            history = self._startup_history
+            self._overtime_waiting_status = self._history_pending
+            self.overtime_tab.load_data(
+                submission_records,
+                session,
+                submitted_records=(
+                    dict(history.submitted_records) if history else None
+                ),
+                fetch_status=not self._history_pending,
+            )
 
         # 更新時間戳記
         self._update_timestamp()
@@ -679,18 +922,23 @@ class MainWindow(ctk.CTk):
             return
 
         self._execute_in_background(
-            self._export_task, callback=self._on_export_complete
+            self._export_task,
+            args=(self.attendance_tab.export_format,),
+            callback=self._on_export_complete,
         )
 
-    def _export_task(self) -> tuple[Optional[str], Optional[str]]:
+    def _export_task(self, fmt: str = "xlsx") -> tuple[Optional[str], Optional[str]]:
         """
         匯出任務 (背景執行)
 
+        Args:
+            fmt: 匯出格式 (xlsx / csv / jsonl / parquet)
+
         Returns:
             tuple: (檔案名稱, 錯誤訊息)
         """
         try:
-            filename = self.export_service.export_to_excel(self.current_report)
+            filename = self.export_service.export_report(self.current_report, fmt)
             return (filename, None)
         except Exception as e:
             logger.error(f"匯出錯誤: {e}", exc_info=True)
@@ -721,9 +969,12 @@ class MainWindow(ctk.CTk):
             mb.showerror("錯誤", "請先登入")
             return
 
+        token = self.refresh_flights.supersede("personal_records")
         self._execute_in_background(
             self._fetch_personal_records_task,
-            callback=self._on_personal_records_complete,
+            callback=lambda result: (
+                None if token.cancelled else self._on_personal_records_complete(result)
+            ),
         )
 
     def _fetch_personal_records_task(
@@ -738,8 +989,11 @@ class MainWindow(ctk.CTk):
         try:
             session = self.auth_service.get_session()
             personal_records, personal_summary = (
-                self.personal_record_service.fetch_personal_records(session)
+                self.personal_record_service.fetch_personal_records(
+                    session, force=True
+                )
             )
+            self._store_personal_records(personal_records)
             return (personal_records, personal_summary, None)
         except Exception as e:
             logger.error(f"個人記錄載入錯誤: {e}", exc_info=True)
@@ -776,6 +1030,16 @@ class MainWindow(ctk.CTk):
         - 清除所有敏感資料
         - 重置 UI 狀態
         """
+        # 登出後不再沿用 session
+        self._logged_in = False
+        if self.session_store:
+            self.session_store.clear()
+        if self.auth_service:
+            session = self.auth_service.get_session()
+            guard = getattr(session, "session_guard", None)
+            if guard:
+                guard.detach(session)
+
         # 清除服務和資料
         self._clear_sensitive_data()
 
@@ -790,10 +1054,33 @@ class MainWindow(ctk.CTk):
         使用者下次登入時仍可使用記住我功能
         """
 
+        # 清除共用的個人紀錄快取
+        self.history_service.invalidate()
+
         # 清空個人記錄分頁
         if hasattr(self, "personal_record_tab"):
             self.personal_record_tab.clear_table()
 
+    def _save_session(self):
+        """保存目前的登入 session (僅限記住我)"""
+        if (
+            self.session_store
+            and self._logged_in
+            and self._remember_me
+            and self.auth_service
+            and self._login_username
+        ):
+            self.session_store.save(
+                self._login_username, self.auth_service.get_session()
+            )
+
+    def _on_close(self):
+        """關閉視窗 (保存最新的 cookie 供下次啟動沿用)"""
+        self._save_session()
+        self.dispatcher.stop()
+        self.background.stop()
+        self.destroy()
+
     def _switch_to_login_page(self):
         """切換到登入頁面 (分頁模式)"""
         # 隱藏主頁面
@@ -844,16 +1131,11 @@ class MainWindow(ctk.CTk):
         """
         在背景執行任務 (DRY - 統一的背景任務執行模式)
 
+        任務在共用事件迴圈的執行緒池執行,結果經由 UiDispatcher 回到主執行緒。
+
         Args:
             task: 要執行的任務函式
             args: 任務參數
             callback: 完成後的回調函式
         """
-
-        def thread_func():
-            result = task(*args)
-            if callback:
-                self.after(0, callback, result)
-
-        thread = threading.Thread(target=thread_func, daemon=True)
-        thread.start()
+        self.dispatcher.run_blocking(task, *args, callback=callback)